@@ -53,8 +53,8 @@ def play_game(game) -> None:
             display.print_first_player(name=name)
         
         # Store the board state before any move to correctly handle screen updates, messaging to user and command line dispaly glitches.
-        board_state_before_move = game.board.get_board(mutable=True)
-        display.print_board_with_spacing(game_board=board_state_before_move.get_board())
+        board_state_before_move = game.board.view() # Read-only snapshot that stays unchanged after the move is made
+        display.print_board_with_spacing(game_board=board_state_before_move)
         # Handles human player validation 
         if player.is_human:
             display.print_player_turn_prompt(name=name, game_name='Connect4')
@@ -76,7 +76,7 @@ def play_game(game) -> None:
         
         # Reprint the pre-move board and prompt to avoid screen glitches caused by the input prompt and ensure smooth user experience
         if player.is_human:
-            display.print_board_with_spacing(game_board=board_state_before_move.get_board())
+            display.print_board_with_spacing(game_board=board_state_before_move)
             display.print_player_turn_prompt(name=name, game_name='Connect4', delay_rate=0)
         
         # Display validation of last successful move to user before board animation
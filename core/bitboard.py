@@ -0,0 +1,234 @@
+"""
+bitboard.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains a bitboard storage backend for the Board class. Each marker is kept as a single integer bitmask
+where bit (row * columns + column) is set when the marker occupies that square. Occupancy tests, full board checks and
+k-in-a-row detection are bit operations instead of nested list indexing.
+"""
+from core.board import Board, LineChecker, get_winning_lines, marker_code
+
+from typing import Union, Optional
+
+
+class BitBoard(Board):
+    """Drop-in replacement for Board that stores one integer bitmask per marker. The public API of Board is unchanged."""
+    __slots__ = ("_masks", "_occupied", "_full_mask", "_start_masks")
+
+    def __init__(self, rows: int, columns: int):
+        self._masks: dict[Union[int, str], int] = {}
+        self._occupied: int = 0
+        self._full_mask: int = (1 << (rows * columns)) - 1
+        self._start_masks: dict[int, tuple[int, int, int, int]] = {} # Cache of valid line start squares per line length
+        super().__init__(rows, columns)
+
+    def _initialize_board(self) -> None:
+        """Clears every marker mask. The bytearray used by Board is not needed by this backend."""
+        self._masks = {}
+        self._occupied = 0
+        return None
+
+    def _bit(self, row: int, column: int) -> int:
+        return 1 << (row * self._columns + column)
+
+    @property
+    def occupied_mask(self) -> int:
+        """Bitmask of every occupied square."""
+        return self._occupied
+
+    def marker_mask(self, marker: Union[int, str]) -> int:
+        """Bitmask of the squares occupied by the given marker."""
+        return self._masks.get(marker, 0)
+
+    def is_full(self) -> bool:
+        """Checks if every square on the board is occupied."""
+        return self._occupied == self._full_mask
+
+    def square_is_occupied(self, row: int, column: int) -> Union[bool, None]:
+        if self.is_on_board(row, column):
+            return bool(self._occupied & self._bit(row, column))
+        return None
+
+    def get_square_value(self, row: int, column: int) -> Union[int, str, None]:
+        if self.is_on_board(row, column):
+            return self._value_at(row, column)
+        return None
+
+    def _value_at(self, row: int, column: int) -> Union[int, str]:
+        # Negative indices wrap around the same way as the nested list backend
+        bit = self._bit(row % self._rows, column % self._columns)
+        if not self._occupied & bit:
+            return 0
+        for marker, mask in self._masks.items():
+            if mask & bit:
+                return marker
+        return 0
+
+    def add_to_square(self, row: int, column: int, value: Union[int, str]) -> Union[bool, None]:
+        if self.is_on_board(row, column):
+            bit = self._bit(row, column)
+            if not self._occupied & bit:
+                self._set_bit(bit, value)
+                self._square_changed(row, column, 0, value)
+                return True
+            return False
+        return None
+
+    def update_square(self, row: int, column: int, value: Union[int, str]) -> Union[bool, None]:
+        """Updates a square regardless of occupancy. Returns True if successful, None for an invalid index."""
+        if self.is_on_board(row, column):
+            bit = self._bit(row, column)
+            old_value = self._value_at(row, column)
+            if self._occupied & bit:
+                self._clear_bit(bit)
+            if value != 0:
+                self._set_bit(bit, value)
+            self._square_changed(row, column, old_value, value)
+            return True
+        return None
+
+    def _set_bit(self, bit: int, value: Union[int, str]) -> None:
+        self._masks[value] = self._masks.get(value, 0) | bit
+        self._occupied |= bit
+
+    def _clear_bit(self, bit: int) -> None:
+        for marker, mask in self._masks.items():
+            if mask & bit:
+                self._masks[marker] = mask & ~bit
+        self._occupied &= ~bit
+
+    def codes(self) -> bytes:
+        return bytes(marker_code(value) for value in self.view().cells)
+
+    def _row_values(self, row: int) -> list[Union[int, str]]:
+        """Extracts one row by shifting each marker mask down to the row's bits."""
+        shift = row * self._columns
+        row_mask = (1 << self._columns) - 1
+        values = [0] * self._columns
+        for marker, mask in self._masks.items():
+            bits = (mask >> shift) & row_mask
+            while bits:
+                low = bits & -bits
+                values[low.bit_length() - 1] = marker
+                bits ^= low
+        return values
+
+    def _snapshot_rows(self) -> tuple[tuple[Union[int, str], ...], ...]:
+        return tuple(tuple(self._row_values(row)) for row in range(self._rows))
+
+    def _get_start_masks(self, length: int) -> tuple[int, int, int, int]:
+        """
+        Returns bitmasks of the squares where a line of the given length can start without wrapping around an edge.
+
+        Returns:
+            tuple[int, int, int, int]: Start masks for rows, columns, right diagonals and left diagonals.
+        """
+        if length not in self._start_masks:
+            winning_lines = get_winning_lines(self._rows, self._columns, length)
+            self._start_masks[length] = tuple(
+                sum(1 << winning_lines.lines[line_id][0] for line_id in winning_lines.type_ranges[win_type])
+                for win_type in ("row", "column", "right_diagonal", "left_diagonal")
+            )
+        return self._start_masks[length]
+
+    def line_starts(self, marker: Union[int, str], length: int, direction: str) -> int:
+        """
+        Finds every line of the given length fully occupied by the marker using shift-and-mask operations.
+
+        Args:
+            marker (Union[int, str]): Marker to search for.
+            length (int): Number of squares in a line.
+            direction (str): 'row', 'column', 'right_diagonal' or 'left_diagonal'.
+
+        Returns:
+            int: Bitmask where each set bit is the first square of a complete line. Left diagonals start at their top square.
+        """
+        shifts = {
+            "row": 1,
+            "column": self._columns,
+            "right_diagonal": self._columns + 1,
+            "left_diagonal": self._columns - 1
+        }
+        if direction not in shifts:
+            raise ValueError("Direction must be 'row', 'column', 'right_diagonal' or 'left_diagonal'.")
+        if length > max(self._rows, self._columns) or length <= 0:
+            return 0
+
+        mask = self._masks.get(marker, 0)
+        shift = shifts[direction]
+        lines = mask
+        for n in range(1, length):
+            lines &= mask >> (shift * n)
+        row_starts, column_starts, right_starts, left_starts = self._get_start_masks(length)
+        start_mask = {
+            "row": row_starts,
+            "column": column_starts,
+            "right_diagonal": right_starts,
+            "left_diagonal": left_starts
+        }[direction]
+        return lines & start_mask
+
+    def first_line(self, length: int, direction: str) -> Optional[tuple]:
+        """
+        Finds the complete line of the given length and direction that starts closest to the top-left of the board.
+
+        Returns:
+            tuple or None: (marker, win_type, row, column) where row and column are the start of the line, or None.
+        """
+        found = None
+        for marker in self._masks:
+            starts = self.line_starts(marker, length, direction)
+            if starts:
+                index = (starts & -starts).bit_length() - 1 # Lowest set bit is the first line start in row-major order
+                if found is None or index < found[1]:
+                    found = (marker, index)
+        if found is None:
+            return None
+        marker, index = found
+        row, column = divmod(index, self._columns)
+        return marker, direction, row, column
+
+    def find_line(self, length: int) -> Optional[tuple]:
+        """Searches rows, columns, then right and left diagonals for a complete line of the given length. Returns the
+        first (marker, win_type, row, column) found or None."""
+        for direction in ("row", "column", "right_diagonal", "left_diagonal"):
+            if found := self.first_line(length, direction):
+                return found
+        return None
+
+    def __deepcopy__(self, memo):
+        """Creates an independent BitBoard with copies of all marker masks."""
+        if id(self) in memo:
+            return memo[id(self)]
+        new_board = BitBoard(self._rows, self._columns)
+        memo[id(self)] = new_board
+        new_board._masks = dict(self._masks) # Integers are immutable so a shallow dictionary copy is enough
+        new_board._occupied = self._occupied
+        new_board._hash = self._hash
+        new_board._moves = list(self._moves)
+        return new_board
+
+    def __str__(self) -> str:
+        """Returns a string representation of the board as a grid matrix."""
+        return "\n".join(" ".join(str(cell) for cell in row) for row in self.iter_rows())
+
+    def __repr__(self) -> str:
+        """Returns a detailed string with board dimensions and grid content."""
+        return f"BitBoard({self._rows}x{self._columns})\n{self.get_board()}"
+
+
+class BitBoardLineChecker(LineChecker):
+    """LineChecker for BitBoard instances that finds k-in-a-row lines with bit operations instead of scanning lists."""
+
+    def __init__(self, board: BitBoard, win_value: int = 3):
+        super().__init__(board, win_value)
+
+    def _check_full_rows(self, win_value: int) -> Optional[tuple]:
+        return self._board.first_line(win_value, "row")
+
+    def _check_full_columns(self, win_value: int) -> Optional[tuple]:
+        return self._board.first_line(win_value, "column")
+
+    def _check_diagonals(self, win_value: int) -> Optional[tuple]:
+        return self._board.first_line(win_value, "right_diagonal") or self._board.first_line(win_value, "left_diagonal")
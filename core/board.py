@@ -1,6 +1,10 @@
-from typing import Union, Optional
+from typing import Callable, Iterator, Union, Optional, NamedTuple
 from copy import deepcopy
-from collections import Counter
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from random import Random
 
 def int_converter(number, columns):
     return divmod(number, columns)
@@ -11,11 +15,385 @@ def winner_info(winner_dictionary):
 
 from typing import Union
 
+class WinningLines(NamedTuple):
+    """
+    Every winning line of a board shape as flat cell indices, where the index of a square is row * columns + column.
+
+    Attributes:
+        lines: Cell indices of each line, ordered rows, columns, right diagonals then left diagonals. Within each type
+            the order matches the order the full board checks scan in.
+        line_info: (win_type, row, column) of each line where row and column are the start of the line as reported in
+            the win info. Left diagonals start at their top square.
+        cell_lines: Line ids passing through each cell index.
+        type_ranges: Range of line ids for each win type.
+    """
+    lines: tuple[tuple[int, ...], ...]
+    line_info: tuple[tuple[str, int, int], ...]
+    cell_lines: tuple[tuple[int, ...], ...]
+    type_ranges: dict[str, range]
+
+
+@lru_cache(maxsize=None)
+def get_winning_lines(rows: int, columns: int, win_value: int) -> WinningLines:
+    """
+    Computes every winning line for a board shape and win length once and caches the result for the life of the program.
+
+    Args:
+        rows (int): Number of rows on the board.
+        columns (int): Number of columns on the board.
+        win_value (int): Number of squares in a line.
+
+    Returns:
+        WinningLines: The lines, their win info and a reverse map from each cell to the lines that pass through it.
+
+    Raises:
+        ValueError: If win_value is less than 1.
+    """
+    if win_value < 1:
+        raise ValueError("Win value must be at least 1.")
+
+    lines = []
+    line_info = []
+    type_ranges = {}
+
+    def add_lines(win_type, starts, row_step, column_step):
+        first_id = len(lines)
+        for row, column in starts:
+            lines.append(tuple((row + n * row_step) * columns + column + n * column_step for n in range(win_value)))
+            line_info.append((win_type, row, column))
+        type_ranges[win_type] = range(first_id, len(lines))
+
+    row_fits = range(rows - win_value + 1)
+    column_fits = range(columns - win_value + 1)
+    add_lines("row", [(r, c) for r in range(rows) for c in column_fits], 0, 1)
+    add_lines("column", [(r, c) for c in range(columns) for r in row_fits], 1, 0)
+    add_lines("right_diagonal", [(r, c) for r in row_fits for c in column_fits], 1, 1)
+    add_lines("left_diagonal", [(r, columns - 1 - c) for r in row_fits for c in column_fits], 1, -1)
+
+    cell_lines = [[] for _ in range(rows * columns)]
+    for line_id, line in enumerate(lines):
+        for cell in line:
+            cell_lines[cell].append(line_id)
+
+    return WinningLines(tuple(lines), tuple(line_info), tuple(tuple(ids) for ids in cell_lines), type_ranges)
+
+
+# Board symmetries as functions of (row, column, rows, columns) returning the square a piece moves to. Rotations are
+# clockwise, mirror swaps left and right, flip swaps top and bottom. The rotate_90, rotate_270, transpose and
+# anti_transpose transforms only keep the board shape on square boards.
+SYMMETRY_TRANSFORMS = {
+    "identity": lambda r, c, rows, columns: (r, c),
+    "rotate_90": lambda r, c, rows, columns: (c, rows - 1 - r),
+    "rotate_180": lambda r, c, rows, columns: (rows - 1 - r, columns - 1 - c),
+    "rotate_270": lambda r, c, rows, columns: (columns - 1 - c, r),
+    "mirror": lambda r, c, rows, columns: (r, columns - 1 - c),
+    "flip": lambda r, c, rows, columns: (rows - 1 - r, c),
+    "transpose": lambda r, c, rows, columns: (c, r),
+    "anti_transpose": lambda r, c, rows, columns: (columns - 1 - c, rows - 1 - r)
+}
+INVERSE_TRANSFORMS = {name: name for name in SYMMETRY_TRANSFORMS} | {"rotate_90": "rotate_270", "rotate_270": "rotate_90"}
+SHAPE_KEEPING_TRANSFORMS = ("identity", "rotate_180", "mirror", "flip")
+
+
+def default_symmetries(rows: int, columns: int) -> tuple[str, ...]:
+    """Returns the names of every symmetry of a board shape: all 8 on a square board and 4 on a rectangular board."""
+    return tuple(SYMMETRY_TRANSFORMS) if rows == columns else SHAPE_KEEPING_TRANSFORMS
+
+
+def transform_square(row: int, column: int, rows: int, columns: int, transform: str, inverse: bool = False) -> tuple[int, int]:
+    """
+    Maps a square through a board symmetry.
+
+    Args:
+        row (int): Row index of the square.
+        column (int): Column index of the square.
+        rows (int): Number of rows on the board.
+        columns (int): Number of columns on the board.
+        transform (str): Name of the symmetry in SYMMETRY_TRANSFORMS.
+        inverse (bool): If True, maps a square of the transformed board back to the original board.
+
+    Returns:
+        tuple: The row and column of the square after the transform.
+
+    Raises:
+        ValueError: If the transform is unknown or does not keep the shape of a rectangular board.
+    """
+    if transform not in SYMMETRY_TRANSFORMS:
+        raise ValueError(f"Unknown transform '{transform}'. Must be one of {', '.join(SYMMETRY_TRANSFORMS)}.")
+    if transform not in default_symmetries(rows, columns):
+        raise ValueError(f"Transform '{transform}' needs a square board, not a board of size ({rows}x{columns}).")
+    if inverse:
+        transform = INVERSE_TRANSFORMS[transform]
+    return SYMMETRY_TRANSFORMS[transform](row, column, rows, columns)
+
+
+@lru_cache(maxsize=None)
+def get_symmetry_permutation(rows: int, columns: int, transform: str) -> tuple[int, ...]:
+    """
+    Returns the flat cell permutation of a symmetry, where square i of the transformed board is square permutation[i]
+    of the original board. Cached per board shape and transform.
+    """
+    permutation = [0] * (rows * columns)
+    for row in range(rows):
+        for column in range(columns):
+            new_row, new_column = transform_square(row, column, rows, columns, transform)
+            permutation[new_row * columns + new_column] = row * columns + column
+    return tuple(permutation)
+
+
+@lru_cache(maxsize=None)
+def get_line_getters(rows: int, columns: int, win_value: int) -> tuple[Callable, ...]:
+    """
+    Returns one itemgetter per winning line of get_winning_lines() that pulls the squares of the line out of the flat
+    cells of a BoardView as a tuple in a single C level call. Cached per board shape and win length.
+    """
+    lines = get_winning_lines(rows, columns, win_value).lines
+    if win_value == 1: # itemgetter with a single index returns the value instead of a tuple
+        return tuple((lambda cells, index=line[0]: (cells[index],)) for line in lines)
+    return tuple(itemgetter(*line) for line in lines)
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(rows: int, columns: int, marker: Union[int, str]) -> tuple[int, ...]:
+    """
+    Returns the 64-bit Zobrist key of every square for one marker on a board shape.
+
+    Keys come from a random generator seeded with the board shape and marker, so the same position hashes to the same
+    value in every process and every run. Blank squares have no key, so an empty board hashes to 0.
+    """
+    generator = Random(f"zobrist:{rows}x{columns}:{marker!r}")
+    return tuple(generator.getrandbits(64) for _ in range(rows * columns))
+
+
+def load_numpy():
+    """
+    Imports NumPy on first use so the games run without it. NumPy is only needed by the vectorized line checks and by
+    the modules built on them, such as position file arrays, batch simulation and tablebase generation.
+
+    Raises:
+        ImportError: If NumPy is not installed, with the extra to install.
+    """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("Vectorized line checks require NumPy. Install it with: pip install .[fast]") from error
+    return numpy
+
+
+class LineMatch(NamedTuple):
+    """
+    One matching window found by LineChecker.iter_line_matches().
+
+    Attributes:
+        window: Index of the window, which is also the index of its first square in the sequence.
+        other_element: The other element counted in the window. With other_element "any" this is the first non-target
+            element of the window.
+        window_indices: Indices of the target elements within the window.
+        absolute_indices: Indices of the target elements in the full sequence.
+    """
+    window: int
+    other_element: Union[int, str]
+    window_indices: tuple[int, ...]
+    absolute_indices: tuple[int, ...]
+
+
+class LineMatches(NamedTuple):
+    """
+    Result of a vectorized line check as arrays of shape (number of lines, number of windows per line).
+
+    Attributes:
+        matches: True where the window has exactly the target and other counts asked for.
+        target_counts: Number of target squares in each window.
+        other_counts: Number of other squares in each window. With other_element "any" this counts the first
+            non-target code found in the window.
+        other_codes: Marker code counted as the other element of each window, 0 if the window only has targets.
+    """
+    matches: "numpy.ndarray"
+    target_counts: "numpy.ndarray"
+    other_counts: "numpy.ndarray"
+    other_codes: "numpy.ndarray"
+
+
+CHANGE_LOG_SIZE = 256 # Number of recent square changes each board remembers for changes_since()
+
+# Marker registry shared by every board in the process. Code 0 is the blank square and game markers get codes 1..255
+# in the order they are first seen, with the markers of the built in games registered up front.
+_MARKER_CODES: dict[Union[int, str], int] = {0: 0}
+_MARKERS: list[Union[int, str]] = [0]
+
+
+def marker_code(marker: Union[int, str]) -> int:
+    """
+    Returns the one byte code of a marker, registering the marker the first time it is seen.
+
+    Raises:
+        ValueError: If more than 255 different markers are registered.
+    """
+    code = _MARKER_CODES.get(marker)
+    if code is None:
+        if len(_MARKERS) > 255:
+            raise ValueError(f"Cannot register marker {marker!r}. A board supports at most 255 different markers.")
+        code = _MARKER_CODES[marker] = len(_MARKERS)
+        _MARKERS.append(marker)
+    return code
+
+
+def marker_name(code: int) -> Union[int, str]:
+    """Returns the marker registered under a code. Raises IndexError for an unregistered code."""
+    return _MARKERS[code]
+
+
+for _marker in ("x", "o", "r", "y"):
+    marker_code(_marker)
+
+
+def packed_size(rows: int, columns: int) -> int:
+    """Number of bytes used by Board.to_bytes() for a board shape, at 2 bits per square."""
+    return (rows * columns + 3) // 4
+
+
+@lru_cache(maxsize=None)
+def _palette_table(palette: tuple[Union[int, str], ...]) -> bytes:
+    """
+    Translation table from marker codes to 2-bit palette indices, 0 for a blank square and 1..3 for the palette
+    markers. Codes of markers that are not in the palette map to 255.
+    """
+    if len(palette) > 3:
+        raise ValueError("A packed board palette holds at most 3 markers.")
+    if 0 in palette or len(set(palette)) != len(palette):
+        raise ValueError("Palette markers must be unique and not blank.")
+    table = bytearray([255]) * 256
+    table[0] = 0
+    for index, marker in enumerate(palette, start=1):
+        table[marker_code(marker)] = index
+    return bytes(table)
+
+
+# Each byte unpacked into the palette indices of its four squares, lowest bits first
+_UNPACK_TABLE = tuple(bytes((byte >> shift) & 3 for shift in (0, 2, 4, 6)) for byte in range(256))
+
+
+def palette_indices(codes: bytes, palette: tuple[Union[int, str], ...]) -> bytes:
+    """
+    Translates marker codes, such as the output of Board.codes(), into one palette index per square: 0 for a blank
+    square, 1..3 for the palette markers in the order given and 255 for a marker that is not in the palette.
+
+    Raises:
+        ValueError: If the palette holds more than 3 markers, a blank or a repeated marker.
+    """
+    return codes.translate(_palette_table(tuple(palette)))
+
+
+def unpack_indices(data: bytes) -> bytes:
+    """
+    Unpacks the output of Board.to_bytes() into one palette index per square, in row-major order. The result is padded
+    to a multiple of four squares, so slice it to the number of squares of the board.
+    """
+    return b"".join(_UNPACK_TABLE[byte] for byte in data)
+
+
+class BoardView:
+    """
+    Immutable tuple-of-tuples snapshot of a Board stamped with the board version it was taken at.
+
+    Views are cached by the Board and shared between callers until the next change to the board, so iterating rows,
+    columns or diagonals of an unchanged board does not allocate. Use copy() when a mutable nested list is required.
+    """
+    __slots__ = ("_rows", "_version", "_columns", "_cells", "_diagonals")
+
+    def __init__(self, rows: tuple[tuple[Union[int, str], ...], ...], version: int):
+        self._rows = rows
+        self._version = version
+        self._columns = None # Columns, flat cells and diagonals are built lazily the first time they are asked for
+        self._cells = None
+        self._diagonals: dict[tuple[int, str], tuple[tuple[Union[int, str], ...], ...]] = {}
+
+    @property
+    def version(self) -> int:
+        """Board version the view was taken at."""
+        return self._version
+
+    @property
+    def rows(self) -> tuple[tuple[Union[int, str], ...], ...]:
+        return self._rows
+
+    @property
+    def columns(self) -> tuple[tuple[Union[int, str], ...], ...]:
+        if self._columns is None:
+            self._columns = tuple(zip(*self._rows))
+        return self._columns
+
+    @property
+    def cells(self) -> tuple[Union[int, str], ...]:
+        """Flat row-major squares, indexed by row * columns + column as used by get_winning_lines()."""
+        if self._cells is None:
+            self._cells = tuple(chain.from_iterable(self._rows))
+        return self._cells
+
+    def line_values(self, line: tuple[int, ...]) -> tuple[Union[int, str], ...]:
+        """Returns the squares of a line of flat cell indices."""
+        cells = self.cells
+        return tuple(cells[index] for index in line)
+
+    def diagonals(self, length: int, direction: str) -> tuple[tuple[Union[int, str], ...], ...]:
+        """Returns every diagonal of the given length in the same order as Board.get_diagonals()."""
+        key = (length, direction)
+        if key not in self._diagonals:
+            if direction not in {"right", "left"}:
+                raise ValueError("Direction must be either 'right' or 'left'.")
+            number_of_rows = len(self._rows)
+            number_of_columns = len(self._rows[0]) if self._rows else 0
+            if length > min(number_of_rows, number_of_columns):
+                self._diagonals[key] = ()
+            else:
+                winning_lines = get_winning_lines(number_of_rows, number_of_columns, length)
+                line_ids = winning_lines.type_ranges[f"{direction}_diagonal"]
+                self._diagonals[key] = tuple(self.line_values(winning_lines.lines[line_id]) for line_id in line_ids)
+        return self._diagonals[key]
+
+    def copy(self) -> list[list[Union[int, str]]]:
+        """Returns a mutable nested list copy of the snapshot."""
+        return [list(row) for row in self._rows]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        return self._rows[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BoardView):
+            return self._rows == other._rows
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._rows)
+
+    def __repr__(self) -> str:
+        return f"BoardView(version={self._version}, rows={self.copy()})"
+
+
 class Board:
+    # Fixed attribute layout so each instance carries no __dict__. Squares are stored as one byte each in a flat row-major
+    # bytearray of marker codes from the marker registry, so a 6x7 board holds its squares in 42 bytes.
+    __slots__ = ("_rows", "_columns", "_version", "_view", "_hash", "_moves", "_cells", "_counters", "_changes",
+                 "_changes_start", "_observers")
+
     def __init__(self, rows: int, columns: int):
         self._rows = rows
         self._columns = columns
-        self._board: list[list[Union[int, str]]] = self._initialize_board()
+        self._version: int = 0 # Incremented on every change so cached views and other readers can detect stale data
+        self._view: Optional[BoardView] = None
+        self._hash: int = 0 # Zobrist hash of the current position, updated incrementally with every square change
+        self._moves: list[tuple[int, int]] = [] # Move stack used by push() and pop() for constant time undo
+        self._counters: dict[int, LineCounters] = {} # Line counters attached with line_counters(), keyed by win value
+        self._changes: deque[tuple[int, int, int]] = deque(maxlen=CHANGE_LOG_SIZE) # (version, row, column) of recent changes
+        self._changes_start: int = 0 # Version the change log starts from, moved forward by a reset
+        self._observers: list[Callable] = []
+        self._cells: bytearray = self._initialize_board()
     
     @property
     def rows(self) -> int:
@@ -24,30 +402,113 @@ class Board:
     @property
     def columns(self) -> int:
         return self._columns
+
+    @property
+    def version(self) -> int:
+        """Change counter of the board. Increases every time a square is changed or the board is reset."""
+        return self._version
+
+    @property
+    def hash(self) -> int:
+        """64-bit Zobrist hash of the current position. Equal positions on boards of the same size have equal hashes."""
+        return self._hash
+
+    def _zobrist_key(self, row: int, column: int, marker: Union[int, str]) -> int:
+        """Zobrist key of a marker on a square. Storage backends without a per-square key table override this."""
+        return get_zobrist_keys(self._rows, self._columns, marker)[row * self._columns + column]
+
+    def _square_changed(self, row: int, column: int, old_value: Union[int, str], new_value: Union[int, str]) -> None:
+        """
+        Bookkeeping for every square change, called by the storage backends after the square is written. XORs the old
+        square value out of the hash and the new value in, updates any attached line counters, bumps the version,
+        records the square in the change log and notifies observers.
+        """
+        if old_value != 0:
+            self._hash ^= self._zobrist_key(row, column, old_value)
+        if new_value != 0:
+            self._hash ^= self._zobrist_key(row, column, new_value)
+        index = row * self._columns + column
+        for counters in self._counters.values():
+            counters.update(index, old_value, new_value)
+        self._version += 1
+        self._changes.append((self._version, row, column))
+        for observer in self._observers:
+            observer(row, column, new_value)
+
+    def changes_since(self, version: int) -> Optional[set[tuple[int, int]]]:
+        """
+        Returns the squares changed after a version token taken from the version property, so a renderer only redraws
+        those squares.
+
+        Returns:
+            set or None: The (row, column) of every square changed since the version. None if the board was reset
+            since then or the change log no longer reaches back that far, in which case the whole board must be redrawn.
+        """
+        changes = self._changes
+        start = changes[0][0] - 1 if len(changes) == changes.maxlen else self._changes_start
+        if version < start:
+            return None
+        squares = set()
+        for change_version, row, column in reversed(changes):
+            if change_version <= version:
+                break
+            squares.add((row, column))
+        return squares
+
+    def add_observer(self, observer: Callable[[Optional[int], Optional[int], Union[int, str, None]], None]) -> None:
+        """
+        Registers a callback that is called with (row, column, value) after every square change, and with
+        (None, None, None) after the board is reset.
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: Callable) -> None:
+        """Unregisters a callback added with add_observer()."""
+        self._observers.remove(observer)
+
+    def line_counters(self, win_value: int) -> "LineCounters":
+        """
+        Returns the LineCounters of the winning lines of the given length, attaching them to the board the first time
+        they are asked for. Attached counters are kept up to date with every change to the board.
+        """
+        if win_value not in self._counters:
+            self._counters[win_value] = LineCounters(self, win_value)
+        return self._counters[win_value]
     
-    def _initialize_board(self) -> list[list[Union[int, str]]]:
-        return [[0] * self._columns for _ in range(self._rows)]
+    def _initialize_board(self) -> bytearray:
+        return bytearray(self._rows * self._columns)
     
     def reset_board(self) -> None:
-        self._board = self._initialize_board()
+        self._cells = self._initialize_board()
+        self._hash = 0
+        self._moves = []
+        self._version += 1
+        for counters in self._counters.values():
+            counters.reset()
+        self._changes.clear()
+        self._changes_start = self._version
+        for observer in self._observers:
+            observer(None, None, None)
     
     def is_on_board(self, row: int, col: int) -> bool:
         return 0 <= row < self._rows and 0 <= col < self._columns
     
     def square_is_occupied(self, row: int, column: int) -> Union[bool, None]:
         if self.is_on_board(row, column):
-            return self._board[row][column] != 0
+            return self._cells[row * self._columns + column] != 0
         return None
     
     def get_square_value(self, row: int, column: int) -> Union[int, str, None]:
         if self.is_on_board(row, column):
-            return self._board[row][column]
+            return _MARKERS[self._cells[row * self._columns + column]]
         return None
     
     def add_to_square(self, row: int, column: int, value: Union[int, str]) -> Union[bool, None]:
         if self.is_on_board(row, column):
-            if not self.square_is_occupied(row, column):
-                self._board[row][column] = value
+            index = row * self._columns + column
+            if not self._cells[index]:
+                self._cells[index] = marker_code(value)
+                self._square_changed(row, column, 0, value)
                 return True
             return False
         return None
@@ -55,10 +516,142 @@ class Board:
     def update_square(self, row: int, column: int, value: Union[int, str]) -> Union[bool, None]:
         """Updates a square regardless of occupancy. Returns True if successful, False otherwise."""
         if self.is_on_board(row, column):
-            self._board[row][column] = value  # Allows modification even if square is occupied
+            index = row * self._columns + column
+            old_value = _MARKERS[self._cells[index]]
+            self._cells[index] = marker_code(value)  # Allows modification even if square is occupied
+            self._square_changed(row, column, old_value, value)
             return True
         return None  # Invalid index was passed
 
+    def codes(self) -> bytes:
+        """
+        Returns the squares as flat row-major marker codes, one byte per square, where 0 is a blank square.
+
+        Codes are only meaningful within one process. Use marker_name() to turn a code back into its marker.
+        """
+        return bytes(self._cells)
+
+    def push(self, row: int, column: int, value: Union[int, str]) -> Union[bool, None]:
+        """
+        Plays a value on an empty square and records it on the move stack so it can be undone with pop().
+
+        Returns:
+            True if the move was played, False if the square is occupied, or None for an invalid index.
+        """
+        result = self.add_to_square(row, column, value)
+        if result:
+            self._moves.append((row, column))
+        return result
+
+    def pop(self) -> tuple[int, int, Union[int, str]]:
+        """
+        Undoes the most recent pushed move in constant time, clearing the square and restoring the hash. Clearing the
+        square is a change like any other, so the version advances, the square is added to the change log and
+        observers are called.
+
+        Returns:
+            tuple: The row, column and value of the move that was undone.
+
+        Raises:
+            IndexError: If there are no pushed moves to undo.
+        """
+        if not self._moves:
+            raise IndexError("There are no moves to undo.")
+        row, column = self._moves.pop()
+        value = self._value_at(row, column)
+        self.update_square(row, column, 0)
+        return row, column, value
+
+    @property
+    def last_move(self) -> Optional[tuple[int, int]]:
+        """Row and column of the most recent pushed move, or None if the move stack is empty."""
+        return self._moves[-1] if self._moves else None
+
+    @property
+    def move_count(self) -> int:
+        """Number of moves on the move stack."""
+        return len(self._moves)
+
+    def _value_at(self, row: int, column: int) -> Union[int, str]:
+        """Raw square lookup without bounds checking, used internally by the line getters. Storage backends override this."""
+        return _MARKERS[self._cells[(row % self._rows) * self._columns + column % self._columns]]
+
+    def _snapshot_rows(self) -> tuple[tuple[Union[int, str], ...], ...]:
+        """Builds the immutable rows used by a BoardView. Storage backends override this."""
+        cells = tuple(_MARKERS[code] for code in self._cells)
+        return tuple(cells[start:start + self._columns] for start in range(0, len(cells), self._columns))
+
+    def view(self) -> BoardView:
+        """
+        Returns a read-only snapshot of the current board state.
+
+        The view is cached until the board changes, so repeated calls between moves return the same object without
+        copying the grid. A view taken before a change stays valid as a snapshot of the older state.
+        """
+        if self._view is None or self._view.version != self._version:
+            self._view = BoardView(self._snapshot_rows(), self._version)
+        return self._view
+
+    def iter_rows(self) -> tuple[tuple[Union[int, str], ...], ...]:
+        """Read-only rows of the current board state without copying."""
+        return self.view().rows
+
+    def iter_columns(self) -> tuple[tuple[Union[int, str], ...], ...]:
+        """Read-only columns of the current board state without copying."""
+        return self.view().columns
+
+    def iter_diagonals(self, length: int, direction: str) -> tuple[tuple[Union[int, str], ...], ...]:
+        """Read-only diagonals of the current board state in the same order as get_diagonals()."""
+        return self.view().diagonals(length, direction)
+
+    def canonical(self, transforms: Optional[tuple[str, ...]] = None) -> tuple[BoardView, str]:
+        """
+        Returns the canonical form of the position, so positions that are symmetries of each other share one entry in
+        a cache, opening book or tablebase.
+
+        The canonical form is the transformed position with the smallest marker codes in row-major order. Ties go to
+        the first transform listed, so a position that is already canonical always reports "identity". Codes of the
+        built in markers are registered up front, so canonical forms of game positions are the same in every process.
+
+        Args:
+            transforms (tuple): Names of the symmetries the game allows. Defaults to every symmetry of the board
+                shape. Connect 4 only allows ("identity", "mirror") since gravity rules out flips and rotations.
+
+        Returns:
+            tuple: A read-only BoardView of the canonical position and the name of the transform that produced it. Use
+            map_move() to move squares between the board and its canonical form.
+        """
+        transforms = transforms or default_symmetries(self._rows, self._columns)
+        codes = self.codes()
+        best_codes, best_transform = None, None
+        for transform in transforms:
+            transformed = bytes(map(codes.__getitem__, get_symmetry_permutation(self._rows, self._columns, transform)))
+            if best_codes is None or transformed < best_codes:
+                best_codes, best_transform = transformed, transform
+        cells = tuple(map(marker_name, best_codes))
+        rows = tuple(cells[start:start + self._columns] for start in range(0, len(cells), self._columns))
+        return BoardView(rows, self._version), best_transform
+
+    def map_move(self, row: int, column: int, transform: str, to_canonical: bool = True) -> tuple[int, int]:
+        """
+        Maps a move between this board and the canonical form returned by canonical().
+
+        Args:
+            row (int): Row index of the move.
+            column (int): Column index of the move.
+            transform (str): Transform returned by canonical().
+            to_canonical (bool): If True, maps a move on this board onto the canonical form. If False, maps a move
+                found on the canonical form, such as a cached best move, back onto this board.
+
+        Returns:
+            tuple: The row and column of the move on the other board.
+        """
+        return transform_square(row, column, self._rows, self._columns, transform, inverse=not to_canonical)
+
+    def copy(self) -> "Board":
+        """Returns an independent copy of the Board. Use only when a true mutable snapshot is needed."""
+        return deepcopy(self)
+
     # @property
     # def board(self) -> list[list[Union[int, str]]]:
     #     return [row[:] for row in self._board]  # Returns a copy
@@ -97,20 +690,20 @@ class Board:
 #                 return True
 #         return False  # Invalid index was passe
     
-    def get_board(self, mutable: bool = False) -> Union[list[list[Union[int, str]]], "Board"]:
+    def get_board(self, mutable: bool = False) -> Union[BoardView, "Board"]:
         """
         Returns current state of the board.
 
         Args:
             mutable (bool): 
-                - If False (default), returns a deep copy of the board (list of lists), safe for viewing only.
-                - If True, returns a full deep copy of the Board object, useful for flash states or undo features.
+                - If False (default), returns a cached read-only BoardView of the board, safe for viewing only.
+                - If True, returns a full copy of the Board object, useful for flash states or undo features.
 
         Returns:
-            Union[list[list[Union[int, str]]], Board]: 
-                A safe copy of the board data or the whole Board instance.
+            Union[BoardView, Board]: 
+                A read-only snapshot of the board data or an independent Board instance.
         """
-        return deepcopy(self) if mutable else deepcopy(self._board)
+        return self.copy() if mutable else self.view()
 
     # def get_board(self, mutable: bool = False) -> Union[list[list[Union[int, str]]], "Board"]:
     #     """
@@ -123,11 +716,12 @@ class Board:
 
 
     def get_rows(self) -> list[list[Union[int, str]]]:
-        return self.get_board()
+        """Returns the rows as new lists. Use iter_rows() to read rows without allocating."""
+        return [list(row) for row in self.iter_rows()]
 
     def get_columns(self) -> list[list[Union[int, str]]]:
-        board_copy = self.get_board()
-        return [list(col) for col in zip(*board_copy)]
+        """Returns the columns as new lists. Use iter_columns() to read columns without allocating."""
+        return [list(col) for col in self.iter_columns()]
     
     def get_diagonals(self, length: int, direction: str) -> list[list[Union[int, str]]]:
         """
@@ -146,22 +740,7 @@ class Board:
         if direction not in {"right", "left"}:
             raise ValueError("Direction must be either 'right' or 'left'.")
 
-        diagonals = []
-        # board_copy = self.get_board()  # Use copied board for safety
-
-        for i in range(self._rows - length + 1):
-            for j in range(self._columns - length + 1):
-                diagonal = [
-                    self.get_square_value(i + n, j + n if direction == "right" else (self._columns - 1) - (j + n) )
-                    for n in range(length)
-                ]
-                # if direction == "right":
-                #     diagonal = [self.get_square_value(i + n, j + n) for n in range(length)]
-                # else:  # direction == "left"
-                #     diagonal = [self.get_square_value(i + n, (self._columns - 1) - (j + n)) for n in range(length)]
-                diagonals.append(diagonal)
-
-        return diagonals
+        return [list(diagonal) for diagonal in self.iter_diagonals(length, direction)]
 
 
     # def get_rows(self) -> list[list[int]]:
@@ -177,11 +756,11 @@ class Board:
         if direction == "right":
             if column + length > self._columns:
                 return []
-            return [self._board[row + n][column + n] for n in range(length)]
+            return [self._value_at(row + n, column + n) for n in range(length)]
         elif direction == "left":
             if column < self._columns - (length + 2): # compensate since going backwards.
                 return []
-            return [self._board[row + n][column - n] for n in range(length)]
+            return [self._value_at(row + n, column - n) for n in range(length)]
 
     
     def get_diagonal_line_up(self, row, column, length, direction):
@@ -190,12 +769,12 @@ class Board:
         if direction == "right":
             if (column + length > self._columns) or (column < 0):  # Ensure we don't go out of bounds right
                 return []
-            return [self._board[row - n][column + n] for n in range(length)]
+            return [self._value_at(row - n, column + n) for n in range(length)]
         elif direction == "left":
             if (column < length - 1) or (column >= self._columns):  # Ensure we don't go out of bounds left
                 return []
             # print(row, column )
-            return [self._board[row - n][column - n] for n in range(length)]
+            return [self._value_at(row - n, column - n) for n in range(length)]
 
     
     # def get_diagonals(self, length: int, direction: str) -> list[list[int]]:
@@ -358,58 +937,255 @@ class Board:
     
     def __deepcopy__(self, memo):
         """
-        Creates a deep copy of the Board instancen for viewing purposes.
+        Creates a deep copy of the Board instance, ensuring no shared mutable data with the original.
 
         Args:
             memo (dict): Dictionary used to track already copied objects to prevent redundant copies 
                         and handle circular references.
 
         Returns:
-            Board: A new Board instance with duplicated internal state that does not share mutable data 
-                with the original.
+            Board: A new Board instance with duplicated internal state, independent of the original.
         """
         if id(self) in memo:
-            return memo[id(self)]  # Return existing copy
+            return memo[id(self)]  # Return existing copy if it's already copied
 
+        # Create a new board instance (same size as the original)
         new_board = Board(self._rows, self._columns)
-        memo[id(self)] = new_board  # Store in memo
- 
-        new_board.board = deepcopy(self._board, memo) # Deep copy the board data that is immutable so as not to affect game play
+        memo[id(self)] = new_board  # Store the new object in memo to avoid circular references
+
+        # Copy the internal board state to the new board
+        new_board._cells = bytearray(self._cells)
+        new_board._hash = self._hash
+        new_board._moves = list(self._moves)
+
         return new_board
-    
-    def __deepcopy__(self, memo):
+
+    def to_bytes(self, palette: tuple[Union[int, str], ...]) -> bytes:
         """
-        Creates a deep copy of the Board instance, ensuring no shared mutable data with the original.
+        Packs the board at 2 bits per square, four squares per byte in row-major order with the first square in the
+        lowest bits. Blank squares are 0 and the palette markers are 1, 2 and 3 in the order given.
 
         Args:
-            memo (dict): Dictionary used to track already copied objects to prevent redundant copies 
-                        and handle circular references.
+            palette (tuple): Up to 3 markers that may appear on the board, such as ("x", "o") or ("r", "y"). The same
+                palette is needed to unpack the bytes.
 
         Returns:
-            Board: A new Board instance with duplicated internal state, independent of the original.
-        """
-        if id(self) in memo:
-            return memo[id(self)]  # Return existing copy if it's already copied
+            bytes: packed_size(rows, columns) bytes.
 
-        # Create a new board instance (same size as the original)
-        new_board = Board(self._rows, self._columns)
-        memo[id(self)] = new_board  # Store the new object in memo to avoid circular references
+        Raises:
+            ValueError: If the palette is invalid or the board holds a marker that is not in the palette.
+        """
+        indices = palette_indices(self.codes(), palette)
+        if 255 in indices:
+            raise ValueError(f"Board holds a marker that is not in the palette {tuple(palette)}.")
+        indices += bytes(-len(indices) % 4)
+        return bytes(indices[i] | indices[i + 1] << 2 | indices[i + 2] << 4 | indices[i + 3] << 6
+                     for i in range(0, len(indices), 4))
+
+    @classmethod
+    def from_bytes(cls, data: bytes, rows: int, columns: int, palette: tuple[Union[int, str], ...]) -> "Board":
+        """
+        Creates a board from the output of to_bytes(). The move stack of the new board is empty.
 
-        # Deep copy the internal board state to the new board
-        new_board._board = deepcopy(self._board, memo)  # Ensure we copy the board's data correctly
+        Raises:
+            ValueError: If the data does not match the board size or uses a palette index with no marker.
+        """
+        if len(data) != packed_size(rows, columns):
+            raise ValueError(f"Expected {packed_size(rows, columns)} bytes for a board of size ({rows}x{columns}), "
+                             f"got {len(data)}.")
+        _palette_table(tuple(palette)) # Validates the palette
+        markers = (0, *palette)
+        board = cls(rows, columns)
+        indices = unpack_indices(data)
+        for index in range(rows * columns):
+            if palette_index := indices[index]:
+                if palette_index >= len(markers):
+                    raise ValueError(f"Palette index {palette_index} has no marker in the palette {tuple(palette)}.")
+                board.add_to_square(*divmod(index, columns), markers[palette_index])
+        return board
+
+    def __getstate__(self) -> dict:
+        """
+        Pickles the board as its marker codes plus the marker each code stands for, so boards can be sent to worker
+        processes whose marker registry assigned different codes.
+        """
+        return {
+            "rows": self._rows,
+            "columns": self._columns,
+            "codes": self.codes(),
+            "markers": tuple(_MARKERS),
+            "moves": tuple(self._moves)
+        }
 
-        return new_board
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["rows"], state["columns"])
+        markers = state["markers"]
+        for index, code in enumerate(state["codes"]):
+            if code:
+                self.update_square(*divmod(index, self._columns), markers[code])
+        self._moves = list(state["moves"])
 
-   
     def __str__(self) -> str:
         """Returns a string representation of the board as a grid matrix."""
-        return "\n".join([" ".join(str(cell) for cell in row) for row in self._board]) # basic string matrix representation of the board
+        return "\n".join([" ".join(str(cell) for cell in row) for row in self.iter_rows()]) # basic string matrix representation of the board
     
     def __repr__(self) -> str:
         """Returns a detailed string with board dimensions and grid content."""
         return f"Board({self._rows}x{self._columns})\n{self.get_board()}"
 
+class LineCounters:
+    """
+    Per-marker counts of every winning line of a board, updated in place with each square change so threat questions
+    are answered from an index instead of by rescanning the board.
+
+    Lines holding a single marker and blanks are kept in buckets keyed by (marker, count), with empty lines under
+    (0, 0), so lines_with("o", 2) on a TicTacToe board returns every line with two 'o' markers and one blank without
+    looking at the other lines. Lines with more than one marker are in no bucket since no one can win them.
+    Attach counters with Board.line_counters() rather than creating them directly so the board keeps them updated.
+    """
+    __slots__ = ("_board", "win_value", "winning_lines", "_counts", "_occupied", "_buckets")
+
+    def __init__(self, board: Board, win_value: int):
+        self._board = board
+        self.win_value = win_value
+        self.winning_lines = get_winning_lines(board.rows, board.columns, win_value)
+        self.reset()
+        for index, value in enumerate(board.view().cells):
+            if value != 0:
+                self.update(index, 0, value)
+
+    def reset(self) -> None:
+        """Clears every count back to an empty board."""
+        number_of_lines = len(self.winning_lines.lines)
+        self._counts: dict[Union[int, str], list[int]] = {} # Per-marker count of every line
+        self._occupied: list[int] = [0] * number_of_lines
+        self._buckets: dict[tuple[Union[int, str], int], set[int]] = {(0, 0): set(range(number_of_lines))}
+
+    def _bucket_key(self, line_id: int) -> Optional[tuple[Union[int, str], int]]:
+        occupied = self._occupied[line_id]
+        if occupied == 0:
+            return 0, 0
+        for marker, counts in self._counts.items():
+            if counts[line_id]:
+                return (marker, occupied) if counts[line_id] == occupied else None
+        return None
+
+    def update(self, index: int, old_value: Union[int, str], new_value: Union[int, str]) -> None:
+        """Moves the lines through a cell index to their new buckets after the cell changed from old_value to new_value."""
+        if old_value == new_value:
+            return
+        for line_id in self.winning_lines.cell_lines[index]:
+            if (key := self._bucket_key(line_id)) is not None:
+                self._buckets[key].discard(line_id)
+            if old_value != 0:
+                self._counts[old_value][line_id] -= 1
+                self._occupied[line_id] -= 1
+            if new_value != 0:
+                if new_value not in self._counts:
+                    self._counts[new_value] = [0] * len(self.winning_lines.lines)
+                self._counts[new_value][line_id] += 1
+                self._occupied[line_id] += 1
+            if (key := self._bucket_key(line_id)) is not None:
+                self._buckets.setdefault(key, set()).add(line_id)
+
+    def count(self, line_id: int, marker: Union[int, str]) -> int:
+        """Number of squares of a line holding the marker, or the number of blanks for marker 0."""
+        if marker == 0:
+            return self.win_value - self._occupied[line_id]
+        return self._counts[marker][line_id] if marker in self._counts else 0
+
+    def lines_with(self, marker: Union[int, str], count: int) -> list[int]:
+        """Ids of the lines with exactly count of the marker and blanks in every other square, in line id order."""
+        key = (0, 0) if count == 0 else (marker, count)
+        return sorted(self._buckets.get(key, ()))
+
+    def number_of_lines(self, marker: Union[int, str], count: int) -> int:
+        """Number of lines lines_with() would return, without sorting their ids. Used by search evaluations."""
+        return len(self._buckets.get((0, 0) if count == 0 else (marker, count), ()))
+
+    def blank_cells(self, line_id: int) -> list[int]:
+        """Flat cell indices of the blank squares of a line, in line order."""
+        columns = self._board.columns
+        return [index for index in self.winning_lines.lines[line_id]
+                if not self._board.square_is_occupied(*divmod(index, columns))]
+
+    def completing_cells(self, marker: Union[int, str]) -> list[int]:
+        """Flat cell indices that complete a line for the marker, in line id order without repeats."""
+        return list(dict.fromkeys(cell for line_id in self.lines_with(marker, self.win_value - 1)
+                                  for cell in self.blank_cells(line_id)))
+
+    def fork_cells(self, marker: Union[int, str], count: Optional[int] = None) -> list[int]:
+        """
+        Flat cell indices that are a blank square of two or more lines holding count of the marker, so playing there
+        threatens two lines at once. Count defaults to one less than a threat, win_value - 2.
+        """
+        count = self.win_value - 2 if count is None else count
+        seen = Counter(cell for line_id in self.lines_with(marker, count) for cell in self.blank_cells(line_id))
+        return [cell for cell, lines in seen.items() if lines >= 2]
+
+
+def batch_win_info(boards, win_value: int) -> list[dict]:
+    """
+    Finds the winner of many boards of the same size at once with NumPy gathers and reductions instead of building a
+    LineChecker for each board.
+
+    Every winning line of every board is gathered into one (boards, lines, win_value) array, a line is complete where
+    all of its squares equal its first non-blank square, and the first complete line of each board is taken in the
+    order of get_winning_lines(): rows, columns, right diagonals then left diagonals. This is the order the game win
+    checkers scan in, so the result matches their get_win_info().
+
+    Args:
+        boards: N x rows x columns array of boards. Either a NumPy integer array of marker codes, nested sequences
+            of markers, or a sequence of Board instances.
+        win_value (int): Number of squares in a row needed to win.
+
+    Returns:
+        list[dict]: One win info dictionary per board with the winning marker, win type, and start row and column of
+        the line, or all None values if the board has no winner.
+
+    Raises:
+        ValueError: If the boards array is not three dimensional or win_value is less than 1.
+        ImportError: If NumPy is not installed.
+    """
+    np = load_numpy()
+    if isinstance(boards, (list, tuple)) and boards and isinstance(boards[0], Board):
+        codes = np.stack([np.frombuffer(board.codes(), dtype=np.uint8).reshape(board.rows, board.columns)
+                          for board in boards])
+    elif isinstance(boards, np.ndarray) and boards.dtype.kind in "iu":
+        codes = boards
+    else:
+        codes = np.frompyfunc(marker_code, 1, 1)(np.asarray(boards, dtype=object)).astype(np.uint8)
+    if codes.ndim != 3:
+        raise ValueError("Boards must be an array of shape (boards, rows, columns).")
+
+    number_of_boards, rows, columns = codes.shape
+    no_winner = {"marker": None, "type": None, "row": None, "column": None}
+    winning_lines = get_winning_lines(rows, columns, win_value)
+    if not winning_lines.lines or number_of_boards == 0:
+        return [dict(no_winner) for _ in range(number_of_boards)]
+
+    line_squares = codes.reshape(number_of_boards, rows * columns)[:, np.asarray(winning_lines.lines, dtype=np.intp)]
+    first_squares = line_squares[:, :, 0]
+    complete = (first_squares != 0) & (line_squares == first_squares[:, :, None]).all(axis=2) # (boards, lines)
+    has_winner = complete.any(axis=1)
+    first_line = complete.argmax(axis=1) # argmax returns the first complete line of each board
+
+    results = []
+    for board_index in range(number_of_boards):
+        if not has_winner[board_index]:
+            results.append(dict(no_winner))
+            continue
+        line_id = int(first_line[board_index])
+        win_type, row, column = winning_lines.line_info[line_id]
+        marker = marker_name(int(first_squares[board_index, line_id]))
+        results.append({"marker": marker, "type": win_type, "row": row, "column": column})
+    return results
+
+
 class LineChecker:
+    # Win type and (row, column) step of the four line directions through a square, in the order full board checks use
+    MOVE_DIRECTIONS = (("row", 0, 1), ("column", 1, 0), ("right_diagonal", 1, 1), ("left_diagonal", 1, -1))
+
     def __init__(self, board: Board, win_value: int=3):
         self._board = board
         self.win_checker = self._check_for_winner # win_checker attribute used to help encapsulate the methods used for win checking
@@ -466,29 +1242,59 @@ class LineChecker:
                 - If `all_occurrences=False`: `"first_index"` and `"absolute_index"` are included.
         """
 
+        matches = {}  # Dictionary where keys are `other_element_master`
+        for match in LineChecker.iter_line_matches(sequence, target_element, target_count, other_element, other_count, window_size):
+            match_data = {
+                "window": match.window,
+                "window_indices": list(match.window_indices),
+                "absolute_indices": list(match.absolute_indices)
+            }
+
+            if not all_occurrences:
+                match_data["first_index"] = match.window_indices[0]
+                match_data["absolute_index"] = match.absolute_indices[0]
+
+            # Store in dictionary under `other_element_master` as key for quick look up based on the marker
+            if match.other_element not in matches:
+                matches[match.other_element] = []
+            matches[match.other_element].append(match_data)
+
+        return matches
+
+    @staticmethod
+    def iter_line_matches(sequence, target_element, target_count, other_element, other_count, window_size) -> Iterator[LineMatch]:
+        """
+        Lazy version of line_check() that yields each matching window as a LineMatch tuple instead of building the
+        result dictionaries, so a caller that only needs the first match can stop after it with next().
+
+        Takes the same arguments as line_check(). The inputs are validated when it is called, before the first match.
+
+        Returns:
+            Iterator of LineMatch tuples in window order.
+
+        Raises:
+            ValueError: If the window does not fit the sequence or the counts do not add up to the window size.
+        """
         # Validate inputs
         if window_size > len(sequence):
             raise ValueError("Window size cannot exceed the length of the sequence.")
         if target_count + other_count != window_size:
             raise ValueError("The sum of target_count and other_count must equal the window size.")
+        return LineChecker._scan_windows(sequence, target_element, target_count, other_element, other_count, window_size)
 
-        matches = {}  # Dictionary where keys are `other_element_master`
-        window_index = 0
-
+    @staticmethod
+    def _scan_windows(sequence, target_element, target_count, other_element, other_count, window_size) -> Iterator[LineMatch]:
         # Sliding window approach
         for i in range(len(sequence) - window_size + 1):
-            window = sequence[i: i + window_size]
-
-            target_indices = []
             target_window_indices = []
             other_element_master = other_element
             other_element_count = 0
             other_element_found = False
 
             # Scan the window
-            for j, item in enumerate(window):
+            for j in range(window_size):
+                item = sequence[i + j]
                 if item == target_element:
-                    target_indices.append(i + j)  # Store absolute index of target element
                     target_window_indices.append(j)
                 elif other_element == "any":
                     if not other_element_found:
@@ -501,28 +1307,79 @@ class LineChecker:
                 else:
                     break  # Invalid window, stop processing
 
-            # If window is valid, add it to results
-            if len(target_indices) == target_count and other_element_count == other_count:
-                match_data = {
-                    "window": window_index,
-                    "window_indices": target_window_indices,
-                    "absolute_indices": target_indices
-                }
+            if len(target_window_indices) == target_count and other_element_count == other_count:
+                window_indices = tuple(target_window_indices)
+                yield LineMatch(i, other_element_master, window_indices, tuple(i + j for j in window_indices))
+
+   
+    @staticmethod
+    def line_check_array(lines, target_element, target_count, other_element, other_count, window_size) -> LineMatches:
+        """
+        Vectorized line_check() that scans every fixed-size window of many lines at once using NumPy.
+
+        Args:
+            lines: 2-D array of equal length lines. Either a NumPy integer array of marker codes, such as the one returned
+                by board_lines_array(), or nested sequences of markers that are converted with the marker registry.
+            target_element (int or str): Marker that must appear target_count times in each window.
+            target_count (int): Number of times target_element must appear in each valid window.
+            other_element (int, str or "any"): Marker that fills the rest of the window. With "any", the first
+                non-target marker in each window is used, as in line_check().
+            other_count (int): Number of times the other element must appear in each valid window.
+            window_size (int): The fixed size of each window.
 
-                if not all_occurrences:
-                    match_data["first_index"] = target_window_indices[0]
-                    match_data["absolute_index"] = target_indices[0]
+        Returns:
+            LineMatches: Match mask and counts for every window of every line. The window with index w of a line
+            covers squares w to w + window_size - 1 of that line.
 
-                # Store in dictionary under `other_element_master` as key for quick look up based on the marker
-                if other_element_master not in matches:
-                    matches[other_element_master] = []
-                matches[other_element_master].append(match_data)
+        Raises:
+            ValueError: If the window does not fit the lines or the counts do not add up to the window size.
+            ImportError: If NumPy is not installed.
+        """
+        np = load_numpy()
+        if isinstance(lines, np.ndarray) and lines.dtype.kind in "iu":
+            codes = lines
+        else:
+            codes = np.asarray([[marker_code(value) for value in line] for line in lines], dtype=np.uint8)
+        codes = np.atleast_2d(codes)
 
-            window_index += 1
+        if window_size > codes.shape[1]:
+            raise ValueError("Window size cannot exceed the length of the sequence.")
+        if target_count + other_count != window_size:
+            raise ValueError("The sum of target_count and other_count must equal the window size.")
 
-        return matches
+        windows = np.lib.stride_tricks.sliding_window_view(codes, window_size, axis=1) # (lines, windows, window_size)
+        target = marker_code(target_element)
+        is_target = windows == target
+        target_counts = is_target.sum(axis=2)
+
+        if other_element == "any":
+            # The first non-target square of each window is the reference, argmax finds the first True of each window
+            first_other = np.argmax(~is_target, axis=2)
+            other_codes = np.take_along_axis(windows, first_other[..., None], axis=2)[..., 0]
+            other_codes = np.where(target_counts == window_size, 0, other_codes)
+        else:
+            other_codes = np.full(target_counts.shape, marker_code(other_element), dtype=windows.dtype)
+        other_counts = ((windows == other_codes[..., None]) & ~is_target).sum(axis=2)
+
+        matches = (target_counts == target_count) & (other_counts == other_count)
+        return LineMatches(matches, target_counts, other_counts, other_codes)
+
+    @staticmethod
+    def board_lines_array(board: Board, length: int):
+        """
+        Gathers the marker codes of every line of the given length on a board into one 2-D array in a single NumPy
+        indexing operation. Lines are in the order of get_winning_lines().
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        np = load_numpy()
+        lines = get_winning_lines(board.rows, board.columns, length).lines
+        cells = np.frombuffer(board.codes(), dtype=np.uint8)
+        if not lines:
+            return np.zeros((0, length), dtype=np.uint8)
+        return cells[np.asarray(lines, dtype=np.intp)]
 
-   
     @staticmethod
     def two_blanks(sequence, marker, size):
         return LineChecker.line_check(sequence, 0, 2, marker, size, size + 2, True)
@@ -544,34 +1401,114 @@ class LineChecker:
             return None
     
     def _check_full_rows(self, win_value: int) -> Optional[tuple]:
-        for r, row in enumerate(self._board.get_rows()):
+        for r, row in enumerate(self._board.iter_rows()):
             if winner := LineChecker.check_all_same(row):
                 c = row.index(winner)
                 return winner, "row", r, c
     
     def _check_full_columns(self, win_value: int) -> Optional[tuple]:
-        for c, column in enumerate(self._board.get_columns()):
+        for c, column in enumerate(self._board.iter_columns()):
             if winner := LineChecker.check_all_same(column):
                 r = column.index(winner)
                 return winner, "column", r, c
     
+    def _check_winning_lines(self, win_value: int, *win_types: str) -> Optional[tuple]:
+        """Checks the precomputed winning lines of the given win types in order. Returns the winning marker, win type,
+        and start row and column of the first complete line found, or None."""
+        winning_lines = get_winning_lines(self._board.rows, self._board.columns, win_value)
+        getters = get_line_getters(self._board.rows, self._board.columns, win_value)
+        cells = self._board.view().cells
+        for win_type in win_types:
+            for line_id in winning_lines.type_ranges[win_type]:
+                values = getters[line_id](cells)
+                if values[0] != 0 and values.count(values[0]) == win_value:
+                    return (values[0], *winning_lines.line_info[line_id])
+        return None
+
+    def find_all_wins(self) -> list[dict]:
+        """
+        Finds every complete line on the board in a single pass over the precomputed winning lines, including
+        simultaneous wins by both markers and overlapping lines of one marker. Does not change the win info.
+
+        Lines longer than the win value are reported once for each window of win_value squares, the same as the lines
+        from get_winning_lines(), so an overline of five in Connect 4 gives two lines.
+
+        Returns:
+            list[dict]: One dictionary per complete line in the order full board checks scan in (rows, columns, right
+            diagonals then left diagonals), with the marker, type, row and column keys of get_win_info() plus "cells",
+            the (row, column) of every square in the line for highlighting.
+        """
+        self._validate_win_value()
+        rows, columns = self._board.rows, self._board.columns
+        winning_lines = get_winning_lines(rows, columns, self.win_value)
+        cells = self._board.view().cells
+        win_value = self.win_value
+        wins = []
+        for line_id, getter in enumerate(get_line_getters(rows, columns, win_value)):
+            values = getter(cells)
+            if values[0] != 0 and values.count(values[0]) == win_value:
+                win_type, row, column = winning_lines.line_info[line_id]
+                wins.append({
+                    "marker": values[0],
+                    "type": win_type,
+                    "row": row,
+                    "column": column,
+                    "cells": [divmod(index, columns) for index in winning_lines.lines[line_id]]
+                })
+        return wins
+
+    def get_winning_cells(self) -> set[tuple[int, int]]:
+        """Returns the (row, column) of every square in any complete line on the board, for highlighting a win."""
+        return {cell for win in self.find_all_wins() for cell in win["cells"]}
+
     def _check_diagonals(self, win_value: int) -> Optional[tuple]:
-        for l, line in enumerate(self._board.get_diagonals(win_value, "right")):
-            if winner := LineChecker.check_all_same(line):
-                r, c = int_converter(l, self._board.columns - win_value + 1)
-                return winner, "right_diagonal", r, c
-        for l, line in enumerate(self._board.get_diagonals(win_value, "left")):
-            if winner := LineChecker.check_all_same(line):
-                r, c = int_converter(l, self._board.columns - win_value + 1)
-                c = self._board.columns - 1 - c
-                return winner, "left_diagonal", r, c
+        return self._check_winning_lines(win_value, "right_diagonal", "left_diagonal")
     
     def _check_for_winner(self) -> Optional[tuple]:
-        if self.win_value > max(self._board.rows, self._board.columns):
-            raise ValueError(f"Invalid win condition: {self.win_value} is too large for a board of size "
-                         f"({self._board.rows}x{self._board.columns}). It must fit within given board dimensions. ")
+        self._validate_win_value()
         for check_func in (self._check_full_rows, self._check_full_columns, self._check_diagonals):
             if winner_found := check_func(self.win_value):
                 self._update_win_info(*winner_found)
                 return True
-        return False
\ No newline at end of file
+        return False
+
+    def _validate_win_value(self) -> None:
+        if self.win_value > max(self._board.rows, self._board.columns):
+            raise ValueError(f"Invalid win condition: {self.win_value} is too large for a board of size "
+                         f"({self._board.rows}x{self._board.columns}). It must fit within given board dimensions. ")
+
+    def check_from_move(self, row: int, column: int) -> Optional[dict]:
+        """
+        Checks for a win using only the lines that pass through the most recently played square.
+
+        Only the row, column and two diagonals through (row, column) are walked, so the cost depends on the win value
+        instead of the board size. It assumes there was no winner before the move, which is the case during game play.
+
+        Args:
+            row (int): Row index of the last move.
+            column (int): Column index of the last move.
+
+        Returns:
+            dict or None: The win info dictionary from get_win_info() if the move completed a line, otherwise None.
+            The row and column in the win info are the start of the line, the same as a full board check.
+        """
+        self._validate_win_value()
+        board = self._board
+        marker = board.get_square_value(row, column)
+        if not marker: # Empty or off the board
+            return None
+
+        for win_type, row_step, column_step in LineChecker.MOVE_DIRECTIONS:
+            # Walk backwards to the start of the run, then count forwards from the start
+            start_row, start_column = row, column
+            while board.get_square_value(start_row - row_step, start_column - column_step) == marker:
+                start_row -= row_step
+                start_column -= column_step
+            count = 1
+            while board.get_square_value(start_row + count * row_step, start_column + count * column_step) == marker:
+                count += 1
+            if count >= self.win_value:
+                self._update_win_info(marker, win_type, start_row, start_column)
+                return self.get_win_info()
+        return None
+
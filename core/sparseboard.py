@@ -0,0 +1,224 @@
+"""
+sparseboard.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains a sparse storage backend for the Board class for large k-in-a-row boards such as 100x100 Gomoku.
+Only occupied squares are stored, in a dictionary keyed by (row, column), together with the bounding box of the
+stones and a count of the stones next to each empty square. Memory, square changes and line searches scale with the
+number of stones on the board rather than the area of the grid.
+"""
+from core.board import Board, LineChecker, marker_code
+
+from hashlib import blake2b
+from typing import Union, Optional
+
+# (row, column) offsets of the eight squares around a square
+NEIGHBOUR_OFFSETS = tuple((row, column) for row in (-1, 0, 1) for column in (-1, 0, 1) if (row, column) != (0, 0))
+
+# Win type, (row, column) step of a line and the sort key of a line start in the order full board checks scan in
+LINE_DIRECTIONS = (
+    ("row", 0, 1, lambda row, column: (row, column)),
+    ("column", 1, 0, lambda row, column: (column, row)),
+    ("right_diagonal", 1, 1, lambda row, column: (row, column)),
+    ("left_diagonal", 1, -1, lambda row, column: (row, -column))
+)
+
+
+class SparseBoard(Board):
+    """
+    Drop-in replacement for Board that only stores occupied squares. The public API of Board is unchanged, but the
+    getters that return whole rows, columns, diagonals or views build the full grid, so on very large boards use the
+    stone based methods instead: stones(), bounding_box(), candidate_moves() and find_line().
+    """
+    __slots__ = ("_squares", "_neighbours", "_bounds")
+
+    def __init__(self, rows: int, columns: int):
+        self._squares: dict[tuple[int, int], Union[int, str]] = {}
+        self._neighbours: dict[tuple[int, int], int] = {} # Number of stones around each square next to a stone
+        self._bounds: Optional[tuple[int, int, int, int]] = None # Cached bounding box, cleared when a stone is removed
+        super().__init__(rows, columns)
+
+    def _initialize_board(self) -> None:
+        """Clears every stone. The bytearray used by Board is not needed by this backend."""
+        self._squares = {}
+        self._neighbours = {}
+        self._bounds = None
+        return None
+
+    def _zobrist_key(self, row: int, column: int, marker: Union[int, str]) -> int:
+        # Keys are derived from the square and marker so no key table the size of the grid is needed
+        digest = blake2b(f"zobrist:{row},{column}:{marker!r}".encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    def is_full(self) -> bool:
+        """Checks if every square on the board is occupied."""
+        return len(self._squares) == self._rows * self._columns
+
+    def square_is_occupied(self, row: int, column: int) -> Union[bool, None]:
+        if self.is_on_board(row, column):
+            return (row, column) in self._squares
+        return None
+
+    def get_square_value(self, row: int, column: int) -> Union[int, str, None]:
+        if self.is_on_board(row, column):
+            return self._squares.get((row, column), 0)
+        return None
+
+    def _value_at(self, row: int, column: int) -> Union[int, str]:
+        # Negative indices wrap around the same way as the other backends
+        return self._squares.get((row % self._rows, column % self._columns), 0)
+
+    def add_to_square(self, row: int, column: int, value: Union[int, str]) -> Union[bool, None]:
+        if self.is_on_board(row, column):
+            if (row, column) not in self._squares:
+                self._place(row, column, value)
+                self._square_changed(row, column, 0, value)
+                return True
+            return False
+        return None
+
+    def update_square(self, row: int, column: int, value: Union[int, str]) -> Union[bool, None]:
+        """Updates a square regardless of occupancy. Returns True if successful, None for an invalid index."""
+        if self.is_on_board(row, column):
+            old_value = self._squares.get((row, column), 0)
+            if old_value != 0:
+                self._remove(row, column)
+            if value != 0:
+                self._place(row, column, value)
+            self._square_changed(row, column, old_value, value)
+            return True
+        return None
+
+    def _place(self, row: int, column: int, value: Union[int, str]) -> None:
+        self._squares[(row, column)] = value
+        for row_offset, column_offset in NEIGHBOUR_OFFSETS:
+            square = (row + row_offset, column + column_offset)
+            self._neighbours[square] = self._neighbours.get(square, 0) + 1
+        if self._bounds is not None:
+            min_row, min_column, max_row, max_column = self._bounds
+            self._bounds = (min(min_row, row), min(min_column, column), max(max_row, row), max(max_column, column))
+        elif len(self._squares) == 1:
+            self._bounds = (row, column, row, column)
+
+    def _remove(self, row: int, column: int) -> None:
+        del self._squares[(row, column)]
+        for row_offset, column_offset in NEIGHBOUR_OFFSETS:
+            square = (row + row_offset, column + column_offset)
+            if self._neighbours[square] == 1:
+                del self._neighbours[square]
+            else:
+                self._neighbours[square] -= 1
+        self._bounds = None # Rebuilt from the stones the next time it is asked for
+
+    def stones(self) -> dict[tuple[int, int], Union[int, str]]:
+        """Read-only mapping of (row, column) to marker for every occupied square. Do not modify it."""
+        return self._squares
+
+    def bounding_box(self) -> Optional[tuple[int, int, int, int]]:
+        """Returns (min_row, min_column, max_row, max_column) of the stones on the board, or None if it is empty."""
+        if self._bounds is None and self._squares:
+            rows = [row for row, _ in self._squares]
+            columns = [column for _, column in self._squares]
+            self._bounds = (min(rows), min(columns), max(rows), max(columns))
+        return self._bounds
+
+    def candidate_moves(self) -> list[tuple[int, int]]:
+        """
+        Returns the empty squares on the board next to at least one stone, in row-major order. These are the moves
+        worth searching in k-in-a-row games, since a move far from every stone can neither build nor block a line.
+        """
+        return sorted(square for square in self._neighbours
+                      if square not in self._squares and self.is_on_board(*square))
+
+    def codes(self) -> bytes:
+        cells = bytearray(self._rows * self._columns)
+        for (row, column), value in self._squares.items():
+            cells[row * self._columns + column] = marker_code(value)
+        return bytes(cells)
+
+    def _snapshot_rows(self) -> tuple[tuple[Union[int, str], ...], ...]:
+        rows = [[0] * self._columns for _ in range(self._rows)]
+        for (row, column), value in self._squares.items():
+            rows[row][column] = value
+        return tuple(tuple(row) for row in rows)
+
+    def first_line(self, length: int, win_type: str) -> Optional[tuple]:
+        """
+        Finds the first line of the given length and win type in the order full board checks scan in, walking only the
+        runs of stones. Returns (marker, win_type, row, column) of the start of the line or None.
+        """
+        for direction, row_step, column_step, sort_key in LINE_DIRECTIONS:
+            if direction == win_type:
+                break
+        else:
+            raise ValueError(f"Unknown win type '{win_type}'.")
+
+        best = None
+        squares = self._squares
+        for (row, column), marker in squares.items():
+            if squares.get((row - row_step, column - column_step)) == marker:
+                continue # Not the first stone of its run
+            count = 1
+            while count < length and squares.get((row + count * row_step, column + count * column_step)) == marker:
+                count += 1
+            if count >= length and (best is None or sort_key(row, column) < sort_key(best[2], best[3])):
+                best = (marker, win_type, row, column)
+        return best
+
+    def find_line(self, length: int) -> Optional[tuple]:
+        """Searches rows, columns, then right and left diagonals for a complete line of the given length. Returns the
+        first (marker, win_type, row, column) found or None."""
+        for win_type, _, _, _ in LINE_DIRECTIONS:
+            if found := self.first_line(length, win_type):
+                return found
+        return None
+
+    def __deepcopy__(self, memo):
+        """Creates an independent SparseBoard with copies of the stone and neighbour dictionaries."""
+        if id(self) in memo:
+            return memo[id(self)]
+        new_board = SparseBoard(self._rows, self._columns)
+        memo[id(self)] = new_board
+        new_board._squares = dict(self._squares)
+        new_board._neighbours = dict(self._neighbours)
+        new_board._bounds = self._bounds
+        new_board._hash = self._hash
+        new_board._moves = list(self._moves)
+        return new_board
+
+    def __getstate__(self) -> dict:
+        """Pickles the stones only, so the size does not depend on the grid area."""
+        return {
+            "rows": self._rows,
+            "columns": self._columns,
+            "squares": tuple((row, column, value) for (row, column), value in self._squares.items()),
+            "moves": tuple(self._moves)
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["rows"], state["columns"])
+        for row, column, value in state["squares"]:
+            self.add_to_square(row, column, value)
+        self._moves = list(state["moves"])
+
+    def __repr__(self) -> str:
+        """Returns the board dimensions and number of stones without building the grid."""
+        return f"SparseBoard({self._rows}x{self._columns}, stones={len(self._squares)})"
+
+
+class SparseLineChecker(LineChecker):
+    """LineChecker for SparseBoard instances that finds k-in-a-row lines by walking the runs of stones instead of
+    scanning every square. Incremental checks with check_from_move() work on any board, including sparse ones."""
+
+    def __init__(self, board: SparseBoard, win_value: int = 3):
+        super().__init__(board, win_value)
+
+    def _check_full_rows(self, win_value: int) -> Optional[tuple]:
+        return self._board.first_line(win_value, "row")
+
+    def _check_full_columns(self, win_value: int) -> Optional[tuple]:
+        return self._board.first_line(win_value, "column")
+
+    def _check_diagonals(self, win_value: int) -> Optional[tuple]:
+        return self._board.first_line(win_value, "right_diagonal") or self._board.first_line(win_value, "left_diagonal")
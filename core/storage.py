@@ -0,0 +1,195 @@
+"""
+storage.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains a compact file format for storing large numbers of board positions, such as self-play games or
+solver results. Each position is packed with Board.to_bytes() into a fixed size record, optionally followed by a fixed
+size payload of the caller's own bytes. Fixed records let the reader memory map the file and jump to any position by
+index without parsing the positions before it.
+"""
+from core.board import Board, load_numpy, marker_code, packed_size
+
+import json
+import mmap
+import os
+import struct
+from typing import Iterator, Optional
+
+MAGIC = b"SGPB"
+FORMAT_VERSION = 1
+# Magic, format version, rows, columns, payload size and length of the JSON palette that follows the header
+_HEADER = struct.Struct("<4sBHHHH")
+
+
+def _encode_header(rows: int, columns: int, palette: tuple, payload_size: int) -> bytes:
+    palette_json = json.dumps(list(palette)).encode("utf-8")
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, rows, columns, payload_size, len(palette_json)) + palette_json
+
+
+def _decode_header(data: bytes) -> tuple[int, int, tuple, int, int]:
+    """Returns the rows, columns, palette, payload size and total header size of a position file."""
+    if len(data) < _HEADER.size:
+        raise ValueError("File is too short to be a position file.")
+    magic, version, rows, columns, payload_size, palette_length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("File is not a position file.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported position file version {version}.")
+    palette_end = _HEADER.size + palette_length
+    palette = tuple(json.loads(bytes(data[_HEADER.size:palette_end]).decode("utf-8")))
+    return rows, columns, palette, payload_size, palette_end
+
+
+class PositionWriter:
+    """
+    Streams packed positions to a file. Use as a context manager so the file is flushed and closed.
+
+    Args:
+        path (str): File to write.
+        rows (int): Number of rows of every board in the file.
+        columns (int): Number of columns of every board in the file.
+        palette (tuple): Up to 3 markers used by the boards, passed to Board.to_bytes().
+        payload_size (int): Number of extra bytes stored after each board, for example a game result or best move.
+        append (bool): If True, adds records to an existing file, which must have the same shape, palette and payload
+            size. A new file is created if none exists.
+    """
+
+    def __init__(self, path: str, rows: int, columns: int, palette: tuple, payload_size: int = 0, append: bool = False):
+        self.rows = rows
+        self.columns = columns
+        self.palette = tuple(palette)
+        self.payload_size = payload_size
+        self.record_size = packed_size(rows, columns) + payload_size
+        header = _encode_header(rows, columns, self.palette, payload_size)
+
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as file:
+                existing = file.read(len(header))
+            if existing != header:
+                raise ValueError("Cannot append to a position file with a different board shape, palette or payload size.")
+            self._file = open(path, "ab")
+            self.count = (os.path.getsize(path) - len(header)) // self.record_size
+        else:
+            self._file = open(path, "wb")
+            self._file.write(header)
+            self.count = 0
+
+    def write(self, board: Board, payload: bytes = b"") -> int:
+        """
+        Appends one board and its payload. Returns the index of the record.
+
+        Raises:
+            ValueError: If the board has the wrong shape or the payload has the wrong size.
+        """
+        if board.rows != self.rows or board.columns != self.columns:
+            raise ValueError(f"Board of size ({board.rows}x{board.columns}) does not match the file size "
+                             f"({self.rows}x{self.columns}).")
+        return self.write_packed(board.to_bytes(self.palette), payload)
+
+    def write_packed(self, packed_board: bytes, payload: bytes = b"") -> int:
+        """Appends a board already packed with Board.to_bytes() using the file palette. Returns the index of the record."""
+        if len(packed_board) + len(payload) != self.record_size:
+            raise ValueError(f"Record must be {self.record_size} bytes with a payload of {self.payload_size} bytes.")
+        self._file.write(packed_board)
+        self._file.write(payload)
+        self.count += 1
+        return self.count - 1
+
+    def write_many(self, boards, payloads=None) -> None:
+        """Appends every board in an iterable, with an optional iterable of payloads of the same length."""
+        if payloads is None:
+            for board in boards:
+                self.write(board)
+        else:
+            for board, payload in zip(boards, payloads, strict=True):
+                self.write(board, payload)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "PositionWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class PositionReader:
+    """
+    Memory maps a position file for random access to its records. Use as a context manager so the file is closed.
+
+    Args:
+        path (str): File written by PositionWriter.
+        board_class (type): Board storage backend used for decoded boards.
+    """
+
+    def __init__(self, path: str, board_class: type = Board):
+        self.board_class = board_class
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # mmap cannot map an empty file
+            self._file.close()
+            raise ValueError("File is too short to be a position file.")
+        self.rows, self.columns, self.palette, self.payload_size, self._offset = _decode_header(self._map)
+        self.board_size = packed_size(self.rows, self.columns)
+        self.record_size = self.board_size + self.payload_size
+
+    def __len__(self) -> int:
+        return (len(self._map) - self._offset) // self.record_size
+
+    def _start(self, index: int) -> int:
+        """Byte offset of a record, allowing negative indices the same as a list."""
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f"Record index out of range for a file of {count} records.")
+        return self._offset + index * self.record_size
+
+    def record(self, index: int) -> bytes:
+        """Returns the packed board bytes of a record without decoding them."""
+        start = self._start(index)
+        return self._map[start:start + self.board_size]
+
+    def payload(self, index: int) -> bytes:
+        """Returns the payload bytes of a record."""
+        start = self._start(index) + self.board_size
+        return self._map[start:start + self.payload_size]
+
+    def __getitem__(self, index: int) -> Board:
+        return self.board_class.from_bytes(self.record(index), self.rows, self.columns, self.palette)
+
+    def __iter__(self) -> Iterator[Board]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def as_array(self, start: int = 0, stop: Optional[int] = None):
+        """
+        Unpacks a range of records into a (records, rows, columns) NumPy array of marker codes in one vectorized pass,
+        ready for batch_win_info() or other array analysis.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        np = load_numpy()
+        start, stop, _ = slice(start, stop).indices(len(self))
+        count = max(stop - start, 0)
+        records = np.frombuffer(self._map, dtype=np.uint8, count=count * self.record_size,
+                                offset=self._offset + start * self.record_size).reshape(count, self.record_size)
+        packed = records[:, :self.board_size]
+        indices = (packed[:, :, None] >> np.array([0, 2, 4, 6], dtype=np.uint8)) & 3
+        indices = indices.reshape(count, -1)[:, :self.rows * self.columns]
+        codes = np.array([0, *(marker_code(marker) for marker in self.palette)], dtype=np.uint8)
+        return codes[indices].reshape(count, self.rows, self.columns)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "PositionReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,165 @@
+"""
+batch_simulate.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains a NumPy engine that plays many simple TicTacToe games in lockstep. Every game of a batch is a row
+of one array: each ply samples a move for every unfinished game at once and checks only the lines through the squares
+just played. Millions of games take seconds, which makes it practical to measure outcome distributions and baselines
+for the rule-based AI difficulties.
+
+Two move policies are available:
+    random: a uniformly random empty square. Easy mode picks its squares this way with rejection sampling.
+    win_block: completes its own line if it can, otherwise blocks the opponent's line, otherwise plays randomly. This
+        is the first rule of intermediate mode, without its fork and two-blank rules.
+
+Usage:
+    python -m games.batch_simulate --games 1000000 --policies random:win_block
+"""
+from core.board import get_winning_lines, load_numpy
+
+import argparse
+from time import perf_counter
+from typing import NamedTuple, Optional
+
+POLICIES = ("random", "win_block")
+
+
+class BatchResult(NamedTuple):
+    x_wins: int
+    o_wins: int
+    draws: int
+    length_counts: tuple[int, ...] # Number of games that ended after each number of plies
+    seconds: float
+
+    @property
+    def games(self) -> int:
+        return self.x_wins + self.o_wins + self.draws
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else float("inf")
+
+
+def simulate_batch(games: int, policies: tuple[str, str] = ("random", "random"), size: int = 3,
+                   win_value: Optional[int] = None, x_first: bool = True, seed: Optional[int] = 0,
+                   batch_size: int = 250_000) -> BatchResult:
+    """
+    Plays games between two move policies with NumPy arrays, batch_size games at a time.
+
+    Args:
+        games (int): Number of games to play.
+        policies (tuple): Policies of the 'x' player and the 'o' player, each 'random' or 'win_block'.
+        size (int): Board dimension.
+        win_value (int): Number of markers in a row needed to win. Defaults to the board dimension.
+        x_first (bool): If True, 'x' moves first in every game, otherwise 'o' does.
+        seed (int): Seed of the NumPy random generator.
+        batch_size (int): Number of games held in memory at once.
+
+    Returns:
+        BatchResult: Wins, draws, the distribution of game lengths and the wall clock time.
+
+    Raises:
+        ValueError: If a policy is unknown.
+        ImportError: If NumPy is not installed.
+    """
+    for policy in policies:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}'. Must be one of {', '.join(POLICIES)}.")
+    np = load_numpy()
+    rng = np.random.default_rng(seed)
+    win_value = win_value or size
+    cells = size * size
+    winning_lines = get_winning_lines(size, size, win_value)
+    lines = np.array(winning_lines.lines, dtype=np.intp).reshape(-1, win_value)
+    # Lines through each square, padded with the id of an extra line that can never be complete
+    most_lines = max(len(cell_lines) for cell_lines in winning_lines.cell_lines)
+    cell_lines = np.full((cells, most_lines), len(lines), dtype=np.intp)
+    for square, ids in enumerate(winning_lines.cell_lines):
+        cell_lines[square, :len(ids)] = ids
+    padded_lines = np.vstack([lines, np.full((1, win_value), cells, dtype=np.intp)]) # Square cells is always empty
+
+    totals = np.zeros(3, dtype=np.int64) # Draws, 'x' wins and 'o' wins, indexed by the winning marker value
+    length_counts = np.zeros(cells + 1, dtype=np.int64)
+    start = perf_counter()
+    for batch_start in range(0, games, batch_size):
+        count = min(batch_size, games - batch_start)
+        board = np.zeros((count, cells + 1), dtype=np.int8) # 0 blank, 1 'x', 2 'o', plus the always blank square
+        active = np.arange(count)
+        winner = np.zeros(count, dtype=np.int8)
+        length = np.full(count, cells, dtype=np.int64)
+
+        for ply in range(cells):
+            if len(active) == 0:
+                break
+            marker = 1 if (ply % 2 == 0) == x_first else 2
+            policy = policies[marker - 1]
+            boards = board[active, :cells]
+            scores = rng.random((len(active), cells)) # Random tie breaks in [0, 1) pick uniformly among equal squares
+            if policy == "win_block":
+                scores += 2 * _completing_squares(np, boards, lines, marker, cells, win_value)
+                scores += _completing_squares(np, boards, lines, 3 - marker, cells, win_value)
+            scores[boards != 0] = -1
+            moves = scores.argmax(axis=1)
+            board[active, moves] = marker
+
+            # Only the lines through each move can have been completed by it
+            through = padded_lines[cell_lines[moves]] # (games, lines through the move, win_value)
+            won = (board[active[:, None, None], through] == marker).all(axis=2).any(axis=1)
+            winner[active[won]] = marker
+            length[active[won]] = ply + 1
+            active = active[~won]
+
+        totals += np.bincount(winner, minlength=3)
+        length_counts += np.bincount(length, minlength=cells + 1)
+    seconds = perf_counter() - start
+    return BatchResult(int(totals[1]), int(totals[2]), int(totals[0]), tuple(int(n) for n in length_counts), seconds)
+
+
+def _completing_squares(np, boards, lines, marker: int, cells: int, win_value: int):
+    """Marks with 1 the empty squares that complete a line for the marker on each board."""
+    values = boards[:, lines] # (games, lines, win_value)
+    ready = ((values == marker).sum(axis=2) == win_value - 1) & ((values == 0).sum(axis=2) == 1)
+    games, line_ids = np.nonzero(ready)
+    marks = np.zeros(boards.shape, dtype=np.float64)
+    if len(games):
+        blank = (values[games, line_ids] == 0).argmax(axis=1)
+        marks[games, lines[line_ids, blank]] = 1
+    return marks
+
+
+def format_result(result: BatchResult, policies: tuple[str, str]) -> str:
+    games = result.games
+    lines = [f"x ({policies[0]}) wins: {result.x_wins} ({result.x_wins / games:.2%})",
+             f"o ({policies[1]}) wins: {result.o_wins} ({result.o_wins / games:.2%})",
+             f"Draws: {result.draws} ({result.draws / games:.2%})",
+             "Game lengths: " + ", ".join(f"{plies}: {count}" for plies, count in enumerate(result.length_counts)
+                                          if count),
+             f"{games} games in {result.seconds:.2f}s ({result.games_per_second:,.0f} games per second)"]
+    return "\n".join(lines)
+
+
+def main(arguments: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m games.batch_simulate",
+                                     description="Plays random and win-or-block TicTacToe games in NumPy batches.")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--policies", default="random:random",
+                        help=f"policies of x and o joined by ':', from {', '.join(POLICIES)} (default: random:random)")
+    parser.add_argument("--o-first", action="store_true", help="let 'o' move first")
+    parser.add_argument("--size", type=int, default=3, help="board dimension (default: 3)")
+    parser.add_argument("--win-value", type=int, default=None, help="markers in a row to win (default: size)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(arguments)
+
+    policies = tuple(args.policies.split(":"))
+    if len(policies) != 2:
+        parser.error("--policies needs two policies joined by ':'.")
+    try:
+        result = simulate_batch(args.games, policies, args.size, args.win_value, not args.o_first, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    print(format_result(result, policies))
+
+
+if __name__ == "__main__":
+    main()
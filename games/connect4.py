@@ -5,14 +5,15 @@ Updated: 2025-09-10
 
 This module contains code for connect4.
 """
-from core.board import Board, LineChecker
+from core.board import Board, BoardView, LineChecker
 from core.player import Player
-from games.games import int_converter
 
 from random import randint
 from typing import List, Tuple, Optional
 
 class ConnectFour:
+    board_class = Board # Board storage backend, can be swapped for core.bitboard.BitBoard for AI self-play
+    symmetries = ("identity", "mirror") # Gravity only allows the left-right mirror, used with Board.canonical()
 
     def __init__(self, connect_value: int=4, rows: int=6, columns: int=7):
          self.connect_value = connect_value # Options to set the connect_value to play variations of Connect 4 (board size via row and columns should be modified)
@@ -32,8 +33,6 @@ class ConnectFour:
          self.win_type: str = None
          self.win_row: int = -1
          self.win_column: int = -1
-         
-         self._premove_board_state = None
 
     @property
     def board_size(self):
@@ -42,7 +41,7 @@ class ConnectFour:
 
     def create_board(self):
         """Creates board object based on size dimensions of the number of rows and columns."""
-        return Board(self.rows, self.columns)
+        return self.board_class(self.rows, self.columns)
 
     def create_human_players(self) -> Tuple[Player, Player]:
         """Creates two human players for game play in two player mode."""
@@ -93,16 +92,29 @@ class ConnectFour:
         
         for row in range(self.rows - 1, -1, -1):
             if self.is_valid(row, col):
-                self._premove_board_state = self.board.get_board(True)
-                self.board.add_to_square(row, col, marker)
+                self.board.push(row, col, marker) # Move stack on the board allows undo and animation without copying the board
                 self.move_list.append((row, col))
                 self.height_list[col] = row
                 self.round_count += 1
                 return True
         return False
     
+    def undo_move(self) -> Optional[tuple[int, int]]:
+        """
+        Takes back the last move played. Returns the row and column of the removed piece, or None if no moves have been played.
+        """
+        if not self.move_list:
+            return None
+        self.board.pop()
+        row, col = self.move_list.pop()
+        self.height_list[col] = row + 1 # The square that was just cleared is the new open position in the column
+        self.round_count -= 1
+        return row, col
+
     def check_winner(self):
-        """Checks the board for a winning condition."""
+        """Checks the board for a winning condition. Only the lines through the last move are checked once a move has been played."""
+        if self.move_list:
+            return self._win.check_from_move(*self.move_list[-1]) is not None
         return self._win._check_for_winner()
     
     def reset_game_state(self):
@@ -134,6 +146,10 @@ class ConnectFour:
         """Returns a dictionary with the winner's information."""
         return self._win.get_win_info()
 
+    def get_winning_cells(self) -> set[tuple[int, int]]:
+        """Returns the row and column of every square in every complete line, for highlighting the win."""
+        return self._win.get_winning_cells()
+
     def get_player(self, index: int):
         """Returns the player at the specified index."""
         return self.players[index]
@@ -151,16 +167,16 @@ class ConnectFour:
         """
         # lazy method called only when needed
         board_states = []
-        # Get a mutable copy of the current board state that allows for board manipulation without change the actual state of the game board
-        temp_board = self._premove_board_state
         current_row_played, current_column_played = self.move_list[-1]
-        # Create a boad state with the current player's marker starting from the top row to the final row position of the current move
+        # Replay the piece from the top row down to its final position on copies of the current view. The frames are read-only
+        # snapshots built without touching the board, so its change log and observers never see the animation.
+        current_view = self.board.view()
+        rows = [list(row) for row in current_view.rows]
         for j in range(current_row_played + 1):
-            temp_board.add_to_square(j, current_column_played, player_marker)
-            board_states.append(temp_board.get_board())
-            if j < current_row_played:
-                temp_board.update_square(j, current_column_played, 0)
-        self._last_pre_move_state = None
+            frame = [row.copy() for row in rows]
+            frame[current_row_played][current_column_played] = 0
+            frame[j][current_column_played] = player_marker
+            board_states.append(BoardView(tuple(tuple(row) for row in frame), current_view.version))
 
         return board_states
 
@@ -222,30 +238,10 @@ class ConnectFour:
             super().__init__(board, win_value)
 
         def _check_full_rows(self, win_value: int) -> Optional[tuple]:
-            for r, row in enumerate(self._board.get_rows()):
-                for i in range(4):
-                    row_slice = row[i:i + 4]
-                    if winner := LineChecker.check_all_same(row_slice):
-                        return winner, "row", r, i
+            return self._check_winning_lines(win_value, "row")
 
         def _check_full_columns(self, win_value: int) -> Optional[tuple]:
-            for c, column in enumerate(self._board.get_columns()):
-                for i in range(3):
-                    col_slice = column[i:i + 4]
-                    if winner := LineChecker.check_all_same(col_slice):
-
-                        return winner, "column", i, c
-
-        def _check_diagonals(self, win_value: int) -> Optional[tuple]:
-            for l, line in enumerate(self._board.get_diagonals(win_value, "right")):
-                if winner := LineChecker.check_all_same(line):
-                    r, c = int_converter(l, self._board.columns - win_value + 1)
-                    return winner, "right_diagonal", r, c
-            for l, line in enumerate(self._board.get_diagonals(win_value, "left")):
-                if winner := LineChecker.check_all_same(line):
-                    r, c = int_converter(l, self._board.columns - win_value + 1)
-                    c = self._board.columns - 1 - c
-                    return winner, "left_diagonal", r, c
+            return self._check_winning_lines(win_value, "column")
 
 
     class ConnectFourPlayer(Player):
@@ -323,7 +319,7 @@ class ConnectFour:
 
         def move(self):
 
-            if (move:= self.win_or_block()) is not None:
+            if (move := self.win_or_block()) is not None:
                 return move
            
             return self.random_int()
@@ -332,187 +328,23 @@ class ConnectFour:
         #     for column in range(self.game.board.columns):
         #         return [(self.game.height_list[column] - 1, column) for column in range(self.game.board.columns)]
 
-        def win_or_block(self):
-            block_position = -1 # Initialize with no block position
-            horizontal_midpoint = self.game.board.columns // 2
-
-            def marker_check(line):
-                """Returns True if all elements in line segment are 'y' or False if 'r'; otherwise, returns None"""
-                if marker := LineChecker.check_all_same(line):
-                    if marker == 'y':
-                            return True
-                    elif marker == 'r':
-                        return False
-                return None
-
-            def check_and_update(line, row, column):
-                if not line:
-                    return None
-                nonlocal block_position
-                win_or_block = marker_check(line)
-                if win_or_block is True:
-                    return column  # Found winning move for AI player and return position immediately to make the winning move
-                elif win_or_block is False:
-                    block_position = column  # Updates the block position to stop human player from winning and will only be used if no win is found
-                return None
-
-            def left_right_pattern(line, square):
-                if not (line and square):
-                    return None
-                line.append(square)
-                return line
-
-            def star_pattern_check(row, row_height, column):
-                diagonal_line = self.game.board.get_diagonal_segment
-                down_left = self.game.board.get_square_value(row_height, column - 1)
-                one_two_pattern = left_right_pattern(
-                        diagonal_line(row=row - 1, col=column + 1, length = 2, up=True, right=True),
-                        down_left
-                    )
-                if move := check_and_update(one_two_pattern, row, column):
-                        return move
-                down_right = self.game.board.get_square_value(row_height, column + 1)
-                one_two_pattern = left_right_pattern(
-                        diagonal_line(row=row - 1, col=column - 1, length = 2, up=True, right=False),
-                        down_right
-                    )
-                if move := check_and_update(one_two_pattern, row, column):
-                        return move
-                up_right = self.game.board.get_square_value(row - 1, column + 1)
-                one_two_pattern = left_right_pattern(
-                        diagonal_line(row=row_height, col=column - 1, length = 2, up=False, right=False),
-                        up_right
-                    )
-                if move := check_and_update(one_two_pattern, row, column):
-                        return move
-                up_left = self.game.board.get_square_value(row - 1, column - 1)
-                one_two_pattern = left_right_pattern(
-                        diagonal_line(row=row_height, col=column + 1, length = 2, up=False, right=True),
-                        up_left
-                    )
-                if move := check_and_update(one_two_pattern, row, column):
-                        return move
-                return None
-
-            def down_check(row_height, column):
-                column_line = self.game.board.get_column_segment
-                if (move := check_and_update(column_line(row=row_height, col=column, length = 3), row, column)) is not None:
-                    # print(f"WON in DOWN COL at move {move}")
-                    return move
-                
-                ### For variation in the easy vs intermediate mode, easy mode doesn't check for diagonals
-                if self.difficulty is None:
-                    return None
-
-                diagonal_line = self.game.board.get_diagonal_segment
-                if (move := check_and_update(diagonal_line(row=row_height, col=column + 1, length = 3, up=False, right=True), row, column)) is not None:
-                    # print(f"WON in DOWN Diag Right {move}")
-                    return move
-                if (move := check_and_update(diagonal_line(row=row_height, col=column - 1, length = 3, up=False, right=False), row, column)) is not None:
-                    # print(f"WON in DOWN Diag Left {move}")
-                    return move
-                return None
-
-            def right_and_up_check(row, column):
-                row_line = self.game.board.get_row_segment
-                if (move := check_and_update(row_line(row=row, col=column + 1, length=3), row, column)):
-                    return move
-
-                # One-two pattern
-                one_two_pattern = left_right_pattern(
-                    row_line(row=row, col=column + 1, length = 2),
-                    left_value
-                )
-                if (move := check_and_update(one_two_pattern, row, column)):
-                    return move
-
-                # Two-one pattern
-                two_one_pattern = left_right_pattern(
-                    row_line(row=row, col=column - 2, length=2),
-                    right_value
-                )
-                if (move := check_and_update(two_one_pattern, row, column)):
-                    return move
-                
-                ### For variation on easy mode, do not check diagonal patterns
-                if self.difficulty is None:
-                    return None
-
-                diagonal_line = self.game.board.get_diagonal_segment
-                if (move := check_and_update(diagonal_line(row=row - 1, col=column + 1, length=3, up=True, right=True), row, column)):
-                    return move
-
-                return None
-
-            def left_and_up_check(row, column):
-                row_line = self.game.board.get_row_segment
-                if (move := check_and_update(row_line(row=row, col=column - 1, length = 3, right=False), row, column)) is not None:
-                    return move
-
-                # One-two pattern here
-                one_two_pattern = left_right_pattern(
-                    row_line(row=row, col=column + 1, length = 2),
-                    left_value
-                )
-
-                if (move := check_and_update(one_two_pattern, row, column)) is not None:
-                    return move
-                # Two-one pattern here
-                two_one_pattern = left_right_pattern(
-                    row_line(row=row, col=column - 2, length = 2),
-                    right_value
-                )
-                if (move := check_and_update(two_one_pattern, row, column)) is not None:
-                        return move
-
-                diagonal_line = self.game.board.get_diagonal_segment
-                if (move := check_and_update(diagonal_line(row=row - 1, col=column - 1, length = 3, up=True, right=False), row, column)) is not None:
-                    return move
-
-                return None
-
-            for column, row_height in enumerate(self.game.height_list):
-                # Check if column is full; height list at 0 means the top row is occupied and there are no moves in the column
-              
-                if row_height == 0:
-                    continue
-
-                # Update the row to the current open position in the column
-                row = row_height - 1
-
-                # Check for three in a row down, down-right and down left starting from vertical mid-point
-                if row_height <= self.game.board.rows // 2:
-                    if move := down_check(row_height, column):
-                        # print(f"WON in DOWN {move}")
-                        return move
-
-                # Check all diagonal directions with one-two or two-one patterns
-                #### For variation, only do star check pattern for intermediate mode
-                if self.difficulty is not None:
-
-                    if move:= star_pattern_check(row, row_height, column):
-                        # print(f"Won in a Star at {move}")
-                        return move
-                    
-                ### Check all right or left blocks/wins for both AI player modes
-
-                left_value = self.game.board.get_square_value(row, column - 1)
-                right_value = self.game.board.get_square_value(row, column + 1)
-
-                # Check if both neighbors of current open position in the column are either out of bounds or empty to avoid unnecessary checks
-                if (left_value == 0 or left_value is None) and (right_value == 0 or right_value is None):
-                    continue
-
-                if column <= horizontal_midpoint:
-                    # Check row right combinations and up-right diagonal
-                    if move := right_and_up_check(row, column):
-                        # print(f"WON in ROW RIGHT at Col {move}")
-                        return move
-
-                if column >= horizontal_midpoint:
-                    # Check row left combinations and up-left diagonal
-                    if (move := left_and_up_check(row, column)) is not None:
-                        # print(f"WON in ROW LEFT at Col {move}")
-                        return move
-
-            return block_position if block_position != -1 else None
\ No newline at end of file
+        def win_or_block(self) -> Optional[int]:
+            """Finds a column that wins, or else a column that blocks an opponent win, by looking up the lines one square
+            from complete in the board's line counters. Only the lowest open square of each column can be played, so
+            threats higher up a column are skipped. Easy mode only looks at rows and columns. Returns None if there is
+            no win or block."""
+            columns = self.game.columns
+            line_counters = self.game.board.line_counters(self.game.connect_value)
+            line_info = line_counters.winning_lines.line_info
+            playable_squares = {(row_height - 1) * columns + column
+                                for column, row_height in enumerate(self.game.height_list) if row_height > 0}
+            opponent_marker = "r" if self.marker == "y" else "y"
+            for marker in (self.marker, opponent_marker): # win first, then block
+                for line_id in line_counters.lines_with(marker, self.game.connect_value - 1):
+                    ### For variation in the easy vs intermediate mode, easy mode doesn't check for diagonals
+                    if self.difficulty is None and line_info[line_id][0] not in ("row", "column"):
+                        continue
+                    for square in line_counters.blank_cells(line_id):
+                        if square in playable_squares:
+                            return square % columns
+            return None
@@ -0,0 +1,197 @@
+"""
+mcts.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains a Monte Carlo Tree Search engine for k-in-a-row games on boards too large for alpha-beta search,
+such as 6x6 or larger TicTacToe with 4 or 5 in a row. Each side is kept as an integer bitmask of its squares, so a
+random playout is a shuffle of the empty squares followed by a few AND operations per move. Nodes are selected with
+UCT and the search stops after a fixed number of playouts or a wall clock budget. The tree can be kept between turns.
+"""
+from core.board import Board, get_winning_lines, marker_code
+
+from math import log, sqrt
+from random import Random
+from time import perf_counter
+from typing import Optional, Union
+
+
+class _Node:
+    """A position in the search tree, reached by playing move for the side that just moved."""
+    __slots__ = ("move", "parent", "children", "untried", "visits", "wins", "terminal")
+
+    def __init__(self, move: Optional[int], parent: Optional["_Node"], untried: list[int], terminal: bool):
+        self.move = move
+        self.parent = parent
+        self.children: list[_Node] = []
+        self.untried = untried # Candidate moves not expanded yet
+        self.visits = 0
+        self.wins = 0.0 # Playout score for the side that just moved: 1 for a win and 0.5 for a draw
+        self.terminal = terminal
+
+
+class MonteCarloTreeSearch:
+    """
+    UCT search for the first player to complete a line of win_value squares. Keep one instance per player for a whole
+    game so the tree can be reused from one turn to the next.
+
+    Args:
+        rows (int): Number of rows of the board.
+        columns (int): Number of columns of the board.
+        win_value (int): Number of squares in a row needed to win.
+        playouts (int): Number of playouts per move. If None, the search runs until time_limit runs out.
+        time_limit (float): Seconds allowed per move when playouts is None.
+        exploration (float): UCT exploration constant.
+        reuse_tree (bool): If True, the subtree of the position reached after the opponent's reply is kept.
+        seed: Seed of the engine's own random number generator, for repeatable games.
+    """
+
+    def __init__(self, rows: int, columns: int, win_value: int, playouts: Optional[int] = None,
+                 time_limit: float = 1.0, exploration: float = sqrt(2), reuse_tree: bool = True, seed=None):
+        self.rows = rows
+        self.columns = columns
+        self.win_value = win_value
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.reuse_tree = reuse_tree
+        self.random = Random(seed)
+        self._full_mask = (1 << (rows * columns)) - 1
+        lines = get_winning_lines(rows, columns, win_value)
+        line_masks = [sum(1 << index for index in line) for line in lines.lines]
+        # Masks of the winning lines through each square, so a move only checks its own lines
+        self._cell_line_masks = tuple(tuple(line_masks[line_id] for line_id in cell_lines)
+                                      for cell_lines in lines.cell_lines)
+        self._neighbour_masks = tuple(self._neighbours(index) for index in range(rows * columns))
+        self._root: Optional[_Node] = None
+        self._root_position: Optional[tuple[int, int]] = None # (side to move, opponent) masks of the kept root
+        self.last_playouts = 0
+
+    def _neighbours(self, index: int) -> int:
+        row, column = divmod(index, self.columns)
+        mask = 0
+        for next_row in range(max(row - 1, 0), min(row + 2, self.rows)):
+            for next_column in range(max(column - 1, 0), min(column + 2, self.columns)):
+                mask |= 1 << (next_row * self.columns + next_column)
+        return mask
+
+    def _wins(self, mask: int, index: int) -> bool:
+        """Checks if the side with the given squares has completed a line through index."""
+        return any(mask & line == line for line in self._cell_line_masks[index])
+
+    def _candidates(self, mine: int, theirs: int) -> list[int]:
+        """Empty squares next to a stone, or every square of an empty board. Moves far from every stone cannot build
+        or block a line, so leaving them out of the tree keeps the branching factor small on large boards."""
+        occupied = mine | theirs
+        if not occupied:
+            return list(range(self.rows * self.columns))
+        near = 0
+        bits = occupied
+        while bits:
+            low = bits & -bits
+            near |= self._neighbour_masks[low.bit_length() - 1]
+            bits ^= low
+        near &= ~occupied
+        return [index for index in range(self.rows * self.columns) if near >> index & 1]
+
+    def best_move(self, board: Board, marker: Union[int, str], opponent: Union[int, str]) -> Optional[tuple[int, int]]:
+        """
+        Searches for the best move of the marker to move.
+
+        Returns:
+            tuple: The row and column of the move with the most visits, or None if the board is full.
+        """
+        codes = board.codes()
+        marker_value, opponent_value = marker_code(marker), marker_code(opponent)
+        mine = sum(1 << index for index, code in enumerate(codes) if code == marker_value)
+        theirs = sum(1 << index for index, code in enumerate(codes) if code == opponent_value)
+        empty = [index for index in range(len(codes)) if not (mine | theirs) >> index & 1]
+        if not empty:
+            return None
+
+        # Immediate wins and forced blocks do not need a search
+        for side in (mine, theirs):
+            for index in empty:
+                if self._wins(side | 1 << index, index):
+                    self._root = None
+                    return divmod(index, self.columns)
+
+        root = self._reused_root(mine, theirs)
+        if root is None:
+            root = _Node(None, None, self._candidates(mine, theirs), False)
+        deadline = perf_counter() + self.time_limit
+        playouts = 0
+        while (playouts < self.playouts) if self.playouts is not None else (perf_counter() < deadline or playouts == 0):
+            self._iterate(root, mine, theirs)
+            playouts += 1
+        self.last_playouts = playouts
+
+        if not root.children:
+            # No playout expanded the root, such as with playouts=0, so play a random candidate without keeping a tree
+            self._root = None
+            return divmod(self.random.choice(root.untried or empty), self.columns)
+        best = max(root.children, key=lambda child: child.visits)
+        if self.reuse_tree:
+            # After our move the opponent is the side to move
+            self._root, self._root_position = best, (theirs, mine | 1 << best.move)
+        return divmod(best.move, self.columns)
+
+    def _reused_root(self, mine: int, theirs: int) -> Optional[_Node]:
+        """Returns the node of the current position if it is one reply below the position kept after the last move."""
+        if not self.reuse_tree or self._root is None:
+            return None
+        kept_theirs, kept_mine = self._root_position # Kept from the opponent's point of view
+        reply = theirs & ~kept_theirs
+        if mine != kept_mine or theirs & kept_theirs != kept_theirs or reply & (reply - 1) or not reply:
+            return None # Not exactly one opponent move later, such as a new game
+        move = reply.bit_length() - 1
+        for child in self._root.children:
+            if child.move == move:
+                child.parent = None
+                return child
+        return None
+
+    def _iterate(self, root: _Node, mine: int, theirs: int) -> None:
+        """Runs one selection, expansion, playout and backpropagation pass from the root."""
+        node = root
+        to_move, other = mine, theirs # Squares of the side to move at the current node, and of the other side
+        log_visits = None
+        # Selection
+        while not node.untried and node.children and not node.terminal:
+            log_visits = log(node.visits)
+            exploration = self.exploration
+            node = max(node.children, key=lambda child: child.wins / child.visits +
+                       exploration * sqrt(log_visits / child.visits))
+            to_move, other = other, to_move | 1 << node.move
+        # Expansion
+        if node.untried and not node.terminal:
+            move = node.untried.pop(self.random.randrange(len(node.untried)))
+            played = to_move | 1 << move
+            terminal = self._wins(played, move) or (played | other) == self._full_mask
+            child = _Node(move, node, [] if terminal else self._candidates(other, played), terminal)
+            node.children.append(child)
+            node = child
+            to_move, other = other, played
+        # Playout, scored for the side that just moved into the node
+        if node.terminal:
+            result = 1.0 if node.move is not None and self._wins(other, node.move) else 0.5
+        else:
+            result = self._playout(to_move, other)
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            node.wins += result
+            result = 1.0 - result
+            node = node.parent
+
+    def _playout(self, to_move: int, other: int) -> float:
+        """Plays random moves to the end of the game. Returns 1 if the side that is not to move wins, 0.5 for a draw."""
+        empty = [index for index in range(self.rows * self.columns) if not (to_move | other) >> index & 1]
+        self.random.shuffle(empty)
+        sides = [to_move, other]
+        for turn, index in enumerate(empty):
+            side = turn & 1
+            sides[side] |= 1 << index
+            if self._wins(sides[side], index):
+                return 0.0 if side == 0 else 1.0
+        return 0.5
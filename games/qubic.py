@@ -0,0 +1,482 @@
+"""
+qubic.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains code for Qubic, the 3D TicTacToe played on a 4x4x4 cube where the first player to complete a line
+of four wins. Each player's markers are kept as a 64-bit integer where bit (layer * 16 + row * 4 + column) is set when
+the player occupies that square. The 76 winning lines are precomputed as bitmasks, so a win is found with one AND per
+line through the last move instead of by scanning lists of squares.
+
+The hard AI searches with bit-sliced line counters. For each player, three 76-bit integers hold the binary digits of
+the number of that player's markers in every line, one bit per line. Playing a square adds the set of lines through it
+to the counter with a ripple carry, so the open lines of each size and the squares that win on the next move come from
+a handful of integer operations per node rather than a loop over 76 lines.
+"""
+from core.player import Player
+from games.search import NegamaxSearch
+from games.tictactoe import TicTacToe
+
+from itertools import product
+from random import choice
+from typing import NamedTuple, Optional
+
+SIZE = 4 # Squares along each edge of the cube, which is also the number of markers in a row needed to win
+CELLS = SIZE ** 3
+FULL_MASK = (1 << CELLS) - 1
+
+
+class LineInfo(NamedTuple):
+    win_type: str # 'row', 'column', 'pillar', 'layer_diagonal', 'vertical_diagonal' or 'space_diagonal'
+    start: tuple[int, int, int] # Layer, row and column of the first square of the line
+    direction: tuple[int, int, int] # Step in layers, rows and columns from one square of the line to the next
+
+
+def square_index(layer: int, row: int, column: int) -> int:
+    """Returns the bit of a square in the 64-bit masks."""
+    return (layer * SIZE + row) * SIZE + column
+
+
+def square_position(index: int) -> tuple[int, int, int]:
+    """Returns the layer, row and column of a bit in the 64-bit masks."""
+    layer, square = divmod(index, SIZE * SIZE)
+    return (layer, *divmod(square, SIZE))
+
+
+def _line_type(direction: tuple[int, int, int]) -> str:
+    layer_step, row_step, column_step = direction
+    steps = sum(step != 0 for step in direction)
+    if steps == 1:
+        return "pillar" if layer_step else "column" if row_step else "row"
+    if steps == 2:
+        return "vertical_diagonal" if layer_step else "layer_diagonal"
+    return "space_diagonal"
+
+
+def _build_winning_lines() -> tuple[tuple[int, ...], tuple[LineInfo, ...]]:
+    """Walks four squares from every square in one of each pair of opposite directions and keeps the walks that stay
+    inside the cube: 16 rows, 16 columns, 16 pillars, 8 layer diagonals, 16 vertical diagonals and 4 space diagonals."""
+    type_order = ("row", "column", "pillar", "layer_diagonal", "vertical_diagonal", "space_diagonal")
+    lines = []
+    for direction in product((-1, 0, 1), repeat=3):
+        if next((step for step in direction if step), 0) != 1: # Skip the zero step and the reverse of each direction
+            continue
+        for start in product(range(SIZE), repeat=3):
+            squares = [tuple(start[axis] + step * direction[axis] for axis in range(3)) for step in range(SIZE)]
+            if all(0 <= value < SIZE for square in squares for value in square):
+                mask = sum(1 << square_index(*square) for square in squares)
+                lines.append((type_order.index(_line_type(direction)), start, mask, direction))
+    lines.sort()
+    return (tuple(mask for _, _, mask, _ in lines),
+            tuple(LineInfo(type_order[order], start, direction) for order, start, _, direction in lines))
+
+
+WINNING_LINES, LINE_INFO = _build_winning_lines()
+ALL_LINES = (1 << len(WINNING_LINES)) - 1
+# Line masks through each square, for checking the lines of the last move
+CELL_LINES: tuple[tuple[int, ...], ...] = tuple(tuple(mask for mask in WINNING_LINES if mask >> square & 1)
+                                                 for square in range(CELLS))
+# Bit set of line ids through each square, added to the bit-sliced line counters when the square is played
+CELL_LINE_SETS: tuple[int, ...] = tuple(sum(1 << line_id for line_id, mask in enumerate(WINNING_LINES)
+                                            if mask >> square & 1) for square in range(CELLS))
+
+
+def describe_line(line_id: int) -> str:
+    """Describes where a winning line lies on the cube for the players, for example 'row 2 of layer 3'."""
+    win_type, (layer, row, column), (layer_step, row_step, _) = LINE_INFO[line_id]
+    if win_type == "row":
+        return f"row {row + 1} of layer {layer + 1}"
+    if win_type == "column":
+        return f"column {column + 1} of layer {layer + 1}"
+    if win_type == "pillar":
+        return f"the pillar at row {row + 1} and column {column + 1}"
+    if win_type == "layer_diagonal":
+        return f"a diagonal of layer {layer + 1}"
+    if win_type == "vertical_diagonal":
+        return f"the diagonal through the layers in row {row + 1}" if not row_step else \
+            f"the diagonal through the layers in column {column + 1}"
+    return f"the space diagonal from layer {layer + 1}, row {row + 1} and column {column + 1}"
+
+
+def _iter_bits(mask: int):
+    """Yields the index of every set bit, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+# A side of a search position is (squares, digit 0, digit 1, digit 2): the player's 64-bit mask and the three binary
+# digits of the player's marker count in each of the 76 lines. A count never passes four because four ends the game.
+Side = tuple[int, int, int, int]
+
+
+def _add_marker(side: Side, square: int) -> Side:
+    """Plays a square for a side, incrementing the count of every line through it with a ripple carry."""
+    squares, digit0, digit1, digit2 = side
+    carry = CELL_LINE_SETS[square]
+    carry1 = digit0 & carry
+    carry2 = digit1 & carry1
+    return squares | 1 << square, digit0 ^ carry, digit1 ^ carry1, digit2 | carry2
+
+
+def _side_from_mask(mask: int) -> Side:
+    side = (0, 0, 0, 0)
+    for square in _iter_bits(mask):
+        side = _add_marker(side, square)
+    return side
+
+
+def _completing_squares(side: Side, opponent: Side) -> int:
+    """Mask of the empty squares that complete a line of three for the side."""
+    threes = side[1] & side[2] & ~(opponent[1] | opponent[2] | opponent[3])
+    squares = 0
+    for line_id in _iter_bits(threes):
+        squares |= WINNING_LINES[line_id]
+    return squares & ~(side[0] | opponent[0])
+
+
+class QubicSearch(NegamaxSearch):
+    """
+    Negamax alpha-beta search for Qubic on bitboards, with iterative deepening inside a time budget per move and a
+    transposition table. A position is the pair of bit-sliced sides, player to move first. Both 64-bit masks together
+    are the table key, so distinct positions can never share an entry and no Zobrist hashing is needed. Keep one
+    instance per player for a whole game so the table and the move history carry over from one move to the next.
+
+    Args:
+        time_limit (float): Seconds allowed per move. The move of the deepest completed iteration is returned.
+        max_depth (int): Optional limit on the search depth in plies. Defaults to searching until the cube is full.
+        table_size (int): Maximum number of transposition table entries. The table is cleared when it fills up.
+    """
+    weights = (0, 1, 4, 16) # Worth of an open line holding one, two or three of a player's markers
+
+    def best_move(self, own_mask: int, other_mask: int) -> Optional[int]:
+        """
+        Searches for the best square for the player to move.
+
+        Args:
+            own_mask (int): Squares of the player to move.
+            other_mask (int): Squares of the opponent.
+
+        Returns:
+            int: The bit index of the best square found, or None if the cube is full.
+        """
+        empty = FULL_MASK & ~(own_mask | other_mask)
+        if not empty:
+            return None
+        return self._deepen((_side_from_mask(own_mask), _side_from_mask(other_mask)), empty.bit_count())
+
+    def _winning_move(self, position: tuple[Side, Side]) -> Optional[int]:
+        wins = _completing_squares(*position)
+        return (wins & -wins).bit_length() - 1 if wins else None
+
+    def _blocking_moves(self, position: tuple[Side, Side]) -> list[int]:
+        own, other = position
+        return list(_iter_bits(_completing_squares(other, own)))
+
+    def _is_full(self, position: tuple[Side, Side]) -> bool:
+        own, other = position
+        return own[0] | other[0] == FULL_MASK
+
+    def _table_key(self, position: tuple[Side, Side]) -> tuple[int, int]:
+        own, other = position
+        return own[0], other[0]
+
+    def _play(self, position: tuple[Side, Side], move: int) -> tuple[Side, Side]:
+        own, other = position
+        return other, _add_marker(own, move)
+
+    def _ordered_moves(self, position: tuple[Side, Side], table_move: Optional[int]) -> list[int]:
+        """Orders the empty squares: the stored best move, squares that make a line of three for either player, then
+        by history and number of lines through the square."""
+        own, other = position
+        occupied = own[0] | other[0]
+        own_twos = ~own[1] & own[2] & ~(other[1] | other[2] | other[3])
+        other_twos = ~other[1] & other[2] & ~(own[1] | own[2] | own[3])
+        threat_squares = 0
+        for line_id in _iter_bits(own_twos | other_twos):
+            threat_squares |= WINNING_LINES[line_id]
+        history = self._history
+        ordered = sorted(_iter_bits(FULL_MASK & ~occupied),
+                         key=lambda square: (square != table_move, not threat_squares >> square & 1,
+                                             -history.get(square, 0), -len(CELL_LINES[square]), square))
+        return ordered
+
+    def _evaluate(self, position: tuple[Side, Side]) -> int:
+        """Scores a quiet position by the lines each player can still complete, weighted by how full they are."""
+        own, other = position
+        own_open = ALL_LINES & ~(other[1] | other[2] | other[3])
+        other_open = ALL_LINES & ~(own[1] | own[2] | own[3])
+        _, ones, twos, threes = self.weights
+        return (ones * ((own[1] & ~own[2]) & own_open).bit_count()
+                + twos * ((~own[1] & own[2]) & own_open).bit_count()
+                + threes * (own[1] & own[2] & own_open).bit_count()
+                - ones * ((other[1] & ~other[2]) & other_open).bit_count()
+                - twos * ((~other[1] & other[2]) & other_open).bit_count()
+                - threes * (other[1] & other[2] & other_open).bit_count())
+
+
+class Qubic:
+
+    def __init__(self):
+        self.masks: dict[str, int] = {"x": 0, "o": 0} # 64-bit square mask of each marker
+        self.move_list: list[tuple[int, int, int]] = []
+        self.round_count: int = 0
+        self.go_first: bool = True
+        self.winner_name: str = None # All winner attributes default to None when there is no winner
+        self.winner_marker: str = None
+        self.win_type: str = None
+        self.win_index: int = None # Id of the winning line in WINNING_LINES
+        self._win_line: Optional[int] = None
+        self._win_marker: Optional[str] = None
+        self.players = self.create_human_players() # Default to two player mode
+
+    @property
+    def dimension(self) -> int:
+        """Returns the number of squares along each edge of the cube."""
+        return SIZE
+
+    @property
+    def board_size(self) -> int:
+        return CELLS
+
+    @property
+    def occupied(self) -> int:
+        """Mask of every occupied square."""
+        return self.masks["x"] | self.masks["o"]
+
+    def create_human_players(self) -> tuple[Player, Player]:
+        return (
+            self.QubicPlayer("Player 1", "x"),
+            self.QubicPlayer("Player 2", "o"),
+        )
+
+    def create_ai_player(self, name: Optional[str], difficulty: Optional[bool]) -> None:
+        self.players = (
+            self.QubicPlayer("Player 1", "x"),
+            self.AIPlayer(name=name, difficulty=difficulty, game=self),
+        )
+
+    def add_ai_players_for_testing(self, difficulty_one: Optional[bool], difficulty_two: Optional[bool]) -> None:
+        self.players = (
+            self.AIPlayer(name="AI one", marker="x", difficulty=difficulty_one, game=self),
+            self.AIPlayer(name="AI two", marker="o", difficulty=difficulty_two, game=self),
+        )
+
+    def board_is_full(self) -> bool:
+        return self.occupied == FULL_MASK
+
+    def square_is_occupied(self, layer: int, row: int, col: int) -> bool:
+        return bool(self.occupied >> square_index(layer, row, col) & 1)
+
+    def get_square_value(self, layer: int, row: int, col: int) -> str | int:
+        """Returns the marker on a square, or 0 for a blank square like the 2D boards."""
+        index = square_index(layer, row, col)
+        for marker, mask in self.masks.items():
+            if mask >> index & 1:
+                return marker
+        return 0
+
+    def get_board(self) -> list[list[list[str | int]]]:
+        """Returns the cube as a list of layers, each a list of rows of square values, for display."""
+        return [[[self.get_square_value(layer, row, col) for col in range(SIZE)] for row in range(SIZE)]
+                for layer in range(SIZE)]
+
+    def is_valid(self, layer: int, row: int, col: int) -> bool:
+        if all(0 <= value < SIZE for value in (layer, row, col)): # validate the move is in the cube
+            return not self.square_is_occupied(layer, row, col)
+        return False
+
+    def make_move(self, layer: int, row: int, col: int, marker: str) -> bool:
+        if self.is_valid(layer, row, col):
+            self.masks[marker] |= 1 << square_index(layer, row, col)
+            self.move_list.append((layer, row, col))
+            self.round_count += 1
+            return True
+        return False
+
+    def undo_move(self) -> Optional[tuple[int, int, int]]:
+        """Takes back the last move played. Returns the layer, row and column of the removed move, or None if no moves
+        have been played."""
+        if not self.move_list:
+            return None
+        move = self.move_list.pop()
+        bit = 1 << square_index(*move)
+        for marker in self.masks:
+            self.masks[marker] &= ~bit
+        self.round_count -= 1
+        self._win_line = self._win_marker = None
+        return move
+
+    def check_winner(self) -> bool:
+        """Checks for a complete line. Only the four or seven lines through the last move are tested once a move has
+        been played, each with a single AND of the mover's mask."""
+        if self.move_list:
+            index = square_index(*self.move_list[-1])
+            marker = next(marker for marker, mask in self.masks.items() if mask >> index & 1)
+            lines = [(marker, mask) for mask in CELL_LINES[index]]
+        else:
+            lines = [(marker, mask) for marker in self.masks for mask in WINNING_LINES]
+        mask_of = self.masks
+        for marker, line in lines:
+            if mask_of[marker] & line == line:
+                self._win_line = WINNING_LINES.index(line)
+                self._win_marker = marker
+                return True
+        return False
+
+    def get_winner_info(self) -> dict:
+        """Returns the marker, line type and line id of the win found by check_winner(), all None if there is none."""
+        if self._win_line is None:
+            return {"marker": None, "type": None, "line": None}
+        return {"marker": self._win_marker, "type": LINE_INFO[self._win_line].win_type, "line": self._win_line}
+
+    def get_winning_cells(self) -> set[tuple[int, int, int]]:
+        """Returns the layer, row and column of every square in the winning line, for highlighting the win."""
+        if self._win_line is None:
+            return set()
+        return {square_position(index) for index in _iter_bits(WINNING_LINES[self._win_line])}
+
+    def get_win_location(self) -> Optional[str]:
+        return describe_line(self.win_index) if self.win_index is not None else None
+
+    def get_winner_string(self) -> str:
+        return f"{self.winner_name} wins in {self.get_win_location()}."
+
+    def get_winner_attributes(self):
+        return self.winner_name, self.winner_marker, self.win_type, self.win_index
+
+    def update_winner_info(self) -> None:
+        """Updates the winner attributes to store information on the current winner. Resets to default values if
+        there is no winner."""
+        winner_info = self.get_winner_info()
+        for player in self.players:
+            if player.marker == winner_info["marker"]:
+                self.winner_name = player.name
+                self.winner_marker = player.marker
+        self.win_type = winner_info["type"]
+        self.win_index = winner_info["line"]
+
+    def update_players_stats(self) -> None:
+        """Updates the game statistics on the two players based on if there is a winner or not."""
+        for player in self.players:
+            player.game_played()
+            if player.name == self.winner_name:
+                player.won()
+            elif self.winner_name is not None:
+                player.lost()
+
+    def update_player_name(self, name: str, marker: str) -> None:
+        """Updates a player's name based on their marker ('x' or 'o')."""
+        marker = marker.lower()
+        if marker not in {"x", "o"}:
+            raise ValueError(f"Invalid marker '{marker}'. Must be 'x' or 'o'.")
+        self.players[0 if marker == "x" else 1].name = name
+
+    def get_player(self, index: int):
+        return self.players[index]
+
+    def get_players_info_string_as_list(self) -> list[str]:
+        return [str(player) for player in self.players]
+
+    def reset_board(self) -> None:
+        """Clears every square in the cube."""
+        self.masks = {"x": 0, "o": 0}
+
+    def reset_winner(self) -> None:
+        self._win_line = self._win_marker = None
+        self.winner_name = None
+        self.winner_marker = None
+        self.win_type = None
+        self.win_index = None
+
+    def reset_game_state(self) -> None:
+        self.reset_board()
+        self.reset_winner()
+        self.move_list = []
+        self.round_count = 0
+        self.go_first = not self.go_first
+
+
+    class QubicPlayer(TicTacToe.TicTacToePlayer):
+        """Human Qubic player with the same 'x' or 'o' marker rules as a TicTacToe player."""
+
+    class AIPlayer(Player):
+
+        def __init__(self, name: str = 'CPU', marker: str = "o", difficulty: Optional[bool] = False,
+                     game: 'Qubic' = None):
+            """AIPlayer contains the functionality for a one-player game against the computer. Easy mode plays random
+            squares, intermediate mode wins or blocks when it can and otherwise extends its own lines, and hard mode
+            plays the move found by alpha-beta search within search_time seconds."""
+            super().__init__(name, marker)
+            self.game = game
+            self._difficulty = None
+            self.difficulty = difficulty # None is easy mode, False is intermediate mode, True is hard mode
+            self.is_ai_player = True
+            self.search_time: float = 1.0 # Seconds the hard mode search may take per move
+            self._search: Optional[QubicSearch] = None # Created on the first hard mode move
+
+        @property
+        def difficulty(self) -> Optional[bool]:
+            return self._difficulty
+
+        @difficulty.setter
+        def difficulty(self, value: Optional[bool]) -> None:
+            """Setter for the difficulty attribute, ensuring it's True, False, or None."""
+            if value not in {True, False, None}:
+                raise ValueError("Difficulty must be True, False, or None.")
+            self._difficulty = value
+
+        @property
+        def opponent(self) -> str:
+            return "x" if self.marker == "o" else "o"
+
+        def _sides(self) -> tuple[Side, Side]:
+            masks = self.game.masks
+            return _side_from_mask(masks[self.marker]), _side_from_mask(masks[self.opponent])
+
+        def random_square(self) -> tuple[int, int, int]:
+            """Selects any empty square in the cube."""
+            return square_position(choice(list(_iter_bits(FULL_MASK & ~self.game.occupied))))
+
+        def win_or_block(self) -> Optional[tuple[int, int, int]]:
+            """Completes one of its own lines of three if it can, otherwise blocks a random line of three of the
+            opponent. Returns None if neither player has a line of three."""
+            own, other = self._sides()
+            if wins := _completing_squares(own, other):
+                return square_position((wins & -wins).bit_length() - 1)
+            if blocks := _completing_squares(other, own):
+                return square_position(choice(list(_iter_bits(blocks))))
+            return None
+
+        def extend_line(self) -> Optional[tuple[int, int, int]]:
+            """Plays a random empty square of a random line that holds only its own markers, so the line grows toward a
+            win. Returns None if every line with its markers is blocked."""
+            own, other = self._sides()
+            open_lines = (own[1] | own[2]) & ~(other[1] | other[2] | other[3])
+            if not open_lines:
+                return None
+            line = WINNING_LINES[choice(list(_iter_bits(open_lines)))]
+            return square_position(choice(list(_iter_bits(line & ~self.game.occupied))))
+
+        def search_move(self) -> Optional[tuple[int, int, int]]:
+            """Searches for the best move with alpha-beta search inside the per-move time budget. The search keeps
+            its transposition table from one move to the next. Returns None if the cube is full."""
+            if self._search is None:
+                self._search = QubicSearch()
+            self._search.time_limit = self.search_time
+            masks = self.game.masks
+            square = self._search.best_move(masks[self.marker], masks[self.opponent])
+            return square_position(square) if square is not None else None
+
+        def move(self, board=None) -> Optional[tuple[int, int, int]]:
+            """Selects a move for the AI player based on the play mode of easy, intermediate or hard. The board
+            argument is accepted for the same call as the TicTacToe players; the cube is read from the game.
+            Returns None if the cube is full."""
+            if self.game.board_is_full():
+                return None
+            if self.difficulty is None: # easy mode
+                return self.random_square()
+            if self.difficulty: # hard mode search already finds wins and blocks
+                return self.search_move()
+            return self.win_or_block() or self.extend_line() or self.random_square()
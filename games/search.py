@@ -0,0 +1,266 @@
+"""
+search.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains an alpha-beta search engine for k-in-a-row games on any board size, used by the hard TicTacToe
+AI on boards the solved 3x3 table does not cover. The engine searches with iterative deepening inside a time budget per
+move, remembers positions in a transposition table keyed by the board's Zobrist hash and the marker to move, and orders moves so the best
+ones are searched first: the move stored for the position, wins, blocks, then squares that caused cutoffs before.
+
+The iterative deepening and negamax themselves live in NegamaxSearch, which other games such as Qubic subclass with their
+own move generation, win test and evaluation.
+"""
+from core.board import Board
+
+from time import perf_counter
+from typing import Any, Hashable, Optional, Union
+
+WIN_SCORE = 1_000_000 # Score of a win on the next move, less one for every extra ply needed to reach it
+MATE_BOUND = WIN_SCORE - 10_000 # Scores beyond this are wins or losses rather than evaluations
+# Bound type of a transposition table score
+EXACT, LOWER, UPPER = 0, 1, 2
+Turn = tuple[Union[int, str], Union[int, str]] # Marker to move and its opponent, the position of an AlphaBetaSearch
+
+
+class SearchTimeout(Exception):
+    """Unwinds the search when the time budget runs out."""
+
+
+def to_table(score: int, ply: int) -> int:
+    """Stores win and loss scores as distances from the position rather than from the root."""
+    if score > MATE_BOUND:
+        return score + ply
+    if score < -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def from_table(score: int, ply: int) -> int:
+    """Turns a stored win or loss score back into a distance from the root."""
+    if score > MATE_BOUND:
+        return score - ply
+    if score < -MATE_BOUND:
+        return score + ply
+    return score
+
+
+class NegamaxSearch:
+    """
+    Negamax alpha-beta search with iterative deepening inside a time budget per move, a transposition table and history
+    move ordering. Subclasses describe their game through the position hooks below, where a position is whatever the
+    subclass passes to _deepen() and is always seen from the player to move. Moves are square indices.
+
+    Args:
+        time_limit (float): Seconds allowed per move. The move of the deepest completed iteration is returned.
+        max_depth (int): Optional limit on the search depth in plies. Defaults to searching until the board is full.
+        table_size (int): Maximum number of transposition table entries. The table is cleared when it fills up.
+    """
+
+    def __init__(self, time_limit: float = 1.0, max_depth: Optional[int] = None, table_size: int = 1 << 20):
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.table_size = table_size
+        # Table key of a position mapped to (depth, score, bound type, best move)
+        self._table: dict[Hashable, tuple[int, int, int, Optional[int]]] = {}
+        self._history: dict[int, int] = {} # Square index mapped to how often moves there caused a cutoff
+        self.nodes = 0
+        self.depth_reached = 0
+
+    def clear(self) -> None:
+        """Forgets the transposition table and move history, for example at the start of a new game."""
+        self._table.clear()
+        self._history.clear()
+
+    def _deepen(self, position: Any, empty_count: int) -> int:
+        """Searches the position one ply deeper each iteration until the time budget runs out, the depth limit is
+        reached or the result is forced. Returns the best move of the deepest completed iteration."""
+        self._deadline = perf_counter() + self.time_limit
+        self.nodes = 0
+        self.depth_reached = 0
+        max_depth = empty_count if self.max_depth is None else min(self.max_depth, empty_count)
+
+        best = self._ordered_moves(position, None)[0] # Fallback if not even depth 1 finishes in time
+        for depth in range(1, max_depth + 1):
+            self._root_move = None
+            try:
+                score = self._negamax(position, depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+            except SearchTimeout:
+                break
+            if self._root_move is not None:
+                best = self._root_move
+            self.depth_reached = depth
+            if abs(score) > MATE_BOUND:
+                break # The result is forced, so deeper searches cannot change it
+        return best
+
+    def _negamax(self, position: Any, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Returns the score of the position for the player to move, searched depth plies deep."""
+        self.nodes += 1
+        if not self.nodes & 1023 and perf_counter() > self._deadline:
+            raise SearchTimeout
+
+        if (win := self._winning_move(position)) is not None:
+            if ply == 0:
+                self._root_move = win
+            return WIN_SCORE - ply - 1
+        if self._is_full(position):
+            return 0
+        blocks = self._blocking_moves(position)
+        if len(blocks) > 1 and ply > 0:
+            return -(WIN_SCORE - ply - 2) # Two threats cannot both be blocked
+        if depth == 0:
+            return self._evaluate(position)
+
+        original_alpha = alpha
+        key = self._table_key(position)
+        table_move = None
+        if entry := self._table.get(key):
+            entry_depth, entry_score, bound, table_move = entry
+            if entry_depth >= depth and ply > 0:
+                entry_score = from_table(entry_score, ply)
+                if bound == EXACT:
+                    return entry_score
+                if bound == LOWER:
+                    alpha = max(alpha, entry_score)
+                elif bound == UPPER:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        # A single threat must be blocked, so it is the only move worth searching
+        moves = blocks if blocks else self._ordered_moves(position, table_move)
+        best_score, best_move = -WIN_SCORE - 1, None
+        for move in moves:
+            child = self._play(position, move)
+            try:
+                score = -self._negamax(child, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                self._undo(position, move)
+            if score > best_score:
+                best_score, best_move = score, move
+                if ply == 0:
+                    self._root_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                self._history[move] = self._history.get(move, 0) + depth * depth
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER
+        elif best_score >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        if len(self._table) >= self.table_size:
+            self._table.clear()
+        self._table[key] = (depth, to_table(best_score, ply), bound, best_move)
+        return best_score
+
+    def _winning_move(self, position: Any) -> Optional[int]:
+        """Returns a move that wins straight away for the player to move, or None."""
+        raise NotImplementedError
+
+    def _blocking_moves(self, position: Any) -> list[int]:
+        """Returns every square where the opponent would win on their next move."""
+        raise NotImplementedError
+
+    def _is_full(self, position: Any) -> bool:
+        raise NotImplementedError
+
+    def _evaluate(self, position: Any) -> int:
+        """Scores a quiet position for the player to move."""
+        raise NotImplementedError
+
+    def _table_key(self, position: Any) -> Hashable:
+        """Returns a transposition table key that tells the position apart from every other, including whose turn it is."""
+        raise NotImplementedError
+
+    def _ordered_moves(self, position: Any, table_move: Optional[int]) -> list[int]:
+        """Returns the legal moves of the position, the ones most likely to cause a cutoff first."""
+        raise NotImplementedError
+
+    def _play(self, position: Any, move: int) -> Any:
+        """Plays a move and returns the resulting position, seen from the opponent."""
+        raise NotImplementedError
+
+    def _undo(self, position: Any, move: int) -> None:
+        """Takes back a move made by _play(). Searches with immutable positions have nothing to undo."""
+
+
+class AlphaBetaSearch(NegamaxSearch):
+    """
+    Negamax alpha-beta search for k-in-a-row games where the first player to complete a line of win_value squares
+    wins. Keep one instance per player for a whole game so the transposition table and move history carry over from
+    one move to the next. A position is the Turn to move on the search's copy of the board.
+
+    Args:
+        win_value (int): Number of squares in a row needed to win.
+        time_limit (float): Seconds allowed per move. The move of the deepest completed iteration is returned.
+        max_depth (int): Optional limit on the search depth in plies. Defaults to searching until the board is full.
+        table_size (int): Maximum number of transposition table entries. The table is cleared when it fills up.
+    """
+
+    def __init__(self, win_value: int, time_limit: float = 1.0, max_depth: Optional[int] = None,
+                 table_size: int = 1 << 20):
+        super().__init__(time_limit, max_depth, table_size)
+        self.win_value = win_value
+        # Line weights: a line holding count markers and blanks is worth weights[count]
+        self._weights = tuple(4 ** count for count in range(win_value))
+
+    def best_move(self, board: Board, marker: Union[int, str], opponent: Union[int, str]) -> Optional[tuple[int, int]]:
+        """
+        Searches for the best move of the marker to move. The board is copied so observers of the game board, such as
+        the GUI, never see the search.
+
+        Returns:
+            tuple: The row and column of the best move found, or None if the board is full.
+        """
+        self._board = board.copy()
+        self._counters = self._board.line_counters(self.win_value)
+        self._empty = {index for index, code in enumerate(self._board.codes()) if code == 0}
+        if not self._empty:
+            return None
+        return divmod(self._deepen((marker, opponent), len(self._empty)), self._board.columns)
+
+    def _winning_move(self, position: Turn) -> Optional[int]:
+        wins = self._counters.completing_cells(position[0])
+        return wins[0] if wins else None
+
+    def _blocking_moves(self, position: Turn) -> list[int]:
+        return self._counters.completing_cells(position[1])
+
+    def _is_full(self, position: Turn) -> bool:
+        return not self._empty
+
+    def _table_key(self, position: Turn) -> tuple[int, Union[int, str]]:
+        # The Zobrist hash alone does not say whose turn it is, and the same squares are reached with either player to
+        # move once the first player changes between games
+        return self._board.hash, position[0]
+
+    def _play(self, position: Turn, move: int) -> Turn:
+        marker, opponent = position
+        self._board.push(*divmod(move, self._board.columns), marker)
+        self._empty.discard(move)
+        return opponent, marker
+
+    def _undo(self, position: Turn, move: int) -> None:
+        self._board.pop()
+        self._empty.add(move)
+
+    def _ordered_moves(self, position: Turn, table_move: Optional[int]) -> list[int]:
+        """Orders the empty squares: the stored best move, wins, blocks, then by history and number of lines."""
+        marker, opponent = position
+        cell_lines = self._counters.winning_lines.cell_lines
+        history = self._history
+        ordered = sorted(self._empty, key=lambda index: (-history.get(index, 0), -len(cell_lines[index]), index))
+        first = [table_move] if table_move is not None else []
+        first += self._counters.completing_cells(marker) + self._counters.completing_cells(opponent)
+        return list(dict.fromkeys(first + ordered))
+
+    def _evaluate(self, position: Turn) -> int:
+        """Scores a quiet position by the lines each side can still complete, weighted by how full they are."""
+        marker, opponent = position
+        counters = self._counters
+        return sum(weight * (counters.number_of_lines(marker, count) - counters.number_of_lines(opponent, count))
+                   for count, weight in enumerate(self._weights) if count > 0)
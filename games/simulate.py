@@ -0,0 +1,188 @@
+"""
+simulate.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains a headless self-play runner for the TicTacToe AI players. Games are split into shards that run
+on a process pool, each shard seeding its own worker's random number generator, and the results are added up per
+difficulty pairing and per first mover. Nothing is printed while games are played, so large runs are limited only by
+the speed of the AI.
+
+Usage:
+    python -m games.simulate tictactoe --games 100000 --pairing easy:hard --pairing hard:hard
+"""
+from games.tictactoe import TicTacToe
+
+import argparse
+import os
+import random
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import NamedTuple, Optional
+
+LEVELS = {"easy": None, "intermediate": False, "hard": True}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+# Every pairing of two levels, in the order the old AI test scripts ran them
+DEFAULT_PAIRINGS = ((None, True), (False, True), (True, True), (None, None), (False, False), (None, False))
+
+
+class Shard(NamedTuple):
+    """One block of games played in a single worker with the same players and first mover."""
+    difficulty_one: Optional[bool] # Level of player one, who plays 'x'
+    difficulty_two: Optional[bool] # Level of player two, who plays 'o'
+    x_first: bool
+    games: int
+    seed: str
+    size: int = 3
+    win_value: Optional[int] = None
+
+
+class ShardResult(NamedTuple):
+    x_wins: int
+    o_wins: int
+    draws: int
+    invalid_moves: int
+    unfinished: int # Games stopped with open squares because neither player could make a valid move
+
+
+class SimulationResult(NamedTuple):
+    """Counts of (x_wins, o_wins, draws, invalid_moves, unfinished) keyed by (difficulty one, difficulty two, x_first)."""
+    counts: dict[tuple[Optional[bool], Optional[bool], bool], ShardResult]
+    games: int
+    seconds: float
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else float("inf")
+
+
+def play_shard(shard: Shard) -> ShardResult:
+    """Plays every game of a shard with a freshly seeded random number generator. Runs in a worker process."""
+    random.seed(shard.seed) # The AI players use the module level generator, which is private to each process
+    game = TicTacToe(shard.size, shard.win_value or shard.size)
+    game.add_ai_players_for_testing(shard.difficulty_one, shard.difficulty_two)
+    x_player, o_player = game.players
+    order = (x_player, o_player) if shard.x_first else (o_player, x_player)
+    wins = {"x": 0, "o": 0}
+    draws = invalid_moves = unfinished = 0
+
+    for _ in range(shard.games):
+        game.go_first = shard.x_first
+        # An invalid move only loses the turn, so games run until a win or a full board rather than for board_size turns
+        turn = missed_turns = 0
+        while not game.board_is_full() and missed_turns < 2:
+            player = order[turn % 2]
+            turn += 1
+            row, column = player.move(game.board)
+            if not game.make_move(row, column, player.marker):
+                invalid_moves += 1 # The player loses the turn, as in the interactive games
+                missed_turns += 1
+                continue
+            missed_turns = 0
+            if game.check_winner():
+                break
+        marker = game.get_winner_info()["marker"]
+        if marker in wins:
+            wins[marker] += 1
+        elif game.board_is_full():
+            draws += 1
+        else:
+            unfinished += 1 # Both players missed a turn in a row, so the game cannot go on
+        game.reset_game_state()
+    return ShardResult(wins["x"], wins["o"], draws, invalid_moves, unfinished)
+
+
+def make_shards(pairings, games: int, chunk_size: int, seed: int, size: int = 3,
+                win_value: Optional[int] = None) -> list[Shard]:
+    """
+    Splits the games of every pairing into shards of at most chunk_size games, half with 'x' moving first and half
+    with 'o' moving first. Shard seeds depend only on the base seed and the shard's position, so results are the same
+    for any number of workers.
+    """
+    shards = []
+    for difficulty_one, difficulty_two in pairings:
+        for x_first, first_games in ((True, (games + 1) // 2), (False, games // 2)):
+            for start in range(0, first_games, chunk_size):
+                shards.append(Shard(difficulty_one, difficulty_two, x_first, min(chunk_size, first_games - start),
+                                    f"{seed}:{len(shards)}", size, win_value))
+    return shards
+
+
+def simulate(pairings=DEFAULT_PAIRINGS, games: int = 10000, workers: Optional[int] = None, seed: int = 0,
+             chunk_size: int = 1000, size: int = 3, win_value: Optional[int] = None) -> SimulationResult:
+    """
+    Plays AI versus AI games for every pairing of difficulty levels.
+
+    Args:
+        pairings: Pairs of (player one, player two) difficulty levels, None for easy, False for intermediate and True
+            for hard. Player one plays 'x'.
+        games (int): Games per pairing, split evenly between the two first movers.
+        workers (int): Number of worker processes. Defaults to the number of CPUs. 1 plays every game in this process.
+        seed (int): Base seed of the shard random number generators.
+        chunk_size (int): Maximum number of games per shard.
+        size (int): Board dimension.
+        win_value (int): Number of markers in a row needed to win. Defaults to the board dimension.
+
+    Returns:
+        SimulationResult: Totals per pairing and first mover, with the number of games and the wall clock time.
+    """
+    shards = make_shards(pairings, games, chunk_size, seed, size, win_value)
+    start = perf_counter()
+    if workers == 1:
+        results = list(map(play_shard, shards))
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            results = list(executor.map(play_shard, shards))
+    seconds = perf_counter() - start
+
+    totals = defaultdict(lambda: [0] * len(ShardResult._fields))
+    for shard, result in zip(shards, results):
+        total = totals[(shard.difficulty_one, shard.difficulty_two, shard.x_first)]
+        for index, value in enumerate(result):
+            total[index] += value
+    counts = {key: ShardResult(*total) for key, total in totals.items()}
+    return SimulationResult(counts, sum(shard.games for shard in shards), seconds)
+
+
+def format_result(result: SimulationResult) -> str:
+    """Returns a plain text table of a simulation result."""
+    lines = [f"{'Player X':<13}{'Player O':<13}{'First':<7}{'X wins':>10}{'O wins':>10}{'Draws':>10}{'Invalid':>9}{'Unfinished':>12}"]
+    for (difficulty_one, difficulty_two, x_first), counts in result.counts.items():
+        lines.append(f"{LEVEL_NAMES[difficulty_one]:<13}{LEVEL_NAMES[difficulty_two]:<13}{'x' if x_first else 'o':<7}"
+                     f"{counts.x_wins:>10}{counts.o_wins:>10}{counts.draws:>10}{counts.invalid_moves:>9}"
+                     f"{counts.unfinished:>12}")
+    lines.append(f"{result.games} games in {result.seconds:.2f}s ({result.games_per_second:,.0f} games per second)")
+    return "\n".join(lines)
+
+
+def parse_pairing(text: str) -> tuple[Optional[bool], Optional[bool]]:
+    """Parses a pairing such as 'easy:hard' into a pair of difficulty levels."""
+    try:
+        one, two = text.lower().split(":")
+        return LEVELS[one], LEVELS[two]
+    except (ValueError, KeyError):
+        raise argparse.ArgumentTypeError(f"Invalid pairing '{text}'. Use two of {', '.join(LEVELS)} joined by ':'.")
+
+
+def main(arguments: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m games.simulate", description="Headless AI versus AI self-play.")
+    parser.add_argument("game", choices=["tictactoe"])
+    parser.add_argument("--games", type=int, default=10000, help="games per pairing (default: 10000)")
+    parser.add_argument("--pairing", type=parse_pairing, action="append", dest="pairings",
+                        help="player one and player two levels, such as easy:hard. Can be repeated. Defaults to "
+                             "every pairing of two levels.")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: number of CPUs)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=1000, help="games per shard (default: 1000)")
+    parser.add_argument("--size", type=int, default=3, help="board dimension (default: 3)")
+    parser.add_argument("--win-value", type=int, default=None, help="markers in a row to win (default: size)")
+    args = parser.parse_args(arguments)
+
+    result = simulate(args.pairings or DEFAULT_PAIRINGS, args.games, args.workers, args.seed, args.chunk_size,
+                      args.size, args.win_value)
+    print(format_result(result))
+
+
+if __name__ == "__main__":
+    main()
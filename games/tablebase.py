@@ -0,0 +1,328 @@
+"""
+tablebase.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains an offline generator and a memory mapped reader for TicTacToe tablebases, such as 4x4 boards
+with 3 or 4 in a row. The generator solves the game by retrograde analysis with NumPy: positions are grouped in layers
+by the number of markers on the board and the layers are solved from the full board back to the empty board, so every
+position is solved from its already solved children.
+
+Every position with a legal number of markers has its own byte in the file, found with a perfect hash: the colex rank
+of the occupied squares combined with the colex rank of the first player's squares among them. Symmetric positions
+share a value, but storing them all lets a lookup read one byte without canonicalizing the board first. A 4x4 file is
+about 10 MB. The reader maps it with mmap, so opening a tablebase reads nothing until a position is looked up.
+
+Run `python -m games.tablebase --size 4 --win-value 4` to write games/data/tictactoe_4x4_k4.tb.
+"""
+from core.board import Board, get_winning_lines, load_numpy, marker_code
+
+import argparse
+import mmap
+import os
+import struct
+from itertools import combinations
+from math import comb
+from typing import Optional, Union
+
+MAGIC = b"SGTB"
+FORMAT_VERSION = 1
+# Magic, format version, rows, columns and win value, followed by the start of each layer as cells + 2 uint64 offsets
+_HEADER = struct.Struct("<4sBBBB")
+DATA_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+MAX_CELLS = 25 # Squares are kept in uint32 masks and a 5x5 file would already be several GB
+
+# Result of a position for the player to move, kept in the top two bits of its byte. The low six bits are the number
+# of plies until the game ends with perfect play: winners take the fastest win and losers the slowest loss.
+DRAW, WIN, LOSS, INVALID = 0, 1, 2, 3 # INVALID marks positions that cannot be reached, such as both players winning
+RESULT_NAMES = {DRAW: "draw", WIN: "win", LOSS: "loss", INVALID: "invalid"}
+
+
+def tablebase_path(rows: int, columns: int, win_value: int) -> str:
+    """Default location of the tablebase of a board size and win value."""
+    shape = f"{rows}x{columns}" if rows != columns else f"{rows}x{rows}"
+    return os.path.join(DATA_DIRECTORY, f"tictactoe_{shape}_k{win_value}.tb")
+
+
+def layer_offsets(cells: int) -> list[int]:
+    """Index of the first position of each layer, where layer n holds every position with n markers, plus the total."""
+    offsets = [0]
+    for markers in range(cells + 1):
+        offsets.append(offsets[-1] + comb(cells, markers) * comb(markers, (markers + 1) // 2))
+    return offsets
+
+
+def position_index(first_mask: int, second_mask: int, cells: int, offsets: list[int]) -> int:
+    """
+    Perfect hash of a position given the squares of the player who moved first and the player who moved second.
+
+    Raises:
+        ValueError: If the number of markers of each player is not possible in a game.
+    """
+    occupied = first_mask | second_mask
+    markers = occupied.bit_count()
+    first_count = (markers + 1) // 2
+    if first_mask & second_mask or first_mask.bit_count() != first_count:
+        raise ValueError("Position cannot be reached: the first player must have the same number of markers as the "
+                         "second player or one more.")
+    occupied_rank = pattern_rank = seen = seen_first = 0
+    for square in range(cells):
+        if occupied >> square & 1:
+            seen += 1
+            occupied_rank += comb(square, seen)
+            if first_mask >> square & 1:
+                seen_first += 1
+                pattern_rank += comb(seen - 1, seen_first)
+    return offsets[markers] + occupied_rank * comb(markers, first_count) + pattern_rank
+
+
+def move_score(child_value: int) -> int:
+    """
+    Scores a move for the player who made it from the value of the position it leads to, which is stored for the
+    opponent: faster wins score highest, then draws, then slower losses.
+    """
+    result, distance = child_value >> 6, (child_value & 63) + 1
+    if result == LOSS:
+        return 100 - distance
+    if result == WIN:
+        return distance - 100
+    return 0 if result == DRAW else -1000
+
+
+def _rank_array(np, first, second, cells: int, markers: int):
+    """Vectorized position_index() within a layer, for arrays of uint32 masks."""
+    occupied = first | second
+    first_count = (markers + 1) // 2
+    binomial = np.array([[comb(n, k) for k in range(cells + 1)] for n in range(cells + 1)], dtype=np.int64)
+    occupied_rank = np.zeros(len(first), dtype=np.int64)
+    pattern_rank = np.zeros(len(first), dtype=np.int64)
+    seen = np.zeros(len(first), dtype=np.int64)
+    seen_first = np.zeros(len(first), dtype=np.int64)
+    for square in range(cells):
+        is_occupied = ((occupied >> square) & 1).astype(bool)
+        seen += is_occupied
+        occupied_rank += np.where(is_occupied, binomial[square, np.minimum(seen, cells)], 0)
+        is_first = ((first >> square) & 1).astype(bool)
+        seen_first += is_first
+        pattern_rank += np.where(is_first, binomial[np.maximum(seen - 1, 0), seen_first], 0)
+    return occupied_rank * comb(markers, first_count) + pattern_rank
+
+
+def _layer_positions(np, cells: int, markers: int):
+    """Returns the first and second player masks of every position in a layer, ordered by position index."""
+    first_count = (markers + 1) // 2
+    occupied = list(combinations(range(cells), markers))
+    patterns = list(combinations(range(markers), first_count))
+    squares = np.array(occupied, dtype=np.uint32).reshape(len(occupied), markers)
+    first = np.zeros((len(occupied), len(patterns)), dtype=np.uint32)
+    for pattern_index, pattern in enumerate(patterns):
+        for position in pattern:
+            first[:, pattern_index] |= np.uint32(1) << squares[:, position]
+    occupied_masks = np.array([sum(1 << square for square in combo) for combo in occupied], dtype=np.uint32)
+    first = first.reshape(-1)
+    second = np.repeat(occupied_masks, len(patterns)) ^ first
+    order = np.argsort(_rank_array(np, first, second, cells, markers))
+    return first[order], second[order]
+
+
+def _has_line(np, masks, line_masks):
+    found = np.zeros(len(masks), dtype=bool)
+    for line in line_masks:
+        found |= (masks & line) == line
+    return found
+
+
+def solve(rows: int, columns: int, win_value: int) -> list:
+    """
+    Solves every position of a board size and win value by retrograde analysis.
+
+    Returns:
+        list: One uint8 NumPy array of values per layer, indexed by the position index within the layer.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If the board has more than MAX_CELLS squares.
+    """
+    np = load_numpy()
+    cells = rows * columns
+    if cells > MAX_CELLS:
+        raise ValueError(f"Tablebases are limited to {MAX_CELLS} squares.")
+    line_masks = [np.uint32(sum(1 << index for index in line))
+                  for line in get_winning_lines(rows, columns, win_value).lines]
+    layers = [None] * (cells + 1)
+
+    for markers in range(cells, -1, -1):
+        first, second = _layer_positions(np, cells, markers)
+        mover, other = (first, second) if markers % 2 == 0 else (second, first)
+        invalid = _has_line(np, mover, line_masks) # The player to move cannot already have a line
+        lost = _has_line(np, other, line_masks) & ~invalid # The player who just moved has won
+        values = np.zeros(len(first), dtype=np.uint8) # Full boards without a line are draws
+        values[invalid] = INVALID << 6
+        values[lost] = LOSS << 6
+        active = ~(invalid | lost)
+
+        if markers < cells:
+            children = layers[markers + 1]
+            child_scores = np.array([move_score(value) for value in range(256)], dtype=np.int16)
+            best = np.full(len(first), -1000, dtype=np.int16)
+            occupied = first | second
+            for square in range(cells):
+                bit = np.uint32(1 << square)
+                playable = active & ((occupied & bit) == 0)
+                if not playable.any():
+                    continue
+                moved = mover[playable] | bit
+                if markers % 2 == 0:
+                    child_first, child_second = moved, second[playable]
+                else:
+                    child_first, child_second = first[playable], moved
+                child_values = children[_rank_array(np, child_first, child_second, cells, markers + 1)]
+                best[playable] = np.maximum(best[playable], child_scores[child_values])
+            won, drawn, losing = active & (best > 0), active & (best == 0), active & (best < 0) & (best > -1000)
+            values[won] = (WIN << 6) | (100 - best[won]).astype(np.uint8)
+            values[drawn] = DRAW << 6
+            values[losing] = (LOSS << 6) | (best[losing] + 100).astype(np.uint8)
+        layers[markers] = values
+    return layers
+
+
+def write_tablebase(rows: int, columns: int, win_value: int, path: Optional[str] = None) -> str:
+    """Solves a board size and win value and writes the tablebase file. Returns the path written."""
+    path = path or tablebase_path(rows, columns, win_value)
+    layers = solve(rows, columns, win_value)
+    offsets = layer_offsets(rows * columns)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, rows, columns, win_value))
+        file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        for values in layers:
+            file.write(values.tobytes())
+    return path
+
+
+class Tablebase:
+    """
+    Read-only, memory mapped TicTacToe tablebase. Use as a context manager, or keep one open for the life of the
+    program with open_tablebase().
+
+    Args:
+        path (str): File written by write_tablebase().
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # mmap cannot map an empty file
+            self._file.close()
+            raise ValueError("File is too short to be a tablebase.")
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError("File is too short to be a tablebase.")
+        magic, version, self.rows, self.columns, self.win_value = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError("File is not a supported tablebase.")
+        self.cells = self.rows * self.columns
+        count = self.cells + 2
+        self.offsets = list(struct.unpack_from(f"<{count}Q", self._map, _HEADER.size))
+        self._body = _HEADER.size + 8 * count
+        if len(self._map) != self._body + self.offsets[-1]:
+            self.close()
+            raise ValueError("Tablebase file is truncated.")
+
+    def _masks(self, board: Board, first_marker: Union[int, str], second_marker: Union[int, str]) -> tuple[int, int]:
+        if (board.rows, board.columns) != (self.rows, self.columns):
+            raise ValueError(f"Board of size ({board.rows}x{board.columns}) does not match the tablebase size "
+                             f"({self.rows}x{self.columns}).")
+        first_code, second_code = marker_code(first_marker), marker_code(second_marker)
+        first = second = 0
+        for square, code in enumerate(board.codes()):
+            if code == first_code:
+                first |= 1 << square
+            elif code == second_code:
+                second |= 1 << square
+        return first, second
+
+    def _value(self, first: int, second: int) -> int:
+        return self._map[self._body + position_index(first, second, self.cells, self.offsets)]
+
+    def probe(self, board: Board, first_marker: Union[int, str] = "x",
+              second_marker: Union[int, str] = "o") -> tuple[str, int]:
+        """
+        Looks up a position.
+
+        Args:
+            board (Board): Board of the tablebase size.
+            first_marker (Union[int, str]): Marker of the player who moved first.
+            second_marker (Union[int, str]): Marker of the player who moved second.
+
+        Returns:
+            tuple: 'win', 'loss', 'draw' or 'invalid' for the player to move, and the number of plies until the game
+            ends with perfect play.
+        """
+        value = self._value(*self._masks(board, first_marker, second_marker))
+        return RESULT_NAMES[value >> 6], value & 63
+
+    def best_moves(self, board: Board, first_marker: Union[int, str] = "x",
+                   second_marker: Union[int, str] = "o") -> list[tuple[int, int]]:
+        """Returns the row and column of every optimal move of the player to move, or an empty list if the game is
+        over. Each move costs one byte lookup."""
+        first, second = self._masks(board, first_marker, second_marker)
+        value = self._value(first, second)
+        if value >> 6 == INVALID or value == LOSS << 6:
+            return [] # The game is already over
+        first_to_move = first.bit_count() == second.bit_count()
+        best_score, moves = None, []
+        for square in range(self.cells):
+            if (first | second) >> square & 1:
+                continue
+            if first_to_move:
+                child = self._value(first | 1 << square, second)
+            else:
+                child = self._value(first, second | 1 << square)
+            child_score = move_score(child)
+            if best_score is None or child_score > best_score:
+                best_score, moves = child_score, [divmod(square, self.columns)]
+            elif child_score == best_score:
+                moves.append(divmod(square, self.columns))
+        return moves
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "Tablebase":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+_opened: dict[tuple[int, int, int], Tablebase] = {} # Only successful opens, so a tablebase generated later is found
+
+
+def open_tablebase(rows: int, columns: int, win_value: int) -> Optional[Tablebase]:
+    """Opens the default tablebase of a board size and win value once, or returns None if it has not been generated."""
+    key = (rows, columns, win_value)
+    if key not in _opened:
+        path = tablebase_path(rows, columns, win_value)
+        if not os.path.exists(path):
+            return None
+        _opened[key] = Tablebase(path)
+    return _opened[key]
+
+
+def main(arguments: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m games.tablebase", description="Generates a TicTacToe tablebase.")
+    parser.add_argument("--size", type=int, default=4, help="board dimension (default: 4)")
+    parser.add_argument("--win-value", type=int, action="append", dest="win_values",
+                        help="markers in a row to win. Can be repeated. Defaults to 3 and 4.")
+    args = parser.parse_args(arguments)
+    for win_value in args.win_values or [3, 4]:
+        path = write_tablebase(args.size, args.size, win_value)
+        print(f"Wrote {os.path.getsize(path)} bytes to {path}")
+
+
+if __name__ == "__main__":
+    main()
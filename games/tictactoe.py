@@ -1,22 +1,27 @@
 """
 tictactoe.py 
 Author: Robert Pal
-Updated: 2025-08-06
+Updated: 2026-10-18
 
 This module contains code for tictactoe.
 """
-from core.board import Board, LineChecker
+from core.board import Board, LineChecker, marker_code
 from core.player import Player
+from games import tablebase, tictactoe_table
+from games.mcts import MonteCarloTreeSearch
+from games.search import AlphaBetaSearch
 
-from collections import Counter
 from random import choice, randint
 from typing import List, Tuple, Union, Optional
 
 
 class TicTacToe:
+    board_class = Board # Board storage backend, can be swapped for core.bitboard.BitBoard for AI self-play
+    symmetries = None # Every rotation and reflection of the square board, the default of Board.canonical()
 
-    def __init__(self, board_dimension: int=3):
+    def __init__(self, board_dimension: int=3, win_value: int=3):
          self._dimension: int = board_dimension
+         self.win_value: int = win_value # Number of markers in a row needed to win
          self.board: List[List] = self.create_board()
          self.move_list: List = []
          self.round_count: int = 0
@@ -25,7 +30,7 @@ class TicTacToe:
          self.winner_marker: str = None
          self.win_type: str = None
          self.win_index: int = None
-         self.__win: LineChecker = LineChecker(self.board, 3)
+         self.__win: LineChecker = LineChecker(self.board, self.win_value)
          self.players = self.create_human_players() # Default to two player mode
 
     @property
@@ -34,7 +39,7 @@ class TicTacToe:
         return self._dimension
 
     def create_board(self):
-        return Board(self.dimension, self.dimension)
+        return self.board_class(self.dimension, self.dimension)
 
     def create_human_players(self) -> Tuple[Player, Player]:
         return (
@@ -95,12 +100,20 @@ class TicTacToe:
 
     def make_move(self, row: int, col: int, marker: str):
         if self.is_valid(row, col):
-            self.board.add_to_square(row, col, marker)
+            self.board.push(row, col, marker) # Move stack on the board allows constant time undo and AI lookahead
             self.move_list.append((row, col))
             self.round_count += 1
             return True
         return False
 
+    def undo_move(self) -> Optional[tuple[int, int]]:
+        """Takes back the last move played. Returns the row and column of the removed move, or None if no moves have been played."""
+        if not self.move_list:
+            return None
+        self.board.pop()
+        self.round_count -= 1
+        return self.move_list.pop()
+
     def reset_board(self) -> None:
         """Sets each square in the board to a blank."""
         self.board.reset_board()
@@ -111,6 +124,9 @@ class TicTacToe:
         self.move_list = []
         self.round_count = 0
         self.go_first = not self.go_first
+        for player in self.players:
+            if isinstance(player, self.AIPlayer):
+                player.reset_search()
 
     def update_ai_player_level(self, difficulty: bool):
         for player in self.players:
@@ -147,6 +163,9 @@ class TicTacToe:
         self.win_index = winner_info.get(self.win_type, -1)
 
     def check_winner(self):
+        """Checks the board for a winning condition. Only the lines through the last move are checked once a move has been played."""
+        if self.move_list:
+            return self.__win.check_from_move(*self.move_list[-1]) is not None
         return self.__win._check_for_winner()
 
     def get_player(self, index: int):
@@ -158,6 +177,10 @@ class TicTacToe:
     def get_winner_info(self):
         return self.__win.get_win_info()
 
+    def get_winning_cells(self) -> set[tuple[int, int]]:
+        """Returns the row and column of every square in every complete line, for highlighting the win."""
+        return self.__win.get_winning_cells()
+
     def reset_winner(self):
         self.__win.reset_win_info()
         self.winner_name = None
@@ -188,6 +211,9 @@ class TicTacToe:
             self._marker = value.lower()  # Directly set the private attribute
 
     class AIPlayer(Player):
+        # Methods that can answer a move, wrapped by games.tracing.DecisionTracer while a tracer is attached
+        TRACED_BRANCHES = ("win_or_block", "check_fork", "two_blanks", "random_ints", "table_move", "tablebase_move",
+                           "search_move")
 
         def __init__(self, name: str = 'CPU', marker: str = "o", difficulty: bool = False, game: 'TicTacToe' = None):
             """AIPlayer is a child class of Player and contains all the functionality for a one-player game
@@ -198,8 +224,8 @@ class TicTacToe:
             self._difficulty = None  # Backing private attribute
             self.difficulty = difficulty  # None is easy mode, False is intermediate mode, True is hard mode
             self.is_ai_player = True
-            self.corners = [(0, 0), (0, 2), (2, 0), (2, 2)]
-            self.insides = [(0, 1), (1, 0), (1, 2), (2, 1)]
+            self.search_time: float = 1.0 # Seconds the hard mode search may take per move on boards larger than 3x3
+            self._search: Optional[AlphaBetaSearch] = None # Created on the first search so 3x3 games never build one
 
         @property
         def difficulty(self) -> Optional[bool]:
@@ -214,17 +240,18 @@ class TicTacToe:
             self._difficulty = value
 
 
-        def get_fork_index(self, lines: list[Union[str, int]]) -> Optional[Union[int, bool]]:
-            """Finds the position of a branch of a fork. Returns an integer of the row or column index
-            if there is a column or row with a branch of a fork. Returns True if there is a diagonal fork 
-            branch position. Returns None if no fork branch is found."""
-            for index, line in enumerate(lines):
-                fork = Counter(line)
-                if fork["o"] == 1 and fork[0] == 2:
-                    if len(lines) == 1:  # this is for the two diagonals which are just a 1x3 matrix
+        def get_fork_index(self, line_ids: list[int], win_type: str) -> Optional[Union[int, bool]]:
+            """Finds the position of a branch of a fork from the ids of the lines with one 'o' and two blanks. Returns an 
+            integer of the row or column index of the first row or column with a branch of a fork. Returns True if the 
+            diagonal of the win type is a fork branch. Returns None if no fork branch is found."""
+            winning_lines = self.game.board.line_counters(self.game.win_value).winning_lines
+            type_ids = winning_lines.type_ranges[win_type]
+            for line_id in line_ids:
+                if line_id in type_ids:
+                    if win_type.endswith("diagonal"):  # there is only the one diagonal of each type on the board
                         return True
-                    else:
-                        return index
+                    _, row, column = winning_lines.line_info[line_id]
+                    return row if win_type == "row" else column
             else:
                 return
 
@@ -240,16 +267,15 @@ class TicTacToe:
             # list of all potential forks on a board after a given move by a human player
             fork_positions = []
 
-            rows = self.game.board.get_rows()
-            columns = self.game.board.get_columns()
+            # lines with one own marker and two blanks come straight from the board's line counters without rescanning
+            branch_lines = self.game.board.line_counters(self.game.win_value).lines_with(self.marker, 1)
 
             # check rows, columns and two diagonals to get an index of any fork position for row/col,
             # or T/F for diagonal fork position
-            fork_row_index = self.get_fork_index(rows)
-            fork_column_index = self.get_fork_index(columns)
-            fork_diagonal_right = self.get_fork_index(
-                self.game.board.get_diagonals(3, "right"))  # get_fork_index only accepts a list of lines or 2D array
-            fork_diagonal_left = self.get_fork_index(self.game.board.get_diagonals(3, "left"))
+            fork_row_index = self.get_fork_index(branch_lines, "row")
+            fork_column_index = self.get_fork_index(branch_lines, "column")
+            fork_diagonal_right = self.get_fork_index(branch_lines, "right_diagonal")
+            fork_diagonal_left = self.get_fork_index(branch_lines, "left_diagonal")
 
             # check for all forks: a fork is the intersection of a row and column or an intersection of a row or column
             # and a diagonal. For any fork in a row and column intersection or a row and diagonal intersection
@@ -289,330 +315,130 @@ class TicTacToe:
                 return  # no forks were found
 
         def two_blanks(self, board) -> Optional[tuple[int, int]]:
-            """Finds any line with two blanks and one 'O' marker. Used as alternative to random 
+            """Finds any line with two blanks and one of the player's markers. Used as alternative to random 
             integers and allows for possibility of victory. Returns row and column index else None."""
-            rows = self.game.board.get_rows()
-            columns = self.game.board.get_columns()
-            diagonals = [self.game.board.get_diagonals(3, "right")[0],
-                        self.game.board.get_diagonals(3, "left")[0]]  # right diagonal is index 0, and left is index 1
-
-            line_checker = LineChecker.two_blanks # use static method that finds a row with two blanks and an 'o' marker
-
-            # returns the first found unoccupied square in a line with two blanks for intermediate mode or for possible hard mode win
-            for index, row in enumerate(rows):
-                check_row = line_checker(row, "o", 1)
-                if check_row:
-                    col = choice(check_row["o"][0]["window_indices"])
-                    return index, col
-
-            for index, col in enumerate(columns):
-                check_col = line_checker(col, "o", 1)
-                if check_col:
-                    row = choice(check_col["o"][0]["window_indices"])
-                    return row, index
-
-            for index, diag in enumerate(diagonals):
-                check_diag = line_checker(diag, "o", 1)
-                if check_diag:
-                    window_indices = check_diag["o"][0]["window_indices"]
-                    if index == 0:  # Right diagonal
-                        row = col = choice(window_indices)
-                    else:  # Left diagonal
-                        row = choice(window_indices)
-                        col = 2 - row
-
-                    return row, col
+            line_counters = self.game.board.line_counters(self.game.win_value) # rows, columns, then right and left diagonals
+
+            # returns a random unoccupied square in the first line with two blanks for intermediate mode or for possible hard mode win
+            for line_id in line_counters.lines_with(self.marker, 1):
+                return divmod(choice(line_counters.blank_cells(line_id)), self.game.board.columns)
 
         def random_ints(self, board: Board) -> tuple[int, int]:
             """Selects any open random positions on the board. Returns row and column index."""
-            row = randint(0, 2)
-            column = randint(0, 2)
+            last_row, last_column = self.game.board.rows - 1, self.game.board.columns - 1
+            row = randint(0, last_row)
+            column = randint(0, last_column)
             while self.game.board.square_is_occupied(row, column):
-                # print(f"Row {row}, Col {column}")
-                row = randint(0, 2)
-                column = randint(0, 2)
+                row = randint(0, last_row)
+                column = randint(0, last_column)
 
             return row, column
 
-        def defence_mode(self, board: Board) -> tuple[int, int]:
-            """AI strategy for when the computer plays second. Strategy is based on the first move
-            by the human player. The AI always optimizes for a win or draw. Returns optimal move."""
-
-
-            def assert_test(two_ints: tuple[int, int]):
-                assert len(two_ints) == 2
-                a, b = two_ints
-                assert a is not None
-                assert b is not None
-
-
-            r, c = self.game.move_list[0]
-            if self.game.round_count == 1:
-
-                if (r, c) == (1, 1):
-                    move = choice(self.corners)
-                    # print(*move)
-                    assert move is not None
-                    assert_test(move)
-                    # move = choice(self.corners)
-                else:
-                    move = 1, 1
-
-                return move
-
-            elif self.game.round_count == 3:
-                if (r, c) == (1, 1):
-                    # Only triggered when the opposite corner to the move in previous round was played by player X
-                    for corner in self.corners:
-                        if not self.game.board.square_is_occupied(*corner):  # randomly select one of the two free corners
-                            move = corner
-                            assert move is not None
-                            assert_test(move)
-                            return move#corner
-                elif (r, c) in self.corners:
-                    if not self.game.board.square_is_occupied((r + 2) % 4, (c + 2) % 4):
-                        move = (r + 2) % 4, (c + 2) % 4
-                        assert_test(move)
-                        assert move is not None
-                        return move#(r + 2) % 4, (c + 2) % 4
-                    else:
-                        move = choice(self.insides)
-                        assert_test(move)
-                        assert move is not None
-                        return move#choice(self.insides)
-                elif (r, c) in self.insides:
-                    r1, c1 = self.game.move_list[2]
-                    if (r1, c1) in self.insides:
-                        if r == 1:
-                            move = choice([0, 2]), c
-                            assert move is not None
-                            assert_test(move)
-                            return move#choice([0, 2]), c
-                        else:
-                            move = r, choice([0, 2])
-                            assert move is not None
-                            assert_test(move)
-                            return move#r, choice([0, 2])
-                    else:
-                        if r == 1:
-                            move = r1, c
-                            assert move is not None
-                            assert_test(move)
-                            return r1, c
-                        else:
-                            move = r, c1
-                            assert move is not None
-                            assert_test(move)
-                            return r, c1
-
-            elif self.game.round_count == 5:
-                if (r, c) == (1, 1):
-                    r, c = self.game.move_list[4]
-                    # find a two blank strategy and place in same row or column as the last x move
-                    if self.game.board.get_rows()[r].count(0) == 1:
-                        move = r, (c + 2) % 4
-                        assert move is not None
-                        assert_test(move)
-                    elif self.game.board.get_columns()[c].count(0) == 1:
-                        move = (r + 2) % 4, c
-                        assert move is not None
-                        assert_test(move)
-
-                elif (r, c) in self.corners:
-# Might need this two blank strategy to keep win alive
-                    # if move := self.two_blanks(self.game.board):
-                    #     return move
-
-                    for corner in self.corners:
-                        if not self.game.board.square_is_occupied(*corner):
-                            move = corner
-                            assert move is not None
-                            assert_test(move)
-
-                elif move := self.two_blanks(self.game.board):
-                    assert move is not None
-                    assert_test(move)
-                    return move
-
-                else:
-                    print("IM HERE!!!!")
-                    print(self.game.move_list)
-                    print(self.game.board)
-                    move = self.random_ints(self.game.board)
-                    print(f"MOVE {move}")
-                return move
-
-            else:
-                if move := self.two_blanks(self.game.board):
-                    assert move is not None
-                    assert_test(move)
-                    return move
-                else:
-                    move = self.random_ints(self.game.board)
-
-                    assert move is not None
-                    assert_test(move)
-                    return move#self.random_ints(self.game.board)
-
-        def offence_mode(self, board: Board) -> tuple[int, int]:
-            """AI strategy for when the computer plays first. Strategy is based on the first move by the
-            computer and human player. The AI always optimizes for a win or draw. Returns optimal move."""
-            # for testing purposes so hard mode can play versus hard mode used by TestGame class; otherwise, ignored
-            # if self.game.round_count % 2 == 0:
-            #     return self.defence_mode(self.game.board)
-
-            if self.game.round_count == 0:
-                # Only allow for corner or centre start to guarantee a win or draw
-                starts = self.corners + [(1, 1)]
-                return choice(starts)  # add element of randomness to first move
-
-            elif self.game.round_count == 2:
-                r, c = self.game.move_list[0]
-                if (r, c) == (1, 1):
-                    if self.game.move_list[1] not in self.corners:
-                        move = choice(self.corners)
-                    else:
-                        r, c = self.game.move_list[1]
-                        move = (r + 2) % 4, (c + 2) % 4
-
-                elif (r, c) in self.corners:
-                    if self.game.move_list[1] == (1, 1):
-                        # print("HERE")
-
-                        # move = (r + 2) % 4, c
-                        move = (r + 2) % 4, (c + 2) % 4
-
-                    elif self.game.move_list[1] in self.corners:
-                        for corner in self.corners:
-                            if self.game.board.square_is_occupied(*corner):
-                                pass
-                            else:
-                                move = corner
-
-                    elif self.game.move_list[1] in self.insides:
-                        for i in range(3):
-                            if self.game.board.get_rows()[r - i].count("x") == 1:
-                                if self.game.board.square_is_occupied(1, c):
-                                    pass
-                                else:
-                                    move = ((r + 2) % 4), c
-                            elif self.game.board.get_columns()[c].count("x") == 1:
-                                move = r, ((c + 2) % 4)
-                return move
-
-            elif self.game.round_count == 4:
-                if move := self.check_fork(self.game.board):
-                    return move
-
-                elif self.game.move_list[1] in self.corners:
-                    for move in self.corners:
-                        if self.game.board.square_is_occupied(*move):
-                            pass
-                        else:
-                            return move
-                elif move := self.two_blanks(self.game.board):
-                    return move
-
-                else:
-                    return self.random_ints(self.game.board)
-
-            else:
-                if move := self.two_blanks(self.game.board):
-                    return move
-
-                return self.random_ints(self.game.board)
-
         def win_or_block(self, board: Board) -> Optional[tuple[int, int]]:
             """Checks for a win or block. Selects the first found win position or a random block position if there are
             more than one block moves."""
-            block_positions = []  # Makes a list of all possible blocking points on the board of the opponent
-
-            lines = [self.game.board.get_rows(),
-                    self.game.board.get_columns(),
-                    self.game.board.get_diagonals(3, "right"),
-                    self.game.board.get_diagonals(3, "left")
-                    ]
-
-            line_checker = LineChecker.line_check
-
-            def get_blank_index(line_checker_dictionary): # guarantees the index for each function call below
-                if found_blank := line_checker_dictionary.get("o"):
-                    return found_blank[0]["first_index"]
-                return line_checker_dictionary.get("x")[0]["first_index"]
-
-
-            for indicator, line in enumerate(lines): # check top to bottom rows, columns, right and left diagonals
-
-                for index, squares in enumerate(line):
-                    # check for one blank and two marker pattern 
-                    check_line = line_checker(squares, target_element=0, target_count=1, other_element="any", other_count=2, window_size=3)
-                    if check_line: # if line checker dictionary is not empty, it must have found either an 'o' or 'x' only 
-                        blank_index = get_blank_index(check_line)
-                        if indicator == 0: # 0 indicates the line of squares is a row, so index is row index and blank_index is the column index
-                            if "o" in check_line.keys():
-                                return index, blank_index
-                            else:
-                                block_positions.append([index, blank_index])
-
-                        elif indicator == 1: # 1 indicates the line of squares is a column
-                                if "o" in check_line.keys():
-                                    return blank_index, index
-                                else:
-                                    block_positions.append([blank_index, index])
-
-                        elif indicator == 2: # 2 indicates the line of squares is a right diagonal
-                                if "o" in check_line.keys():
-                                    return blank_index, blank_index
-                                else:
-                                    block_positions.append([blank_index, blank_index])
-
-                        else: # 3 or else indicates the line of squares is a left diagonal
-                                if "o" in check_line.keys():
-                                    return blank_index, 2 - blank_index
-                                else:
-                                    block_positions.append([blank_index, 2 - blank_index])
+            line_counters = self.game.board.line_counters(self.game.win_value) # rows, columns, then right and left diagonals
+            columns = self.game.board.columns
+            opponent = "x" if self.marker == "o" else "o"
+
+            # lines with two of the same marker and one blank are looked up in the line counters instead of scanned
+            for line_id in line_counters.lines_with(self.marker, self.game.win_value - 1):
+                return divmod(line_counters.blank_cells(line_id)[0], columns)
+
+            # Makes a list of all possible blocking points on the board of the opponent
+            block_positions = [list(divmod(line_counters.blank_cells(line_id)[0], columns))
+                               for line_id in line_counters.lines_with(opponent, self.game.win_value - 1)]
             if block_positions:
                 # Use randomly selected block position from max of three for variety sake
                 return block_positions[randint(0, len(block_positions) - 1)]
             else:
                 return None
 
+        def play_order(self) -> tuple[str, str]:
+            """Returns the markers of the player who moved first and the player who moved second. The AI is always the
+            player to move, so it moved first if both players have the same number of markers on the board."""
+            opponent = "x" if self.marker == "o" else "o"
+            codes = self.game.board.codes()
+            if codes.count(marker_code(self.marker)) == codes.count(marker_code(opponent)):
+                return self.marker, opponent
+            return opponent, self.marker
+
+        def table_move(self) -> tuple[int, int]:
+            """Looks up the optimal moves of the position in the solved TicTacToe table and randomly selects one of
+            them. The table is keyed by the order of play, so the first player is found from the marker counts."""
+            _, moves = tictactoe_table.lookup(self.game.board, *self.play_order())
+            return choice(moves)
+
+        def tablebase_move(self, positions: tablebase.Tablebase) -> tuple[int, int]:
+            """Randomly selects one of the optimal moves read from a memory mapped tablebase, such as the 4x4 ones."""
+            return choice(positions.best_moves(self.game.board, *self.play_order()))
+
+        def reset_search(self) -> None:
+            """Forgets the search table and move history of the last game, since the first player changes each game."""
+            if self._search is not None:
+                self._search.clear()
+
+        def search_move(self) -> tuple[int, int]:
+            """Searches for the best move with alpha-beta search inside the per-move time budget. Used by hard mode on
+            boards without a solved table. The search keeps its transposition table from one move to the next."""
+            if self._search is None or self._search.win_value != self.game.win_value:
+                self._search = AlphaBetaSearch(self.game.win_value)
+            self._search.time_limit = self.search_time
+            opponent = "x" if self.marker == "o" else "o"
+            return self._search.best_move(self.game.board, self.marker, opponent)
+
         def move(self, board: Board) -> Union[tuple[int, int], list[int]]:
             """Selects a move for the AI player based on the play mode of easy, intermediate or hard. """
             if self.difficulty is None:  # easy mode
-                result = self.random_ints(self.game.board)
-                assert result is not None
-                return result
-                # return self.random_ints(self.game.board)
+                return self.random_ints(self.game.board)
+
+            if self.difficulty:  # hard mode plays perfectly from the solved table, which already covers wins and blocks
+                board_shape = self.game.board.rows, self.game.board.columns, self.game.win_value
+                if board_shape == (3, 3, 3):
+                    return self.table_move()
+                if positions := tablebase.open_tablebase(*board_shape): # Only if generated with games.tablebase
+                    return self.tablebase_move(positions)
+                return self.search_move()
 
-            if move := self.win_or_block(self.game.board):  # intermediate or hard mode always checks for win or block first
+            if move := self.win_or_block(self.game.board):  # intermediate mode always checks for win or block first
                 return move
-                # result = move
-                # assert result is not None 
-                # return result
-
-
-            if self.difficulty:  # hard mode
-                if self.game.go_first:  # strategy is based on if human player plays first or not (go_first is for human player
-
-                    result = self.defence_mode(self.game.board)
-                    assert result is not None
-                    return result
-                    # return self.defence_mode(self.game.board)
-                else:
-
-                    result = self.offence_mode(self.game.board)
-                    assert result is not None
-                    return result
-                    # return self.offence_mode(self.game.board)
-
-            else:  # intermediate mode always checks for a fork first then for two blanks after two random moves
-                if self.game.round_count > 3:
-                    if move := self.check_fork(self.game.board):
-                        return move
-                    if move := self.two_blanks(self.game.board):
-                        return move
-                return self.random_ints(self.game.board)
+
+            # intermediate mode checks for a fork then for two blanks after two random moves
+            if self.game.round_count > 3:
+                # Fork detection relies on the single pair of diagonals of a 3x3 board
+                if self.game.board_size == 9 and (move := self.check_fork(self.game.board)):
+                    return move
+                if move := self.two_blanks(self.game.board):
+                    return move
+            return self.random_ints(self.game.board)
+
+    class MCTSPlayer(AIPlayer):
+
+        def __init__(self, name: str = 'CPU', marker: str = "o", game: 'TicTacToe' = None, playouts: Optional[int] = None,
+                     time_limit: float = 1.0, reuse_tree: bool = True, seed=None):
+            """MCTSPlayer is a computer player for large boards, such as 6x6 and up with 4 or 5 in a row, where
+            alpha-beta search cannot see far enough. It plays the move found by Monte Carlo Tree Search with either a
+            fixed number of playouts per move or, if playouts is None, a wall clock budget of time_limit seconds. The
+            player always plays at the hard level."""
+            super().__init__(name, marker, True, game)
+            self.playouts = playouts
+            self.time_limit = time_limit
+            self.reuse_tree = reuse_tree
+            self.seed = seed
+            self._mcts: Optional[MonteCarloTreeSearch] = None # Built on the first move, once the board size is known
+
+        def move(self, board: Board) -> tuple[int, int]:
+            """Selects the move with the most visits after the search budget is spent."""
+            game_board = self.game.board
+            if self._mcts is None or (self._mcts.rows, self._mcts.columns, self._mcts.win_value) != \
+                    (game_board.rows, game_board.columns, self.game.win_value):
+                self._mcts = MonteCarloTreeSearch(game_board.rows, game_board.columns, self.game.win_value,
+                                                  reuse_tree=self.reuse_tree, seed=self.seed)
+            # Budgets can be tuned between moves
+            self._mcts.playouts = self.playouts
+            self._mcts.time_limit = self.time_limit
+            opponent = "x" if self.marker == "o" else "o"
+            return self._mcts.best_move(game_board, self.marker, opponent)
 
     class AITestPlayer(AIPlayer):
 
@@ -621,33 +447,4 @@ class TicTacToe:
             against the computer. The computer player has three modes: easy, intermediate and hard.
             The computer is defaulted to name 'Computer' and marker 'O'"""
             super().__init__(name, marker, difficulty, game)
-            self.hard_test = hard_test
-
-        def move(self, board: Board) -> Union[tuple[int, int], list[int]]:
-            """Selects a move for the AI player based on the play mode of easy, intermediate or hard. """
-            if self.difficulty is None:  # easy mode
-                result = self.random_ints(self.game.board)
-                return result
-
-            if result := self.win_or_block(self.game.board):  # intermediate or hard mode always checks for win or block first
-                return result
-
-
-            if self.difficulty:  # hard mode
-                if self.game.go_first:  # strategy is based on if human player plays first or not (go_first is for human player)
-                    if self.hard_test and (self.game.round_count % 2 == 0):
-                        return self.offence_mode(self.game.board)
-                    return self.defence_mode(self.game.board)
-                else:
-                    if self.hard_test and (self.game.round_count % 2 == 1):
-                        return self.defence_mode(self.game.board)
-
-                    return self.offence_mode(self.game.board)
-
-            else:  # intermediate mode always checks for a fork first then for two blanks after two random moves
-                if self.game.round_count > 3:
-                    if move := self.check_fork(self.game.board):
-                        return move
-                    if move := self.two_blanks(self.game.board):
-                        return move
-                return self.random_ints(self.game.board)
\ No newline at end of file
+            self.hard_test = hard_test # Kept for existing callers: both hard players already play from the solved table
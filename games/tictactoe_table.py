@@ -0,0 +1,142 @@
+"""
+tictactoe_table.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains the perfect play table used by the hard TicTacToe AI. Every position reachable in a 3x3 game is
+solved once with minimax, reduced to one entry per symmetry class and saved to games/data/tictactoe_table.bin with
+core.storage.PositionWriter. The table is loaded the first time it is needed, after which finding the best moves of a
+position is a dictionary lookup.
+
+Run `python -m games.tictactoe_table` to rebuild the file.
+"""
+from core.board import (Board, SYMMETRY_TRANSFORMS, get_symmetry_permutation, get_winning_lines, palette_indices,
+                        unpack_indices)
+from core.storage import PositionReader, PositionWriter
+
+import os
+import struct
+from functools import lru_cache
+from typing import Union
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "tictactoe_table.bin")
+SIZE = 3
+PALETTE = ("x", "o") # Markers of the player who moves first and the player who moves second
+# Score for the player to move, then a bitmask of every optimal move in the canonical position
+_PAYLOAD = struct.Struct("<bH")
+
+_PERMUTATIONS = tuple(get_symmetry_permutation(SIZE, SIZE, transform) for transform in SYMMETRY_TRANSFORMS)
+_LINES = get_winning_lines(SIZE, SIZE, SIZE).lines
+
+
+def _canonical(cells: bytes) -> tuple[bytes, tuple[int, ...]]:
+    """Returns the smallest symmetry of a position of palette indices and the permutation that produced it."""
+    return min(((bytes(map(cells.__getitem__, permutation)), permutation) for permutation in _PERMUTATIONS),
+               key=lambda item: item[0])
+
+
+def _has_line(cells: bytes) -> bool:
+    return any(cells[a] != 0 and cells[a] == cells[b] == cells[c] for a, b, c in _LINES)
+
+
+def solve() -> dict[bytes, tuple[int, int]]:
+    """
+    Solves every reachable position with minimax.
+
+    Positions are keyed by their canonical cells, one byte per square holding 0 for a blank, 1 for the first player and
+    2 for the second player. Scores are from the point of view of the player to move: 0 for a draw, or the number of
+    blank squares left at the end of the game plus one, positive for a win and negative for a loss, so faster wins and
+    slower losses score higher.
+
+    Returns:
+        dict: Canonical cells mapped to (score, bitmask of every optimal move in the canonical position).
+    """
+    table = {}
+
+    def search(cells: bytes) -> int:
+        if cells in table:
+            return table[cells][0]
+        blanks = cells.count(0)
+        if _has_line(cells): # The player who just moved has won
+            table[cells] = (-(blanks + 1), 0)
+            return table[cells][0]
+        if blanks == 0:
+            table[cells] = (0, 0)
+            return 0
+        marker = 1 if blanks % 2 == 1 else 2 # The first player moves whenever an odd number of squares are blank
+        best_score, best_mask = None, 0
+        for index in range(SIZE * SIZE):
+            if cells[index] == 0:
+                child = bytearray(cells)
+                child[index] = marker
+                score = -search(_canonical(bytes(child))[0])
+                if best_score is None or score > best_score:
+                    best_score, best_mask = score, 1 << index
+                elif score == best_score:
+                    best_mask |= 1 << index
+        table[cells] = (best_score, best_mask)
+        return best_score
+
+    search(bytes(SIZE * SIZE))
+    return table
+
+
+def write_table(path: str = TABLE_PATH) -> int:
+    """Solves the game and writes the table to a position file. Returns the number of positions written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    board = Board(SIZE, SIZE)
+    with PositionWriter(path, SIZE, SIZE, PALETTE, payload_size=_PAYLOAD.size) as writer:
+        for cells, (score, mask) in sorted(solve().items()):
+            board.reset_board()
+            for index, palette_index in enumerate(cells):
+                if palette_index:
+                    board.add_to_square(*divmod(index, SIZE), PALETTE[palette_index - 1])
+            writer.write(board, _PAYLOAD.pack(score, mask))
+        return writer.count
+
+
+@lru_cache(maxsize=None)
+def load_table(path: str = TABLE_PATH) -> dict[bytes, tuple[int, int]]:
+    """
+    Reads the table into a dictionary the first time it is asked for. The game is solved in memory instead if the file
+    is missing, which takes well under a second.
+    """
+    if not os.path.exists(path):
+        return solve()
+    table = {}
+    with PositionReader(path) as reader:
+        if (reader.rows, reader.columns, reader.palette) != (SIZE, SIZE, PALETTE):
+            raise ValueError(f"{path} is not a TicTacToe table.")
+        for index in range(len(reader)):
+            cells = unpack_indices(reader.record(index))[:SIZE * SIZE]
+            table[cells] = _PAYLOAD.unpack(reader.payload(index))
+    return table
+
+
+def lookup(board: Board, first_marker: Union[int, str] = "x",
+           second_marker: Union[int, str] = "o") -> tuple[int, list[tuple[int, int]]]:
+    """
+    Looks up a position in the table.
+
+    Args:
+        board (Board): A 3x3 board reached by legal play.
+        first_marker (Union[int, str]): Marker of the player who moved first.
+        second_marker (Union[int, str]): Marker of the player who moved second.
+
+    Returns:
+        tuple: The score for the player to move, as described in solve(), and the row and column of every optimal move
+        on the board. The list of moves is empty once the game is over.
+
+    Raises:
+        KeyError: If the position cannot be reached by legal play.
+    """
+    cells = palette_indices(board.codes(), (first_marker, second_marker))
+    canonical, permutation = _canonical(cells)
+    score, mask = load_table()[canonical]
+    # Square i of the canonical position is square permutation[i] of the board
+    moves = [divmod(permutation[index], SIZE) for index in range(SIZE * SIZE) if mask >> index & 1]
+    return score, sorted(moves)
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_table()} positions to {TABLE_PATH}")
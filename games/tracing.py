@@ -0,0 +1,176 @@
+"""
+tracing.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains opt-in decision tracing for the AI players. Attaching a DecisionTracer to a player wraps its
+move() method and the branch methods listed in the player's TRACED_BRANCHES on that one instance. Each move then
+records which branch answered, how long every branch that was tried took, and the moves the branch was choosing
+between. Detaching removes the wrappers, so a player that is not traced runs exactly the same code as before and pays
+nothing for the feature.
+"""
+from games import tablebase, tictactoe_table
+
+from collections import deque
+from time import perf_counter
+from typing import Callable, NamedTuple, Optional
+
+
+class Decision(NamedTuple):
+    player: str
+    marker: str
+    round_count: int
+    branch: str # Branch method that returned the move, or 'move' if no listed branch did
+    move: tuple[int, int]
+    candidates: tuple[tuple[int, int], ...] # Moves the branch was choosing between, including the one it chose
+    seconds: float # Latency of the whole move() call
+    branch_seconds: tuple[tuple[str, float], ...] # Every branch called during the move, in call order, with its time
+
+
+class BranchStats(NamedTuple):
+    count: int
+    total_seconds: float
+    max_seconds: float
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+def _empty_squares(player) -> tuple[tuple[int, int], ...]:
+    board = player.game.board
+    return tuple((row, column) for row in range(board.rows) for column in range(board.columns)
+                 if not board.square_is_occupied(row, column))
+
+
+def _completing_squares(player) -> tuple[tuple[int, int], ...]:
+    # win_or_block wins for the traced player first, then blocks the opponent
+    board = player.game.board
+    counters = board.line_counters(player.game.win_value)
+    opponent = "x" if player.marker == "o" else "o"
+    squares = counters.completing_cells(player.marker) or counters.completing_cells(opponent)
+    return tuple(divmod(square, board.columns) for square in squares)
+
+
+def _two_blank_squares(player) -> tuple[tuple[int, int], ...]:
+    board = player.game.board
+    counters = board.line_counters(player.game.win_value)
+    for line_id in counters.lines_with(player.marker, 1):
+        return tuple(divmod(square, board.columns) for square in counters.blank_cells(line_id))
+    return ()
+
+
+def _table_moves(player) -> tuple[tuple[int, int], ...]:
+    return tuple(tictactoe_table.lookup(player.game.board, *player.play_order())[1])
+
+
+def _tablebase_moves(player) -> tuple[tuple[int, int], ...]:
+    board = player.game.board
+    positions = tablebase.open_tablebase(board.rows, board.columns, player.game.win_value)
+    return tuple(positions.best_moves(board, *player.play_order())) if positions else ()
+
+
+# Candidate moves of the branches that choose at random, computed only while tracing and outside the timed calls
+CANDIDATES: dict[str, Callable] = {
+    "random_ints": _empty_squares,
+    "win_or_block": _completing_squares,
+    "two_blanks": _two_blank_squares,
+    "table_move": _table_moves,
+    "tablebase_move": _tablebase_moves,
+}
+
+
+class DecisionTracer:
+    """
+    Records the decisions of one or more AI players in a ring buffer and optionally passes each one to a callback.
+
+    Args:
+        capacity (int): Number of recent decisions kept. Older decisions are dropped.
+        callback (Callable): Optional function called with every Decision as it is recorded.
+    """
+
+    def __init__(self, capacity: int = 1024, callback: Optional[Callable[[Decision], None]] = None):
+        self.decisions: deque[Decision] = deque(maxlen=capacity)
+        self.callback = callback
+        self._players: list = []
+
+    def attach(self, player) -> None:
+        """Starts tracing a player by wrapping its move() and branch methods on the instance."""
+        if "move" in vars(player):
+            raise ValueError(f"Player '{player.name}' is already being traced.")
+        calls: list[tuple[str, float, object]] = [] # Branch calls of the move in progress
+        original_move = player.move
+
+        def wrap(name: str, method: Callable) -> Callable:
+            def traced_branch(*args, **kwargs):
+                start = perf_counter()
+                result = method(*args, **kwargs)
+                calls.append((name, perf_counter() - start, result))
+                return result
+            return traced_branch
+
+        def traced_move(*args, **kwargs):
+            calls.clear()
+            start = perf_counter()
+            move = original_move(*args, **kwargs)
+            seconds = perf_counter() - start
+            self._record(player, move, seconds, list(calls))
+            return move
+
+        for name in getattr(player, "TRACED_BRANCHES", ()):
+            setattr(player, name, wrap(name, getattr(player, name)))
+        player.move = traced_move
+        self._players.append(player)
+
+    def detach(self, player) -> None:
+        """Stops tracing a player and removes every wrapper from it."""
+        for name in ("move", *getattr(player, "TRACED_BRANCHES", ())):
+            vars(player).pop(name, None)
+        if player in self._players:
+            self._players.remove(player)
+
+    def detach_all(self) -> None:
+        for player in list(self._players):
+            self.detach(player)
+
+    def _record(self, player, move, seconds: float, calls: list) -> None:
+        branch = "move"
+        for name, _, result in reversed(calls): # The last branch that returned the move answered it
+            if result is not None and tuple(result) == tuple(move):
+                branch = name
+                break
+        candidates = (tuple(move),)
+        if branch in CANDIDATES:
+            # Called after move() returned but before the game plays the move, so the board is unchanged
+            candidates = CANDIDATES[branch](player) or candidates
+        decision = Decision(player.name, player.marker, player.game.round_count, branch, tuple(move),
+                            tuple(tuple(square) for square in candidates), seconds,
+                            tuple((name, branch_seconds) for name, branch_seconds, _ in calls))
+        self.decisions.append(decision)
+        if self.callback is not None:
+            self.callback(decision)
+
+    def summary(self) -> dict[str, BranchStats]:
+        """Totals the time spent in each branch over the recorded decisions, whether or not the branch answered."""
+        totals: dict[str, list] = {}
+        for decision in self.decisions:
+            for name, seconds in decision.branch_seconds:
+                count, total, most = totals.get(name, (0, 0.0, 0.0))
+                totals[name] = (count + 1, total + seconds, max(most, seconds))
+        return {name: BranchStats(*values) for name, values in totals.items()}
+
+    def branch_counts(self) -> dict[str, int]:
+        """Number of recorded moves answered by each branch."""
+        counts: dict[str, int] = {}
+        for decision in self.decisions:
+            counts[decision.branch] = counts.get(decision.branch, 0) + 1
+        return counts
+
+    def clear(self) -> None:
+        self.decisions.clear()
+
+    def __enter__(self) -> "DecisionTracer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.detach_all()
@@ -0,0 +1,167 @@
+"""
+verify.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains an exhaustive check that the hard TicTacToe AI never loses. Instead of sampling random games, it
+walks every reply an opponent can make and every move the AI can choose. The AI's random choices are explored by
+swapping random.choice and randint in games.tictactoe for a scripted provider and replaying each move once per
+possible choice. Positions are memoized, so each one is expanded once per worker. The first moves are split across a
+process pool.
+
+Usage:
+    python -m games.verify
+"""
+from games import tictactoe as tictactoe_module
+from games.tictactoe import TicTacToe
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, NamedTuple, Optional
+
+
+class ScriptedChoices:
+    """
+    Deterministic stand-in for random.choice and randint. The n-th call returns option script[n], or the first option
+    once the script runs out, and records how many options each call had so the caller can try the others.
+    """
+
+    def __init__(self, script: tuple[int, ...] = ()):
+        self.script = script
+        self.taken: list[int] = []
+        self.sizes: list[int] = []
+
+    def _pick(self, size: int) -> int:
+        index = self.script[len(self.taken)] if len(self.taken) < len(self.script) else 0
+        self.taken.append(index)
+        self.sizes.append(size)
+        return index
+
+    def choice(self, sequence):
+        return sequence[self._pick(len(sequence))]
+
+    def randint(self, low: int, high: int) -> int:
+        return low + self._pick(high - low + 1)
+
+
+@contextmanager
+def scripted_random(provider: ScriptedChoices):
+    """Replaces the random functions the TicTacToe AI players call with a scripted provider, restoring them on exit."""
+    original = tictactoe_module.choice, tictactoe_module.randint
+    tictactoe_module.choice, tictactoe_module.randint = provider.choice, provider.randint
+    try:
+        yield provider
+    finally:
+        tictactoe_module.choice, tictactoe_module.randint = original
+
+
+def all_choices(function: Callable) -> set:
+    """
+    Calls a function once for every combination of its random choices and returns the set of distinct results. Each
+    run replays the choices of an earlier run and then takes a different option at one later choice point.
+    """
+    results = set()
+    scripts = [()]
+    while scripts:
+        script = scripts.pop()
+        with scripted_random(ScriptedChoices(script)) as provider:
+            results.add(tuple(function()))
+        for depth in range(len(script), len(provider.taken)):
+            for option in range(1, provider.sizes[depth]):
+                scripts.append(tuple(provider.taken[:depth]) + (option,))
+    return results
+
+
+class VerificationResult(NamedTuple):
+    positions: int # Positions expanded, counted once per worker
+    losing_lines: list[list[tuple[int, int, str]]] # Every move sequence, as (row, column, marker), the AI lost
+    seconds: float
+
+
+def _verify_branch(task: tuple[bool, tuple[tuple[int, int], ...]]) -> tuple[int, list]:
+    """Explores every game that starts with the given opening moves. Runs in a worker process."""
+    go_first, opening = task
+    game = TicTacToe()
+    game.create_ai_player(name="CPU", difficulty=True)
+    game.go_first = go_first # True when the opponent, playing 'x', moves first
+    human, ai_player = game.players
+    order = (human, ai_player) if go_first else (ai_player, human)
+    visited = set()
+    losing_lines = []
+
+    def explore() -> None:
+        key = game.board.codes()
+        if key in visited:
+            return
+        visited.add(key)
+        player = order[game.round_count % 2]
+        if player is ai_player:
+            moves = all_choices(lambda: ai_player.move(game.board))
+        else:
+            moves = [(row, column) for row in range(3) for column in range(3)
+                     if not game.board.square_is_occupied(row, column)]
+        for row, column in moves:
+            if not game.make_move(row, column, player.marker):
+                losing_lines.append(_line(game) + [(row, column, f"invalid move by {player.marker}")])
+                continue
+            if game.check_winner():
+                if player is human:
+                    losing_lines.append(_line(game))
+                game.reset_winner()
+            elif not game.board_is_full():
+                explore()
+            game.undo_move()
+
+    for row, column in opening:
+        game.make_move(row, column, order[game.round_count % 2].marker)
+    explore()
+    return len(visited), losing_lines
+
+
+def _line(game: TicTacToe) -> list[tuple[int, int, str]]:
+    return [(row, column, game.board.get_square_value(row, column)) for row, column in game.move_list]
+
+
+def verify_hard_mode(workers: Optional[int] = None) -> VerificationResult:
+    """
+    Proves the hard AI never loses by playing every possible game against it with the opponent moving first and with
+    the AI moving first. Each first move of the opponent, or each opening the AI can choose, is a separate task.
+
+    Args:
+        workers (int): Number of worker processes. Defaults to the number of CPUs. 1 runs in this process.
+
+    Returns:
+        VerificationResult: The positions explored, every losing line found, and the wall clock time.
+    """
+    start = perf_counter()
+    tasks = [(True, ((row, column),)) for row in range(3) for column in range(3)]
+    # The AI's opening is found the same way as any other AI move, on an empty board
+    opening_game = TicTacToe()
+    opening_game.create_ai_player(name="CPU", difficulty=True)
+    tasks += [(False, (move,)) for move in sorted(all_choices(lambda: opening_game.players[1].move(opening_game.board)))]
+
+    if workers == 1:
+        results = list(map(_verify_branch, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            results = list(executor.map(_verify_branch, tasks))
+    positions = sum(count for count, _ in results)
+    losing_lines = [line for _, lines in results for line in lines]
+    return VerificationResult(positions, losing_lines, perf_counter() - start)
+
+
+def main() -> None:
+    result = verify_hard_mode()
+    print(f"Explored {result.positions} positions in {result.seconds:.2f}s.")
+    if result.losing_lines:
+        print(f"Hard mode lost {len(result.losing_lines)} lines:")
+        for line in result.losing_lines:
+            print("  " + ", ".join(f"{marker} ({row}, {column})" for row, column, marker in line))
+    else:
+        print("Hard mode never loses, whether it moves first or second.")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,7 @@ class ConnectFourGUI:
         self.board = [['' for _ in range(7)] for _ in range(6)]
         self.game_over = False
         self.buttons = []
+        self.drawn_version = -1 # Backend board version the grid was last drawn at, -1 forces a full redraw
         self.column_buttons = []
 
         self.difficulty = tk.StringVar(value="easy") # easy or intermediate mode only at this point
@@ -190,6 +191,7 @@ class ConnectFourGUI:
     def end_game_if_winner(self):
         winner = self.game.check_winner()
         if winner:
+            self.highlight_winning_squares()
             self.update_final_gui_state(final_message=f"{self.current_player.marker_name} wins the game!")
             self.update_final_game_state()
             return True
@@ -205,16 +207,32 @@ class ConnectFourGUI:
         self.reset_button.config(text="Play Again")
         self.end_session_button.pack(side='left', padx=20, expand=True, fill='x')
     
-    def update_square(self, col):
-        row = self.game.height_list[col] # Game height list tells us which row is available for play for any column
-        canvas_to_update = self.buttons[row][col]
-        canvas_to_update.itemconfig(canvas_to_update.find_all()[0], fill=self.get_current_colour())
+    def refresh_board(self):
+        """Recolours only the squares changed on the backend board since the last redraw, or every square if the board
+        was reset since then."""
+        board = self.game.board
+        changed_squares = board.changes_since(self.drawn_version)
+        if changed_squares is None:
+            changed_squares = [(row, col) for row in range(board.rows) for col in range(board.columns)]
+        marker_colours = {"r": self.master_red, "y": self.master_yellow}
+        for row, col in changed_squares:
+            canvas = self.buttons[row][col]
+            # The oval is the only item on the canvas and empty squares go back to the original gray
+            canvas.itemconfig(canvas.find_all()[0], fill=marker_colours.get(board.get_square_value(row, col), "#ecf0f1"),
+                              outline="#bdc3c7", width=2)
+        self.drawn_version = board.version
+
+    def highlight_winning_squares(self):
+        """Outlines every square of every complete line, including a second line completed by the same move."""
+        for row, col in self.game.get_winning_cells():
+            canvas = self.buttons[row][col]
+            canvas.itemconfig(canvas.find_all()[0], outline=self.master_select_colour, width=5)
 
     def make_valid_move(self, col, marker):
         # Updates the UI and Connect 4 Game after valid move
         is_valid = self.game.make_move(col=col, marker=self.current_player.marker)
         if is_valid:
-            self.update_square(col=col)
+            self.refresh_board()
             return True
         else:
             return False
@@ -228,7 +246,7 @@ class ConnectFourGUI:
             self.game.make_move(col, self.current_player.marker)
            
             # Make the move and update the UI
-            self.update_square(col)
+            self.refresh_board()
             winner = self.end_game_if_winner()
             if not winner:
                 self.change_current_player()
@@ -260,13 +278,7 @@ class ConnectFourGUI:
         self.change_current_player()
         self.status_label.config(text=f"● plays", fg=self.get_current_colour())
         
-        for row in range(6):
-            for col in range(7):
-                canvas = self.buttons[row][col]
-                # Get the ID of the oval (the only item on the canvas)
-                oval_id = canvas.find_all()[0]
-                # Change the oval's fill color back to the original gray
-                canvas.itemconfig(oval_id, fill="#ecf0f1")
+        self.refresh_board() # the backend reset clears the change log so every square is redrawn
         self.reset_button.config(text="Reset") # change the reset button back
         self.end_session_button.pack_forget() # hide the end session button
         self.check_ai_player_turn()
@@ -0,0 +1,267 @@
+"""
+QubicGui.py
+Author: Robert Pal
+Updated: 2026-10-18
+
+This module contains all control flow logic for running the Qubic, or 3D Tic Tac Toe, Desktop Application.
+It includes:
+- button_click() which acts as the main() game running function
+- helper functions to manage game states and UI display
+"""
+import tkinter as tk
+from tkinter import messagebox
+from games.qubic import Qubic
+
+class QubicGUI:
+    """QubicGUI class controls the Qubic desktop application by managing all interactions of the game's GUI and backend state. The four layers
+    of the cube are shown side by side as 4x4 grids of buttons."""
+    def __init__(self, master):
+        self.master = master
+        master.title("Qubic")
+        self.master.option_add('*name', 'Qubic')
+
+        # Set GUI widget colours to match the Tic Tac Toe application
+        self.master_colour = "#37353E"
+        self.master_text_colour = "#FFFCFB"
+        self.master_label_colour = "#44444E"
+        self.master_label_text="#ecf0f1"
+        self.master_button_text_highlight_colour = "#34495e"
+        self.master_red = "#8C1007" # Crimson Red
+        self.master_blue = "#3D74B6" # Inidgo Blue
+
+        # Set overall GUI widget settings
+        master.configure(bg=self.master_colour)
+        master.geometry("1000x600")
+        master.resizable(True, True)
+
+        # Initialize the backend game state and update backend player based on user selections in start_game()
+        self.game = Qubic()
+        self.current_player = None
+        self.player_1 = None
+        self.player_2 = None
+
+        # GUI game state variables updated based on backend state
+        self.buttons = {} # Button of each (layer, row, column) square
+        self.game_over = False
+        self.difficulty_options_frame = None
+        self.start_button_frame = None
+        self.master_ai_wait_time = 575
+        self.difficulty = tk.StringVar(value="easy") # Three modes: None for easy, False for intermedia, True for hard
+        self.game_mode = tk.IntVar(value=1) # 1 for single player, 2 for two players
+
+        self.create_start_menu()
+
+    def create_start_menu(self):
+        """Creates the initial start screen widgets to set 1 or 2 player game mode and difficulty level for AI player."""
+        # Uses a main frame to contain all widgets for centering
+        self.main_frame = tk.Frame(self.master, bg=self.master_colour)
+        self.main_frame.pack(expand=True, padx=20, pady=20)
+
+        title_label = tk.Label(self.main_frame, text="Qubic", font=("Inter", 36, "bold"),
+                               bg=self.master_colour, fg=self.master_text_colour)
+        title_label.pack(pady=(0, 20))
+
+        # Game Mode selection Frame
+        mode_label = tk.Label(self.main_frame, text="Select the Game Play Mode:", font=("Inter", 16),
+                              bg=self.master_label_colour, fg=self.master_label_text)
+        mode_label.pack(pady=(10, 5))
+
+        tk.Radiobutton(self.main_frame, text="One Player (vs AI Player)", font=("Inter", 14), variable=self.game_mode, value=1,
+                       bg=self.master_colour, fg=self.master_text_colour, selectcolor=self.master_button_text_highlight_colour,
+                       command=self.update_difficulty_options).pack(pady=2)
+        tk.Radiobutton(self.main_frame, text="Two Players", font=("Inter", 14), variable=self.game_mode, value=2,
+                       bg=self.master_colour, fg=self.master_text_colour, selectcolor=self.master_button_text_highlight_colour,
+                       command=self.update_difficulty_options).pack(pady=2)
+
+        # AI Difficulty selection Frame that is will hide/show based on whether 1 player mode is selected or not
+        self.difficulty_options_frame = tk.Frame(self.main_frame, bg=self.master_colour)
+        self.difficulty_options_frame.pack(pady=(20, 5))
+
+        difficulty_label = tk.Label(self.difficulty_options_frame, text="Select AI Difficulty Level:", font=("Inter", 16),
+                                    bg=self.master_label_colour, fg=self.master_label_text)
+        difficulty_label.pack(pady=(0, 5))
+
+        for text, value in (("Blind", "easy"), ("Intermediate", "intmed"), ("Hard", "hard")):
+            tk.Radiobutton(self.difficulty_options_frame, text=text, font=("Inter", 14), variable=self.difficulty, value=value,
+                           bg=self.master_colour, fg=self.master_text_colour, selectcolor=self.master_button_text_highlight_colour).pack(pady=2)
+
+        # Start Button
+        self.start_button_frame = tk.Frame(self.main_frame, bg=self.master_colour)
+        self.start_button_frame.pack(pady=(20, 5))
+        start_button = tk.Button(self.start_button_frame, text="Start Game", font=("Inter", 16), command=self.start_game,
+                                 fg=self.master_button_text_highlight_colour, activebackground=self.master_button_text_highlight_colour,
+                                 relief="raised")
+        start_button.pack(pady=20)
+
+    def update_difficulty_options(self):
+        """Shows or hides the difficulty selection based on the game mode."""
+        if self.game_mode.get() == 1:
+            self.start_button_frame.pack_forget()
+            self.difficulty_options_frame.pack(pady=(20, 5))
+            self.start_button_frame.pack(pady=20)
+        else:
+            self.difficulty_options_frame.pack_forget()
+
+    def start_game(self):
+        """Initializes the game and switches from the start menu to the game board."""
+        self.main_frame.destroy()
+
+        difficulty_dictionary = {
+            "easy": None,
+            "intmed": False,
+            "hard": True
+        }
+        name_dictionary = {
+            "easy": "CPU Easy",
+            "intmed": "CPU Intermediate",
+            "hard": "CPU Hard"
+        }
+
+        # Use two mappings to set the correct difficulty level and CPU Name
+        if self.game_mode.get() == 1:
+            self.game.create_ai_player(name=name_dictionary[self.difficulty.get()], difficulty=difficulty_dictionary[self.difficulty.get()])
+        else:
+            self.game.update_player_name(name="Player 1", marker="x")
+            self.game.update_player_name(name="Player 2", marker="o")
+
+        self.player_1 = self.game.get_player(0)
+        self.player_2 = self.game.get_player(1)
+        self.current_player = self.player_1
+
+        self.create_game_board_gui()
+        self.check_ai_player_turn()
+
+    def create_game_board_gui(self):
+        """Creates and places all GUI widgets for the four layers of the cube and the user options."""
+        main_frame = tk.Frame(self.master, bg=self.master_colour)
+        main_frame.pack(expand=True, padx=20, pady=20)
+
+        # One frame of 4x4 buttons per layer, placed left to right
+        board_frame = tk.Frame(main_frame, bg=self.master_colour)
+        board_frame.grid(row=0, column=0)
+        size = self.game.dimension
+        for layer in range(size):
+            layer_frame = tk.Frame(board_frame, bg=self.master_colour)
+            layer_frame.grid(row=0, column=layer, padx=15)
+            tk.Label(layer_frame, text=f"Layer {layer + 1}", font=("Inter", 14), bg=self.master_colour,
+                     fg=self.master_text_colour).grid(row=0, column=0, columnspan=size, pady=(0, 5))
+            for row in range(size):
+                for col in range(size):
+                    button = tk.Button(layer_frame, text="", font=("Inter", 18, "bold"), width=2, height=1,
+                                       activebackground=self.master_button_text_highlight_colour,
+                                       relief="flat", borderwidth=0, highlightthickness=0,
+                                       command=lambda l=layer, r=row, c=col: self.button_click(l, r, c))
+                    button.grid(row=row + 1, column=col, padx=2, pady=2)
+                    self.buttons[(layer, row, col)] = button
+        self.square_colour = self.buttons[(0, 0, 0)].cget("bg") # Default square colour restored after a win is highlighted
+
+        # Frame for the status label and control buttons: reset/play again and end session buttons
+        control_frame = tk.Frame(main_frame, bg=self.master_colour)
+        control_frame.grid(row=1, column=0, pady=(20, 0))
+
+        self.status_label = tk.Label(control_frame, text=f"{self.current_player.name}'s turn", font=("Inter", 18, "bold"),
+                                     bg=self.master_colour, fg="#ecf0f1", padx=10, pady=5)
+        self.status_label.grid(row=0, column=0, columnspan=3, pady=10)
+
+        # Reset button will change to play again button after a win or draw
+        self.reset_button = tk.Button(control_frame, text="Reset", font=("Inter", 16), command=self.reset_game,
+                                      fg=self.master_button_text_highlight_colour, activebackground=self.master_button_text_highlight_colour,
+                                      relief="raised", takefocus=0)
+        self.reset_button.grid(row=1, column=0, columnspan=3, pady=10)
+
+        # End session button only placed after a win or draw
+        self.end_session_button = tk.Button(control_frame, text="End Session", font=("Inter", 16), command=self.end_session,
+                                            fg=self.master_button_text_highlight_colour, activebackground=self.master_button_text_highlight_colour,
+                                            relief="raised", takefocus=0)
+
+    def button_click(self, layer, row, col):
+        """Handles the human player's move, validates it, and runs the AI player if necessary after a valid human move."""
+        if not self.game_over and not self.current_player.is_ai_player:
+            if self.game.is_valid(layer=layer, row=row, col=col):
+                game_over = self.make_valid_move(layer=layer, row=row, col=col)
+                if not game_over:
+                    self.change_current_player()
+                    self.check_ai_player_turn()
+
+    def check_ai_player_turn(self):
+        """Checks if there is an AI player and calls an AI move after short pause."""
+        if self.current_player.is_ai_player:
+            self.master.after(self.master_ai_wait_time, self.make_ai_move)
+
+    def make_ai_move(self):
+        """Handles the AI player's move, which is always a valid move."""
+        if not self.game_over and self.current_player.is_ai_player:
+            layer, row, col = self.current_player.move()
+            game_over = self.make_valid_move(layer=layer, row=row, col=col)
+            if not game_over:
+                self.change_current_player()
+
+    def change_current_player(self):
+        """Changes the current player after valid move has been made based on the player marker."""
+        self.current_player = self.player_2 if self.current_player.marker == 'x' else self.player_1
+        self.status_label.config(text=f"{self.current_player.name}'s turn")
+
+    def set_current_player(self):
+        """Sets the current player at the beginning of a game based on which player went first in the previous game."""
+        self.current_player = self.player_1 if self.game.go_first else self.player_2
+        self.status_label.config(text=f"{self.current_player.name}'s turn")
+
+    def make_valid_move(self, layer, row, col):
+        """Makes a valid game move, updates the square and backend states, checks for winner or draw and ends the game if either is found."""
+        marker = self.current_player.marker
+        self.game.make_move(layer=layer, row=row, col=col, marker=marker)
+        marker_colour = self.master_red if marker == 'x' else self.master_blue
+        self.buttons[(layer, row, col)].config(text=marker, state=tk.DISABLED, disabledforeground=marker_colour)
+
+        if self.game.check_winner():
+            self.status_label.config(text=f"Game Over. {self.current_player.name} wins.")
+            for square in self.game.get_winning_cells():
+                self.buttons[square].config(bg=self.master_label_text)
+            self.update_final_game_state()
+            self.display_final_message("Game Over", self.game.get_winner_string())
+            return True
+        elif self.game.board_is_full():
+            self.status_label.config(text="Game Over. Cat's Game!")
+            self.update_final_game_state()
+            self.display_final_message("Cat's Game", "There was no winner so there will be no chicken dinner.")
+            return True
+        return False
+
+    def update_final_game_state(self):
+        """Updates the game winner attributes, player statistics in the backend and game over boolean in the front end."""
+        self.game.update_winner_info()
+        self.game.update_players_stats()
+        self.game_over = True
+
+    def display_final_message(self, message_title, message_text):
+        """Displays info message box for game win or draw and displays updated end-of-game buttons."""
+        messagebox.showinfo(message_title, message_text)
+        self.reset_button.config(text="Play Again")
+        self.end_session_button.grid(row=5, column=0, columnspan=3, pady=10)
+
+    def reset_game(self):
+        """Resets the Qubic game state and GUI states."""
+        self.game.reset_game_state()
+        self.game_over = False
+        for button in self.buttons.values():
+            button.config(text="", state=tk.NORMAL, bg=self.square_colour)
+        self.set_current_player()
+        self.reset_button.config(text="Reset")
+        self.end_session_button.grid_forget()
+        self.check_ai_player_turn() # check AI player and play if AI plays first
+
+    def end_session(self):
+        """Ends the game session and closes the application."""
+        end_message = "Game Session Ended.\n\n"
+        for statistics in self.game.get_players_info_string_as_list():
+            end_message += statistics
+        messagebox.showinfo("Session Stats", end_message)
+        self.master.destroy()
+
+def run():
+    root = tk.Tk()
+    app = QubicGUI(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    run()
@@ -42,6 +42,7 @@ class TicTacToeGUI:
 
         # GUI game state variables updated based on backend state
         self.buttons = []
+        self.drawn_version = -1 # Backend board version the buttons were last drawn at, -1 forces a full redraw
         self.game_over = False
         self.difficulty_options_frame = None
         self.start_button_frame = None
@@ -204,6 +205,7 @@ class TicTacToeGUI:
                 button.grid(row=row, column=col, padx=pad_x, pady=pad_y)
                 button_row.append(button)
             self.buttons.append(button_row)
+        self.square_colour = self.buttons[0][0].cget("bg") # Default square colour restored after a win is highlighted
 
         # Frame for the status label and control buttons: reset/play again and end session buttons
         control_frame = tk.Frame(main_frame, bg=self.master_colour)
@@ -287,13 +289,12 @@ class TicTacToeGUI:
     def make_valid_move(self, row, col):
         """Makes a valid game move, updates all board and backend states, checks for winner or draw and ends the game if either is found."""
         self.game.make_move(row=row, col=col, marker=self.current_player.marker)
-        # Customizable marker colours for button update
-        marker_colour = self.master_red if self.current_player.marker == 'x' else self.master_blue 
-        self.buttons[row][col].config(text=self.current_player.marker, state=tk.DISABLED, disabledforeground=marker_colour)
+        self.refresh_board()
         
         winner = self.game.check_winner()  
         if winner:
             self.status_label.config(text=f"Game Over. {self.current_player.name} wins.")
+            self.highlight_winning_squares()
             self.update_final_game_state()
             # Must call update_game() first to update the backend game state to get correct winner message through get_winner_string() from backend
             self.display_final_message("Game Over", self.game.get_winner_string())
@@ -306,6 +307,27 @@ class TicTacToeGUI:
 
         return False
         
+    def refresh_board(self):
+        """Redraws only the buttons of the squares changed on the backend board since the last redraw, or every button
+        if the board was reset since then."""
+        board = self.game.board
+        changed_squares = board.changes_since(self.drawn_version)
+        if changed_squares is None:
+            changed_squares = [(row, col) for row in range(board.rows) for col in range(board.columns)]
+        for row, col in changed_squares:
+            if marker := board.get_square_value(row, col):
+                # Customizable marker colours for button update
+                marker_colour = self.master_red if marker == 'x' else self.master_blue
+                self.buttons[row][col].config(text=marker, state=tk.DISABLED, disabledforeground=marker_colour)
+            else:
+                self.buttons[row][col].config(text="", state=tk.NORMAL, bg=self.square_colour)
+        self.drawn_version = board.version
+
+    def highlight_winning_squares(self):
+        """Highlights every square of every complete line, so both lines of a fork win are shown."""
+        for row, col in self.game.get_winning_cells():
+            self.buttons[row][col].config(bg=self.master_label_text)
+
     def make_ai_move(self):
         """Handles the AI player's move for validation from backend."""
         if not self.game_over and self.current_player.is_ai_player:
@@ -330,9 +352,7 @@ class TicTacToeGUI:
         # Reset the Game GUI state
         self.game_over = False
         self.set_current_player()
-        for row in range(3):
-            for col in range(3):
-                self.buttons[row][col].config(text="", state=tk.NORMAL) # reset the board
+        self.refresh_board() # the backend reset clears the change log so every button is reset
         self.reset_button.config(text="Reset") # change the reset button back
         self.end_session_button.grid_forget() # hide the end session button
         self.check_ai_player_turn() # check AI player and play if AI plays first
@@ -6,7 +6,7 @@ Updated: 2025-08-17
 This module contains control flow logic for running the the Simple Games applications through the main() function. Game option Enums are used to 
 determine the permitted game to be run. Command line tools are used for user input and display. It also includes some testing and in developement functions.
 """
-from cli import TicTacToeCLI, ConnectFourCLI, SolitaireCLI
+from cli import TicTacToeCLI, ConnectFourCLI, SolitaireCLI, QubicCLI
 from utils.clitools.printing import print_menu_screen
 from utils.game_options import GameOptions
 from utils.clitools.prompting import menu_select
@@ -28,6 +28,7 @@ def test():
     # TicTacToeCLI.run()
     # SolitaireCLI.run()
     # ConnectFourCLI.run()
+    # QubicCLI.run()
     exit()
 
 
@@ -44,6 +45,8 @@ def main():
         ConnectFourCLI.run()
     elif choice == GameOptions.SOLITAIRE.value:
         SolitaireCLI.run()
+    elif choice == GameOptions.QUBIC.value:
+        QubicCLI.run()
     else:
         raise ValueError("Invalid choice. See you next time.")
 
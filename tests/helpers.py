@@ -0,0 +1,20 @@
+from random import Random
+from core.board import Board
+
+
+def board_from_cells(cells, size):
+    """Builds a square board from a flat list of cells: 0 for blank, 1 for 'x' and 2 for 'o'."""
+    board = Board(size, size)
+    for index, value in enumerate(cells):
+        if value:
+            board.add_to_square(*divmod(index, size), "xo"[value - 1])
+    return board
+
+
+def fill_random(boards, rows, columns, markers, seed):
+    """Adds the same random markers to every board in the list."""
+    rng = Random(seed)
+    for _ in range(rng.randint(0, rows * columns)):
+        row, column, marker = rng.randrange(rows), rng.randrange(columns), rng.choice(markers)
+        for board in boards:
+            board.add_to_square(row, column, marker)
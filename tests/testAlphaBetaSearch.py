@@ -0,0 +1,73 @@
+import random
+import time
+import unittest
+from core.board import Board
+from games import tictactoe_table
+from games.search import AlphaBetaSearch
+from games.tictactoe import TicTacToe
+from tests.helpers import board_from_cells
+
+
+class TestAlphaBetaSearch(unittest.TestCase):
+    def test_agrees_with_solved_table(self):
+        search = AlphaBetaSearch(3, time_limit=60)
+        for cells, (_, optimal_moves) in tictactoe_table.load_table().items():
+            if optimal_moves == 0:
+                continue # Finished games have no moves
+            marker, opponent = ("x", "o") if cells.count(0) % 2 == 1 else ("o", "x")
+            row, column = search.best_move(board_from_cells(cells, 3), marker, opponent)
+            self.assertTrue(optimal_moves >> (row * 3 + column) & 1, cells)
+
+    def test_wins_before_blocking(self):
+        board = Board(4, 4)
+        for row, column, marker in [(0, 0, "x"), (1, 0, "o"), (0, 1, "x"), (1, 1, "o"), (0, 2, "x"), (1, 2, "o")]:
+            board.add_to_square(row, column, marker)
+        self.assertEqual(AlphaBetaSearch(4, time_limit=5).best_move(board, "x", "o"), (0, 3))
+        self.assertEqual(AlphaBetaSearch(4, time_limit=5).best_move(board, "o", "x"), (1, 3))
+
+    def test_search_does_not_touch_the_board(self):
+        board = Board(4, 4)
+        board.push(1, 1, "x")
+        version, board_hash = board.version, board.hash
+        AlphaBetaSearch(4, time_limit=0.2).best_move(board, "o", "x")
+        self.assertEqual((board.version, board.hash, board.move_count), (version, board_hash, 1))
+
+    def test_table_is_keyed_by_the_marker_to_move(self):
+        board = board_from_cells([1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 0, 0, 2], 4)
+        search = AlphaBetaSearch(3, time_limit=5, max_depth=3)
+        search.best_move(board, "x", "o")
+        self.assertIn((board.hash, "x"), search._table)
+        self.assertNotIn((board.hash, "o"), search._table)
+        search.best_move(board, "o", "x")
+        self.assertIn((board.hash, "o"), search._table)
+
+    def test_time_budget(self):
+        search = AlphaBetaSearch(4, time_limit=0.1)
+        start = time.perf_counter()
+        move = search.best_move(Board(5, 5), "x", "o")
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertIsNotNone(move)
+        self.assertIsNone(search.best_move(board_from_cells([1, 2, 1, 1, 2, 2, 2, 1, 1], 3), "x", "o"))
+
+    def test_hard_mode_on_larger_boards(self):
+        random.seed(5)
+        self.assertEqual(TicTacToe(board_dimension=4).win_value, 3) # Three in a row unless told otherwise
+        game = TicTacToe(board_dimension=4, win_value=4)
+        game.add_ai_players_for_testing(None, True)
+        game.players[1].search_time = 0.05
+        for _ in range(4):
+            for turn in range(game.board_size):
+                player = game.players[turn % 2] if game.go_first else game.players[turn % 2 - 1]
+                row, column = player.move(game.board)
+                self.assertTrue(game.make_move(row, column, player.marker))
+                if game.check_winner():
+                    break
+            game.update_winner_info()
+            game.update_players_stats()
+            game.reset_game_state()
+        self.assertEqual(game.players[1].lost_count, 0)
+        self.assertEqual(game.players[1]._search._table, {}) # Each new game starts with an empty table
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from importlib.util import find_spec
+from games.simulate import simulate
+
+
+@unittest.skipUnless(find_spec("numpy"), "NumPy is not installed")
+class TestBatchSimulate(unittest.TestCase):
+    def setUp(self):
+        from games.batch_simulate import simulate_batch
+        self.simulate_batch = simulate_batch
+
+    def test_random_games_match_the_exact_distribution(self):
+        # Probabilities of random play over every game tree branch: x wins 58.5%, o wins 28.8%, draws 12.7%
+        result = self.simulate_batch(200_000, seed=1, batch_size=50_000)
+        self.assertEqual(result.games, 200_000)
+        self.assertAlmostEqual(result.x_wins / result.games, 0.585, delta=0.01)
+        self.assertAlmostEqual(result.o_wins / result.games, 0.288, delta=0.01)
+        self.assertAlmostEqual(result.draws / result.games, 0.127, delta=0.01)
+        self.assertEqual(sum(result.length_counts), result.games)
+        self.assertEqual(result.length_counts[:5], (0, 0, 0, 0, 0)) # No game ends before the fifth move
+
+    def test_matches_easy_mode_players(self):
+        batch = self.simulate_batch(20_000, x_first=False, seed=2)
+        players = simulate([(None, None)], games=4000, workers=1, seed=2).counts[(None, None, False)]
+        self.assertAlmostEqual(batch.o_wins / batch.games, players.o_wins / 2000, delta=0.04)
+        self.assertAlmostEqual(batch.draws / batch.games, players.draws / 2000, delta=0.04)
+
+    def test_win_block_policy(self):
+        result = self.simulate_batch(20_000, ("win_block", "win_block"), seed=3)
+        self.assertGreater(result.draws / result.games, 0.3)
+        against_random = self.simulate_batch(20_000, ("random", "win_block"), seed=3)
+        self.assertLess(against_random.x_wins, against_random.o_wins)
+
+    def test_same_seed_same_result(self):
+        first = self.simulate_batch(5000, ("random", "win_block"), size=4, win_value=3, seed=4)
+        second = self.simulate_batch(5000, ("random", "win_block"), size=4, win_value=3, seed=4)
+        self.assertEqual(first[:4], second[:4])
+        self.assertEqual(len(first.length_counts), 17)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            self.simulate_batch(10, ("random", "minimax"))
+
+
+if __name__ == "__main__":
+    unittest.main()
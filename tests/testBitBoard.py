@@ -0,0 +1,83 @@
+import unittest
+from core.board import Board
+from core.bitboard import BitBoard, BitBoardLineChecker
+from games.connect4 import ConnectFour
+from tests.helpers import fill_random
+
+
+class TestBitBoard(unittest.TestCase):
+    def setUp(self):
+        self.board = BitBoard(6, 7)
+        self.board.add_to_square(3, 0, "r")
+        self.board.add_to_square(4, 1, "r")
+        self.board.add_to_square(5, 2, "r")
+        self.board.add_to_square(4, 3, "y")
+        self.board.add_to_square(3, 4, "y")
+
+    def test_square_operations(self):
+        self.assertTrue(self.board.square_is_occupied(3, 0))
+        self.assertFalse(self.board.square_is_occupied(0, 0))
+        self.assertIsNone(self.board.square_is_occupied(6, 0))
+        self.assertFalse(self.board.add_to_square(3, 0, "y"))
+        self.assertIsNone(self.board.add_to_square(0, 7, "y"))
+        self.assertEqual(self.board.get_square_value(4, 3), "y")
+        self.assertTrue(self.board.update_square(4, 3, "r"))
+        self.assertEqual(self.board.get_square_value(4, 3), "r")
+        self.assertTrue(self.board.update_square(4, 3, 0))
+        self.assertFalse(self.board.square_is_occupied(4, 3))
+
+    def test_segments_match_board(self):
+        self.assertEqual(self.board.get_diagonal_segment(3, 0, 3, up=False), ['r', 'r', 'r'])
+        self.assertEqual(self.board.get_diagonal_segment(3, 4, 3, up=False, right=False), ['y', 'y', 'r'])
+        self.assertEqual(self.board.get_diagonal_line_up(3, 4, 4, "left"), ['y', 0, 0, 0])
+        self.assertEqual(self.board.get_row_segment(4, 1, 3), ['r', 0, 'y'])
+
+    def test_full_board(self):
+        board = BitBoard(2, 2)
+        for row in range(2):
+            for column in range(2):
+                self.assertFalse(board.is_full())
+                board.add_to_square(row, column, "x")
+        self.assertTrue(board.is_full())
+        board.reset_board()
+        self.assertEqual(board.occupied_mask, 0)
+
+    def test_copy_is_independent(self):
+        board_copy = self.board.get_board(True)
+        board_copy.add_to_square(0, 0, "r")
+        self.assertFalse(self.board.square_is_occupied(0, 0))
+        self.assertEqual(board_copy.get_rows()[3], self.board.get_rows()[3])
+
+    def test_getters_match_board_on_random_positions(self):
+        for seed in range(50):
+            board, bitboard = Board(6, 7), BitBoard(6, 7)
+            fill_random([board, bitboard], 6, 7, ["r", "y"], seed)
+            self.assertEqual(bitboard.get_rows(), board.get_rows())
+            self.assertEqual(bitboard.get_columns(), board.get_columns())
+            for length in (2, 4, 6):
+                for direction in ("right", "left"):
+                    self.assertEqual(bitboard.get_diagonals(length, direction), board.get_diagonals(length, direction))
+            self.assertEqual(str(bitboard), str(board))
+
+    def test_line_checker_matches_connect_four_checker(self):
+        for seed in range(200):
+            board, bitboard = Board(6, 7), BitBoard(6, 7)
+            fill_random([board, bitboard], 6, 7, ["r", "y"], seed)
+            expected_checker = ConnectFour.ConnectFourWinChecker(board)
+            bit_checker = BitBoardLineChecker(bitboard, 4)
+            expected = expected_checker._check_for_winner()
+            self.assertEqual(bit_checker._check_for_winner(), expected)
+            if expected and expected_checker.win_type != "column": # ConnectFourWinChecker orders column wins column by column
+                self.assertEqual(bit_checker.get_win_info(), expected_checker.get_win_info())
+
+    def test_find_line(self):
+        self.assertIsNone(self.board.find_line(4))
+        self.board.add_to_square(2, 5, "y")
+        self.assertIsNone(self.board.find_line(4))
+        self.board.add_to_square(1, 6, "y")
+        self.assertEqual(self.board.find_line(4), ("y", "left_diagonal", 1, 6))
+        self.assertEqual(self.board.find_line(3), ("r", "right_diagonal", 3, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import pickle
+import unittest
+from random import Random
+from core.board import Board, marker_code, marker_name, SYMMETRY_TRANSFORMS
+from core.bitboard import BitBoard
+
+
+def hash_from_scratch(board):
+    """Rebuilds a board position on a new board to get its hash without any incremental history."""
+    fresh = Board(board.rows, board.columns)
+    for row in range(board.rows):
+        for column in range(board.columns):
+            if (value := board.get_square_value(row, column)) != 0:
+                fresh.add_to_square(row, column, value)
+    return fresh.hash
+
+
+class TestZobristHash(unittest.TestCase):
+    def test_empty_board_hash_is_zero(self):
+        board = Board(3, 3)
+        self.assertEqual(board.hash, 0)
+        board.add_to_square(1, 1, "x")
+        self.assertNotEqual(board.hash, 0)
+        board.reset_board()
+        self.assertEqual(board.hash, 0)
+
+    def test_hash_is_independent_of_move_order(self):
+        first, second = Board(3, 3), Board(3, 3)
+        for row, column, marker in [(0, 0, "x"), (1, 1, "o"), (2, 2, "x")]:
+            first.add_to_square(row, column, marker)
+        for row, column, marker in [(2, 2, "x"), (0, 0, "x"), (1, 1, "o")]:
+            second.add_to_square(row, column, marker)
+        self.assertEqual(first.hash, second.hash)
+
+    def test_marker_and_square_change_hash(self):
+        first, second = Board(3, 3), Board(3, 3)
+        first.add_to_square(0, 0, "x")
+        second.add_to_square(0, 0, "o")
+        self.assertNotEqual(first.hash, second.hash)
+        second.update_square(0, 0, "x")
+        self.assertEqual(first.hash, second.hash)
+        second.update_square(0, 0, 0)
+        self.assertEqual(second.hash, 0)
+
+    def test_failed_add_does_not_change_hash(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "x")
+        board_hash = board.hash
+        board.add_to_square(0, 0, "o")
+        board.add_to_square(3, 3, "o")
+        self.assertEqual(board.hash, board_hash)
+
+    def test_incremental_hash_matches_rebuilt_hash(self):
+        rng = Random(3)
+        for board in (Board(6, 7), BitBoard(6, 7)):
+            for _ in range(300):
+                row, column = rng.randrange(6), rng.randrange(7)
+                if rng.random() < 0.7:
+                    board.add_to_square(row, column, rng.choice("ry"))
+                else:
+                    board.update_square(row, column, rng.choice(["r", "y", 0]))
+                self.assertEqual(board.hash, hash_from_scratch(board))
+
+    def test_copy_keeps_hash(self):
+        board = Board(6, 7)
+        board.add_to_square(5, 3, "r")
+        self.assertEqual(board.copy().hash, board.hash)
+        bitboard = BitBoard(6, 7)
+        bitboard.add_to_square(5, 3, "r")
+        self.assertEqual(bitboard.copy().hash, board.hash)
+
+
+class TestMoveStack(unittest.TestCase):
+    def test_push_and_pop_restore_state(self):
+        for board in (Board(3, 3), BitBoard(3, 3)):
+            board.push(1, 1, "x")
+            rows, board_hash = board.view(), board.hash
+            self.assertTrue(board.push(0, 2, "o"))
+            self.assertEqual(board.last_move, (0, 2))
+            self.assertEqual(board.move_count, 2)
+            self.assertEqual(board.pop(), (0, 2, "o"))
+            self.assertEqual(board.view(), rows)
+            self.assertEqual(board.hash, board_hash)
+            self.assertEqual(board.last_move, (1, 1))
+
+    def test_failed_push_is_not_recorded(self):
+        board = Board(3, 3)
+        board.push(1, 1, "x")
+        self.assertFalse(board.push(1, 1, "o"))
+        self.assertIsNone(board.push(3, 1, "o"))
+        self.assertEqual(board.move_count, 1)
+
+    def test_pop_empty_stack_raises(self):
+        board = Board(3, 3)
+        with self.assertRaises(IndexError):
+            board.pop()
+        board.push(0, 0, "x")
+        board.reset_board()
+        with self.assertRaises(IndexError):
+            board.pop()
+
+
+class TestCompactStorage(unittest.TestCase):
+    def test_squares_are_stored_as_marker_codes(self):
+        board = Board(6, 7)
+        board.add_to_square(5, 3, "r")
+        board.add_to_square(4, 3, "y")
+        codes = board.codes()
+        self.assertEqual(len(codes), 42)
+        self.assertEqual(codes[5 * 7 + 3], marker_code("r"))
+        self.assertEqual(marker_name(codes[4 * 7 + 3]), "y")
+        self.assertEqual(codes.count(0), 40)
+        self.assertEqual(BitBoard(6, 7).codes(), bytes(42))
+
+    def test_new_markers_are_registered(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "b")
+        self.assertEqual(board.get_square_value(0, 0), "b")
+        self.assertEqual(marker_name(marker_code("b")), "b")
+        self.assertEqual(marker_code(0), 0)
+
+    def test_board_has_no_instance_dict(self):
+        for board in (Board(3, 3), BitBoard(3, 3)):
+            self.assertFalse(hasattr(board, "__dict__"))
+
+    def test_pickle_round_trip(self):
+        for board in (Board(6, 7), BitBoard(6, 7)):
+            board.push(5, 0, "r")
+            board.push(4, 0, "y")
+            restored = pickle.loads(pickle.dumps(board))
+            self.assertIs(type(restored), type(board))
+            self.assertEqual(restored.view(), board.view())
+            self.assertEqual(restored.hash, board.hash)
+            self.assertEqual(restored.pop(), (4, 0, "y"))
+
+    def test_pickle_maps_codes_through_marker_names(self):
+        board = Board(3, 3)
+        board.add_to_square(1, 1, "o")
+        state = board.__getstate__()
+        markers = list(state["markers"])
+        markers[marker_code("o")] = "x" # Stands in for a process where the code belongs to a different marker
+        state["markers"] = tuple(markers)
+        restored = Board.__new__(Board)
+        restored.__setstate__(state)
+        self.assertEqual(restored.get_square_value(1, 1), "x")
+
+
+class TestSymmetry(unittest.TestCase):
+    def test_every_symmetry_has_the_same_canonical_form(self):
+        board = Board(3, 3)
+        for row, column, marker in [(0, 0, "x"), (0, 1, "o"), (2, 1, "x")]:
+            board.add_to_square(row, column, marker)
+        canonical, _ = board.canonical()
+        for transform in SYMMETRY_TRANSFORMS:
+            other = Board(3, 3)
+            for row, column, marker in [(0, 0, "x"), (0, 1, "o"), (2, 1, "x")]:
+                other.add_to_square(*board.map_move(row, column, transform), marker)
+            other_canonical, other_transform = other.canonical()
+            self.assertEqual(other_canonical, canonical)
+            for row, column, marker in [(0, 0, "x"), (0, 1, "o"), (2, 1, "x")]:
+                moved = other.map_move(*board.map_move(row, column, transform), other_transform)
+                self.assertEqual(other_canonical[moved[0]][moved[1]], marker)
+
+    def test_map_move_round_trip(self):
+        board = Board(3, 3)
+        for transform in SYMMETRY_TRANSFORMS:
+            for row in range(3):
+                for column in range(3):
+                    moved = board.map_move(row, column, transform)
+                    self.assertEqual(board.map_move(*moved, transform, to_canonical=False), (row, column))
+
+    def test_reachable_tictactoe_positions(self):
+        positions, canonical_positions = set(), set()
+        def play(board, turn):
+            view = board.view()
+            if view in positions:
+                return
+            positions.add(view)
+            canonical_positions.add(board.canonical()[0])
+            if board.move_count == 9 or self.has_line(view):
+                return
+            for row in range(3):
+                for column in range(3):
+                    if board.push(row, column, "xo"[turn]):
+                        play(board, 1 - turn)
+                        board.pop()
+        play(Board(3, 3), 0)
+        self.assertEqual(len(positions), 5478)
+        self.assertEqual(len(canonical_positions), 765)
+
+    @staticmethod
+    def has_line(view):
+        cells = view.cells
+        return any(cells[a] != 0 and cells[a] == cells[b] == cells[c]
+                   for a, b, c in [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)])
+
+    def test_connect_four_mirror_only(self):
+        board = Board(6, 7)
+        board.add_to_square(5, 0, "r")
+        canonical, transform = board.canonical(("identity", "mirror"))
+        self.assertEqual(transform, "mirror")
+        self.assertEqual(canonical[5][6], "r")
+        self.assertEqual(board.map_move(5, 0, transform), (5, 6))
+        self.assertEqual(Board(6, 7).canonical(("identity", "mirror"))[1], "identity")
+        with self.assertRaises(ValueError):
+            board.canonical(("rotate_90",))
+        with self.assertRaises(ValueError):
+            board.map_move(0, 0, "spin")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from core.board import Board, BoardView, CHANGE_LOG_SIZE
+from core.bitboard import BitBoard
+from core.sparseboard import SparseBoard
+
+
+class TestBoardViews(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(3, 3)
+        self.board.add_to_square(0, 0, "o")
+        self.board.add_to_square(1, 2, "x")
+        self.board.add_to_square(2, 0, "o")
+
+    def test_view_is_cached_until_board_changes(self):
+        view = self.board.view()
+        self.assertIsInstance(view, BoardView)
+        self.assertIs(self.board.view(), view)
+        self.assertIs(self.board.iter_rows(), view.rows)
+        self.board.add_to_square(1, 1, "x")
+        self.assertIsNot(self.board.view(), view)
+        self.assertEqual(self.board.view().version, self.board.version)
+
+    def test_old_view_is_a_snapshot(self):
+        view = self.board.view()
+        self.board.update_square(0, 0, "x")
+        self.assertEqual(view[0], ("o", 0, 0))
+        self.assertEqual(self.board.iter_rows()[0], ("x", 0, 0))
+
+    def test_failed_add_does_not_change_version(self):
+        version = self.board.version
+        self.assertFalse(self.board.add_to_square(0, 0, "x"))
+        self.assertIsNone(self.board.add_to_square(3, 0, "x"))
+        self.assertEqual(self.board.version, version)
+        self.board.reset_board()
+        self.assertGreater(self.board.version, version)
+
+    def test_view_lines_match_list_getters(self):
+        self.assertEqual([list(row) for row in self.board.iter_rows()], self.board.get_rows())
+        self.assertEqual([list(column) for column in self.board.iter_columns()], self.board.get_columns())
+        for length in (1, 2, 3, 4):
+            for direction in ("right", "left"):
+                self.assertEqual([list(line) for line in self.board.iter_diagonals(length, direction)],
+                                 self.board.get_diagonals(length, direction))
+
+    def test_view_is_read_only(self):
+        view = self.board.get_board()
+        with self.assertRaises(TypeError):
+            view[0][0] = "x"
+        rows = view.copy()
+        rows[0][0] = "x"
+        self.assertEqual(self.board.get_square_value(0, 0), "o")
+
+    def test_mutable_copy_is_independent(self):
+        board_copy = self.board.get_board(mutable=True)
+        board_copy.add_to_square(1, 1, "x")
+        self.assertFalse(self.board.square_is_occupied(1, 1))
+
+
+class TestChangeTracking(unittest.TestCase):
+    def test_changes_since_version(self):
+        for board in (Board(6, 7), BitBoard(6, 7), SparseBoard(6, 7)):
+            board.push(5, 3, "r")
+            version = board.version
+            self.assertEqual(board.changes_since(version), set())
+            board.push(5, 4, "y")
+            board.push(4, 3, "r")
+            self.assertEqual(board.changes_since(version), {(5, 4), (4, 3)})
+            board.pop()
+            self.assertEqual(board.changes_since(version), {(5, 4), (4, 3)}) # undone squares must be redrawn too
+            self.assertEqual(board.changes_since(0), {(5, 3), (5, 4), (4, 3)})
+
+    def test_reset_and_old_versions_need_full_redraw(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "x")
+        version = board.version
+        board.reset_board()
+        self.assertIsNone(board.changes_since(version))
+        self.assertEqual(board.changes_since(board.version), set())
+        version = board.version
+        for _ in range(CHANGE_LOG_SIZE + 1):
+            board.update_square(1, 1, "x")
+        self.assertIsNone(board.changes_since(version))
+        self.assertEqual(board.changes_since(board.version - 1), {(1, 1)})
+
+    def test_failed_moves_are_not_recorded(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "x")
+        version = board.version
+        board.add_to_square(0, 0, "o")
+        board.add_to_square(3, 3, "o")
+        self.assertEqual(board.changes_since(version), set())
+
+    def test_observers(self):
+        board = Board(3, 3)
+        calls = []
+        def observer(row, column, value):
+            # The board already holds the new value when observers are called
+            calls.append((row, column, value, None if row is None else board.get_square_value(row, column)))
+        board.add_observer(observer)
+        board.push(1, 1, "x")
+        board.pop()
+        board.reset_board()
+        self.assertEqual(calls, [(1, 1, "x", "x"), (1, 1, 0, 0), (None, None, None, None)])
+        board.remove_observer(observer)
+        board.push(0, 0, "o")
+        self.assertEqual(len(calls), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -71,6 +71,35 @@ class TestConnectFour(unittest.TestCase):
             for col, piece in enumerate(row):
                 self.game.make_move(col, piece)
         self.assertFalse(self.game.check_winner())
-    
+
+    def test_undo_move(self):
+        """Test taking back moves restores the board and column heights"""
+        self.game.make_move(3, "r")
+        before = self.game.board.view()
+        self.game.make_move(3, "y")
+        self.assertEqual(self.game.undo_move(), (4, 3))
+        self.assertEqual(self.game.board.view(), before)
+        self.assertEqual(self.game.height_list[3], 5)
+        self.assertEqual(self.game.round_count, 1)
+        self.game.undo_move()
+        self.assertIsNone(self.game.undo_move())
+
+    def test_animation_states_leave_board_unchanged(self):
+        """Test the dropping animation frames end at the played square without changing the board"""
+        self.game.make_move(2, "r")
+        self.game.make_move(2, "y")
+        before = self.game.board.view()
+        changes = []
+        self.game.board.add_observer(lambda *change: changes.append(change))
+        frames = self.game.get_board_animation_states(player_marker="y")
+        self.assertEqual(changes, []) # Observers never see the animation frames
+        self.assertEqual(self.game.board.changes_since(before.version), set())
+        self.assertEqual(len(frames), 5)
+        self.assertEqual(frames[0][0][2], "y")
+        self.assertEqual(frames[0][4][2], 0)
+        self.assertEqual(frames[-1], before)
+        self.assertEqual(self.game.board.view(), before)
+        self.assertEqual(self.game.board.last_move, (4, 2))
+
 if __name__ == "__main__":
     unittest.main()
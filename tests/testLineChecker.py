@@ -0,0 +1,223 @@
+import unittest
+from importlib.util import find_spec
+from random import Random
+from core.board import Board, LineChecker, batch_win_info, get_winning_lines, marker_code
+from games.connect4 import ConnectFour
+
+
+class TestCheckFromMove(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(6, 7)
+        self.checker = LineChecker(self.board, 4)
+
+    def test_no_win_for_empty_or_off_board_square(self):
+        self.assertIsNone(self.checker.check_from_move(0, 0))
+        self.assertIsNone(self.checker.check_from_move(6, 7))
+
+    def test_win_info_reports_start_of_line(self):
+        for column in (4, 2, 3, 5):
+            self.board.add_to_square(5, column, "r")
+        self.assertEqual(self.checker.check_from_move(5, 3), {"marker": "r", "type": "row", "row": 5, "column": 2})
+        self.assertEqual(self.checker.get_win_info(), {"marker": "r", "type": "row", "row": 5, "column": 2})
+
+    def test_left_diagonal_starts_at_top_square(self):
+        for n in range(4):
+            self.board.add_to_square(2 + n, 4 - n, "x")
+        self.assertEqual(self.checker.check_from_move(4, 2), {"marker": "x", "type": "left_diagonal", "row": 2, "column": 4})
+
+    def test_win_value_too_large(self):
+        with self.assertRaises(ValueError):
+            LineChecker(self.board, 8).check_from_move(0, 0)
+
+    def test_matches_full_board_check_in_random_games(self):
+        rng = Random(7)
+        for _ in range(200):
+            game = ConnectFour()
+            full_checker = ConnectFour.ConnectFourWinChecker(game.board)
+            for turn in range(game.board_size):
+                column = rng.choice([c for c in range(game.columns) if not game.is_full(c)])
+                game.make_move(column, "ry"[turn % 2])
+                expected = full_checker._check_for_winner()
+                self.assertEqual(game.check_winner(), expected)
+                if expected:
+                    self.assertEqual(game.get_winner_info(), full_checker.get_win_info())
+                    break
+
+
+class TestWinningLines(unittest.TestCase):
+    def test_tictactoe_lines(self):
+        winning_lines = get_winning_lines(3, 3, 3)
+        self.assertEqual(len(winning_lines.lines), 8)
+        self.assertEqual(winning_lines.lines[0], (0, 1, 2))
+        self.assertEqual(winning_lines.lines[3], (0, 3, 6))
+        self.assertEqual(winning_lines.lines[6], (0, 4, 8))
+        self.assertEqual(winning_lines.lines[7], (2, 4, 6))
+        self.assertEqual(winning_lines.line_info[7], ("left_diagonal", 0, 2))
+        self.assertEqual(len(winning_lines.cell_lines[4]), 4) # centre square is on a row, column and both diagonals
+        self.assertEqual(len(winning_lines.cell_lines[1]), 2)
+
+    def test_connect_four_line_count_and_cache(self):
+        winning_lines = get_winning_lines(6, 7, 4)
+        self.assertEqual(len(winning_lines.lines), 69)
+        self.assertEqual({win_type: len(ids) for win_type, ids in winning_lines.type_ranges.items()},
+                         {"row": 24, "column": 21, "right_diagonal": 12, "left_diagonal": 12})
+        self.assertIs(get_winning_lines(6, 7, 4), winning_lines)
+        for cell, line_ids in enumerate(winning_lines.cell_lines):
+            for line_id in line_ids:
+                self.assertIn(cell, winning_lines.lines[line_id])
+
+    def test_line_info_matches_cells(self):
+        winning_lines = get_winning_lines(6, 7, 4)
+        for line, (win_type, row, column) in zip(winning_lines.lines, winning_lines.line_info):
+            self.assertEqual(line[0], row * 7 + column)
+
+    def test_win_value_too_large_has_no_lines(self):
+        self.assertEqual(get_winning_lines(3, 3, 4).lines, ())
+        with self.assertRaises(ValueError):
+            get_winning_lines(3, 3, 0)
+
+
+class TestIterLineMatches(unittest.TestCase):
+    def test_matches_line_check(self):
+        rng = Random(12)
+        for _ in range(300):
+            sequence = [rng.choice([0, 0, "x", "o"]) for _ in range(rng.randint(4, 9))]
+            for pattern in [(0, 1, "any", 2, 3), (0, 2, "o", 2, 4), ("x", 2, 0, 1, 3)]:
+                expected = LineChecker.line_check(sequence, *pattern, all_occurrences=True)
+                found = {}
+                for match in LineChecker.iter_line_matches(sequence, *pattern):
+                    found.setdefault(match.other_element, []).append(
+                        {"window": match.window, "window_indices": list(match.window_indices),
+                         "absolute_indices": list(match.absolute_indices)})
+                self.assertEqual(found, expected)
+
+    def test_stops_at_first_match(self):
+        class CountingLine(list):
+            reads = 0
+            def __getitem__(self, index):
+                CountingLine.reads += 1
+                return super().__getitem__(index)
+        line = CountingLine(["o", 0, 0] + [0] * 97)
+        match = next(LineChecker.iter_line_matches(line, 0, 2, "o", 1, 3))
+        self.assertEqual((match.window, match.other_element, match.window_indices), (0, "o", (1, 2)))
+        self.assertEqual(CountingLine.reads, 3)
+
+    def test_invalid_window_raises_before_iterating(self):
+        with self.assertRaises(ValueError):
+            LineChecker.iter_line_matches([0, 0], 0, 1, "x", 2, 3)
+
+
+class TestFindAllWins(unittest.TestCase):
+    def test_double_line_win(self):
+        board = Board(3, 3)
+        for row, column in [(0, 0), (0, 1), (0, 2), (1, 1), (2, 2)]:
+            board.add_to_square(row, column, "x")
+        checker = LineChecker(board, 3)
+        wins = checker.find_all_wins()
+        self.assertEqual([(win["type"], win["row"], win["column"]) for win in wins], [("row", 0, 0), ("right_diagonal", 0, 0)])
+        self.assertEqual(wins[1]["cells"], [(0, 0), (1, 1), (2, 2)])
+        self.assertEqual(checker.get_winning_cells(), {(0, 0), (0, 1), (0, 2), (1, 1), (2, 2)})
+        self.assertIsNone(checker.get_win_info()["marker"]) # finding every win does not set the win info
+
+    def test_matches_full_board_check_on_random_positions(self):
+        rng = Random(9)
+        for _ in range(300):
+            board = Board(6, 7)
+            for _ in range(rng.randint(0, 42)):
+                board.add_to_square(rng.randrange(6), rng.randrange(7), rng.choice("ry"))
+            checker = ConnectFour.ConnectFourWinChecker(board)
+            wins = checker.find_all_wins()
+            if checker._check_for_winner():
+                self.assertEqual({key: wins[0][key] for key in ("marker", "type", "row", "column")}, checker.get_win_info())
+            else:
+                self.assertEqual(wins, [])
+            for win in wins:
+                self.assertEqual({board.get_square_value(*cell) for cell in win["cells"]}, {win["marker"]})
+
+    def test_overline_and_game_cells(self):
+        game = ConnectFour()
+        for column in (0, 1, 3, 4):
+            game.make_move(column, "r")
+        game.make_move(2, "r")
+        self.assertTrue(game.check_winner())
+        self.assertEqual(game.get_winning_cells(), {(5, column) for column in range(5)})
+        self.assertEqual(len(game._win.find_all_wins()), 2)
+
+
+@unittest.skipUnless(find_spec("numpy"), "NumPy is not installed")
+class TestLineCheckArray(unittest.TestCase):
+    def assert_matches_line_check(self, lines, *pattern):
+        result = LineChecker.line_check_array(lines, *pattern)
+        for line_index, line in enumerate(lines):
+            expected = LineChecker.line_check(line, *pattern, all_occurrences=True)
+            expected_windows = {(marker_code(other), match["window"]) for other, found in expected.items() for match in found}
+            found_windows = {(int(result.other_codes[line_index, window]), window)
+                             for window in range(result.matches.shape[1]) if result.matches[line_index, window]}
+            self.assertEqual(found_windows, expected_windows, line)
+
+    def test_matches_line_check_on_random_lines(self):
+        rng = Random(11)
+        lines = [[rng.choice([0, 0, "x", "o"]) for _ in range(9)] for _ in range(300)]
+        self.assert_matches_line_check(lines, 0, 1, "any", 2, 3)
+        self.assert_matches_line_check(lines, 0, 2, "o", 2, 4)
+        self.assert_matches_line_check(lines, "x", 3, 0, 1, 4)
+
+    def test_counts(self):
+        result = LineChecker.line_check_array([["x", "x", 0, "o"]], 0, 1, "any", 2, 3)
+        self.assertEqual(result.matches.tolist(), [[True, False]])
+        self.assertEqual(result.target_counts.tolist(), [[1, 1]])
+        self.assertEqual(result.other_counts.tolist(), [[2, 1]])
+
+    def test_board_lines_array(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "o")
+        board.add_to_square(1, 1, "o")
+        lines = LineChecker.board_lines_array(board, 3)
+        self.assertEqual(lines.shape, (8, 3))
+        result = LineChecker.line_check_array(lines, 0, 1, "o", 2, 3)
+        self.assertEqual(result.matches[:, 0].nonzero()[0].tolist(), [6]) # only the right diagonal
+        self.assertEqual(LineChecker.board_lines_array(board, 4).shape, (0, 4))
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            LineChecker.line_check_array([[0, 0]], 0, 1, "x", 2, 3)
+        with self.assertRaises(ValueError):
+            LineChecker.line_check_array([[0, 0, 0]], 0, 1, "x", 1, 3)
+
+
+@unittest.skipUnless(find_spec("numpy"), "NumPy is not installed")
+class TestBatchWinInfo(unittest.TestCase):
+    def random_boards(self, rows, columns, markers, count, seed):
+        rng = Random(seed)
+        boards = []
+        for _ in range(count):
+            board = Board(rows, columns)
+            for _ in range(rng.randint(0, rows * columns)):
+                board.add_to_square(rng.randrange(rows), rng.randrange(columns), rng.choice(markers))
+            boards.append(board)
+        return boards
+
+    def test_matches_connect_four_checker(self):
+        boards = self.random_boards(6, 7, "ry", 300, 5)
+        results = batch_win_info(boards, 4)
+        for board, result in zip(boards, results):
+            checker = ConnectFour.ConnectFourWinChecker(board)
+            checker._check_for_winner()
+            self.assertEqual(result, checker.get_win_info())
+
+    def test_matches_tictactoe_checker(self):
+        boards = self.random_boards(3, 3, "xo", 300, 6)
+        results = batch_win_info([board.view().copy() for board in boards], 3) # nested lists of markers
+        for board, result in zip(boards, results):
+            checker = LineChecker(board, 3)
+            checker._check_for_winner()
+            self.assertEqual(result, checker.get_win_info())
+
+    def test_empty_and_invalid_input(self):
+        self.assertEqual(batch_win_info([[[0] * 3] * 3], 4), [{"marker": None, "type": None, "row": None, "column": None}])
+        with self.assertRaises(ValueError):
+            batch_win_info([[0, 0, 0]], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
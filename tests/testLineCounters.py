@@ -0,0 +1,84 @@
+import unittest
+from random import Random
+from core.board import Board
+from core.bitboard import BitBoard
+from games.connect4 import ConnectFour
+
+
+def brute_force_lines_with(board, win_value, marker, count):
+    """Rescans every winning line to find lines with count of the marker and blanks in every other square."""
+    counters = board.line_counters(win_value)
+    cells = board.view().cells
+    found = []
+    for line_id, line in enumerate(counters.winning_lines.lines):
+        values = [cells[index] for index in line]
+        if values.count(0) == win_value - count and (count == 0 or values.count(marker) == count):
+            found.append(line_id)
+    return found
+
+
+class TestLineCounters(unittest.TestCase):
+    def test_counters_follow_push_and_pop(self):
+        rng = Random(4)
+        for board in (Board(6, 7), BitBoard(6, 7)):
+            counters = board.line_counters(4)
+            for _ in range(400):
+                if board.move_count and rng.random() < 0.3:
+                    board.pop()
+                else:
+                    board.push(rng.randrange(6), rng.randrange(7), rng.choice("ry"))
+                for marker in "ry":
+                    for count in range(5):
+                        self.assertEqual(counters.lines_with(marker, count), brute_force_lines_with(board, 4, marker, count))
+
+    def test_counters_built_from_existing_board(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "o")
+        board.add_to_square(1, 1, "o")
+        board.add_to_square(0, 2, "x")
+        counters = board.line_counters(3)
+        self.assertIs(board.line_counters(3), counters)
+        self.assertEqual(counters.lines_with("o", 2), [6]) # the right diagonal
+        self.assertEqual(counters.completing_cells("o"), [8])
+        self.assertEqual(counters.count(0, "o"), 1)
+        self.assertEqual(counters.count(0, 0), 1)
+        board.update_square(0, 2, "o")
+        self.assertEqual(counters.lines_with("o", 2), [0, 6, 7])
+        board.reset_board()
+        self.assertEqual(counters.lines_with("o", 2), [])
+        self.assertEqual(len(counters.lines_with("o", 0)), 8)
+
+    def test_fork_cells(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "x")
+        board.add_to_square(2, 2, "x")
+        board.add_to_square(1, 1, "o")
+        self.assertEqual(sorted(board.line_counters(3).fork_cells("x")), [2, 6]) # top right and bottom left corners
+
+    def test_connect_four_win_or_block(self):
+        game = ConnectFour()
+        game.create_ai_player(difficulty=False)
+        ai_player = game.get_player(1)
+        for column in (0, 1, 2):
+            game.make_move(column, "r")
+        self.assertEqual(ai_player.win_or_block(), 3) # block the open end of the row
+        game.make_move(3, "y")
+        game.make_move(6, "r")
+        for _ in range(3):
+            game.make_move(5, "y")
+        self.assertEqual(ai_player.win_or_block(), 5) # win on top of the column before blocking anything
+
+    def test_connect_four_easy_mode_skips_diagonals(self):
+        game = ConnectFour()
+        game.create_ai_player(difficulty=None)
+        ai_player = game.get_player(1)
+        # 'r' holds three squares of the right diagonal up from the bottom left and needs (2, 3) to complete it
+        for column, marker in [(0, "r"), (1, "y"), (1, "r"), (2, "r"), (2, "y"), (2, "r"), (3, "r"), (3, "y"), (3, "y")]:
+            game.make_move(column, marker)
+        self.assertIsNone(ai_player.win_or_block())
+        ai_player.difficulty = False
+        self.assertEqual(ai_player.win_or_block(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
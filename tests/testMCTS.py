@@ -0,0 +1,78 @@
+import random
+import time
+import unittest
+from core.board import Board
+from games.mcts import MonteCarloTreeSearch
+from games.tictactoe import TicTacToe
+
+
+class TestMonteCarloTreeSearch(unittest.TestCase):
+    def test_wins_before_blocking(self):
+        board = Board(6, 6)
+        for row, column, marker in [(0, 0, "x"), (3, 0, "o"), (0, 1, "x"), (3, 1, "o"), (0, 2, "x"), (3, 2, "o")]:
+            board.add_to_square(row, column, marker)
+        search = MonteCarloTreeSearch(6, 6, 4, playouts=10, seed=0)
+        self.assertEqual(search.best_move(board, "x", "o"), (0, 3))
+        self.assertEqual(search.best_move(board, "o", "x"), (3, 3))
+
+    def test_fixed_playouts_are_repeatable(self):
+        board = Board(6, 6)
+        board.add_to_square(2, 2, "x")
+        first = MonteCarloTreeSearch(6, 6, 4, playouts=300, seed=4)
+        second = MonteCarloTreeSearch(6, 6, 4, playouts=300, seed=4)
+        self.assertEqual(first.best_move(board, "o", "x"), second.best_move(board, "o", "x"))
+        self.assertEqual(first.last_playouts, 300)
+
+    def test_time_budget(self):
+        search = MonteCarloTreeSearch(8, 8, 5, time_limit=0.1, seed=0)
+        start = time.perf_counter()
+        self.assertIsNotNone(search.best_move(Board(8, 8), "x", "o"))
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertGreater(search.last_playouts, 0)
+
+    def test_no_playouts_plays_a_random_legal_move(self):
+        board = Board(6, 6)
+        board.add_to_square(2, 2, "x")
+        search = MonteCarloTreeSearch(6, 6, 4, playouts=0, seed=3)
+        row, column = search.best_move(board, "o", "x")
+        self.assertFalse(board.square_is_occupied(row, column))
+        self.assertEqual(search.last_playouts, 0)
+        self.assertIsNone(search._root)
+
+    def test_tree_is_reused_after_the_opponent_replies(self):
+        board = Board(6, 6)
+        board.push(2, 2, "x")
+        search = MonteCarloTreeSearch(6, 6, 4, playouts=2000, seed=1)
+        board.push(*search.best_move(board, "o", "x"), "o")
+        reply = search._root.children[0].move
+        board.push(*divmod(reply, 6), "x")
+        self.assertGreater(search._reused_root(*self.masks(board, "o", "x")).visits, 0)
+        board.reset_board()
+        self.assertIsNone(search._reused_root(*self.masks(board, "o", "x")))
+
+    @staticmethod
+    def masks(board, marker, opponent):
+        cells = board.view().cells
+        return (sum(1 << index for index, value in enumerate(cells) if value == marker),
+                sum(1 << index for index, value in enumerate(cells) if value == opponent))
+
+    def test_player_beats_random_play_on_a_large_board(self):
+        random.seed(2)
+        game = TicTacToe(board_dimension=6, win_value=4)
+        game.players = (
+            TicTacToe.AITestPlayer(name="AI one", marker="x", game=game, difficulty=None),
+            TicTacToe.MCTSPlayer(name="AI two", marker="o", game=game, playouts=300, seed=2),
+        )
+        for _ in range(4):
+            for turn in range(game.board_size):
+                player = game.players[turn % 2] if game.go_first else game.players[turn % 2 - 1]
+                row, column = player.move(game.board)
+                self.assertTrue(game.make_move(row, column, player.marker))
+                if game.check_winner():
+                    break
+            self.assertEqual(game.get_winner_info()["marker"], "o")
+            game.reset_game_state()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import random
+import time
+import unittest
+from collections import Counter
+from games import qubic
+from games.qubic import Qubic, QubicSearch, square_index
+
+
+def mask_of(*squares):
+    return sum(1 << square_index(*square) for square in squares)
+
+
+class TestWinningLines(unittest.TestCase):
+    def test_seventy_six_lines_of_four(self):
+        self.assertEqual(len(set(qubic.WINNING_LINES)), 76)
+        self.assertTrue(all(line.bit_count() == 4 for line in qubic.WINNING_LINES))
+        self.assertEqual(Counter(info.win_type for info in qubic.LINE_INFO),
+                         {"row": 16, "column": 16, "pillar": 16, "layer_diagonal": 8, "vertical_diagonal": 16,
+                          "space_diagonal": 4})
+        # The 8 corners and 8 centre squares are on seven lines, every other square on four
+        self.assertEqual(Counter(len(lines) for lines in qubic.CELL_LINES), {7: 16, 4: 48})
+
+    def test_line_sets_match_line_masks(self):
+        for square in range(qubic.CELLS):
+            line_ids = [line_id for line_id, mask in enumerate(qubic.WINNING_LINES) if mask >> square & 1]
+            self.assertEqual(qubic.CELL_LINE_SETS[square], sum(1 << line_id for line_id in line_ids))
+
+    def test_bit_sliced_counts(self):
+        random.seed(1)
+        squares = random.sample(range(qubic.CELLS), 20)
+        side = qubic._side_from_mask(sum(1 << square for square in squares))
+        _, digit0, digit1, digit2 = side
+        for line_id, mask in enumerate(qubic.WINNING_LINES):
+            count = sum(mask >> square & 1 for square in squares)
+            self.assertEqual((digit0 >> line_id & 1) + 2 * (digit1 >> line_id & 1) + 4 * (digit2 >> line_id & 1), count)
+
+
+class TestQubic(unittest.TestCase):
+    def setUp(self):
+        self.game = Qubic()
+
+    def play(self, moves):
+        for index, square in enumerate(moves):
+            self.assertTrue(self.game.make_move(*square, "xo"[index % 2]))
+
+    def test_every_line_type_wins(self):
+        lines = {
+            "row": [(2, 1, column) for column in range(4)],
+            "pillar": [(layer, 3, 0) for layer in range(4)],
+            "vertical_diagonal": [(layer, 3 - layer, 2) for layer in range(4)],
+            "space_diagonal": [(layer, layer, 3 - layer) for layer in range(4)],
+        }
+        for win_type, squares in lines.items():
+            game = Qubic()
+            for square in squares:
+                self.assertFalse(game.check_winner())
+                game.make_move(*square, "o")
+            self.assertTrue(game.check_winner())
+            game.update_winner_info()
+            self.assertEqual((game.winner_marker, game.win_type), ("o", win_type))
+            self.assertEqual(game.get_winning_cells(), set(squares))
+
+    def test_moves_and_undo(self):
+        self.assertTrue(self.game.make_move(0, 1, 2, "x"))
+        self.assertFalse(self.game.make_move(0, 1, 2, "o"))
+        self.assertFalse(self.game.make_move(4, 0, 0, "o"))
+        self.assertEqual(self.game.get_board()[0][1][2], "x")
+        self.assertEqual(self.game.undo_move(), (0, 1, 2))
+        self.assertEqual((self.game.occupied, self.game.round_count), (0, 0))
+        self.assertIsNone(self.game.undo_move())
+
+    def test_winner_info_and_stats(self):
+        self.game.create_ai_player(name="CPU", difficulty=None)
+        self.play([(1, 0, 0), (3, 3, 3), (1, 1, 1), (3, 3, 2), (1, 2, 2), (3, 3, 1), (1, 3, 3)])
+        self.assertTrue(self.game.check_winner())
+        self.game.update_winner_info()
+        self.game.update_players_stats()
+        self.assertEqual(self.game.get_winner_string(), "Player 1 wins in a diagonal of layer 2.")
+        self.assertEqual(self.game.players[0].win_count, 1)
+        self.assertEqual(self.game.players[1].lost_count, 1)
+        self.game.reset_game_state()
+        self.assertEqual((self.game.occupied, self.game.winner_name, self.game.go_first), (0, None, False))
+
+
+class TestQubicAI(unittest.TestCase):
+    def setUp(self):
+        self.game = Qubic()
+        self.game.create_ai_player(name="CPU", difficulty=True)
+        self.ai = self.game.players[1]
+        self.ai.search_time = 0.5
+
+    def test_takes_the_win_before_blocking(self):
+        self.game.masks = {"x": mask_of((0, 0, 0), (0, 0, 1), (0, 0, 2)), "o": mask_of((2, 0, 3), (2, 1, 2), (2, 2, 1))}
+        for difficulty in (True, False):
+            self.ai.difficulty = difficulty
+            self.assertEqual(self.ai.move(), (2, 3, 0))
+
+    def test_blocks_a_line_of_three(self):
+        self.game.masks = {"x": mask_of((0, 0, 0), (1, 1, 1), (2, 2, 2)), "o": mask_of((0, 3, 3), (1, 3, 3))}
+        for difficulty in (True, False):
+            self.ai.difficulty = difficulty
+            self.assertEqual(self.ai.move(), (3, 3, 3))
+
+    def test_finds_a_forced_win_with_two_threats(self):
+        # o plays (1, 1, 0) to threaten both row 2 of layer 2 and the pillar, which x cannot both block
+        search = QubicSearch(time_limit=5.0, max_depth=3)
+        own = mask_of((1, 1, 1), (1, 1, 2), (0, 1, 0), (2, 1, 0))
+        other = mask_of((0, 0, 0), (0, 3, 3), (3, 0, 3), (3, 3, 0))
+        self.assertEqual(qubic.square_position(search.best_move(own, other)), (1, 1, 0))
+        self.assertLessEqual(search.depth_reached, 3)
+
+    def test_search_keeps_to_the_time_budget(self):
+        search = QubicSearch(time_limit=0.3)
+        start = time.perf_counter()
+        move = search.best_move(mask_of((1, 1, 1)), 0)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertNotEqual(move, square_index(1, 1, 1))
+        self.assertGreater(search.depth_reached, 1)
+
+    def test_no_move_on_a_full_cube(self):
+        self.game.masks = {"x": 0x5555_5555_5555_5555, "o": 0xAAAA_AAAA_AAAA_AAAA}
+        self.assertIsNone(self.ai.search_move())
+        for difficulty in (None, False, True):
+            self.ai.difficulty = difficulty
+            self.assertIsNone(self.ai.move())
+
+    def test_hard_beats_easy(self):
+        random.seed(2)
+        self.game.add_ai_players_for_testing(None, True)
+        self.game.players[1].search_time = 0.05
+        for turn in range(self.game.board_size):
+            player = self.game.players[turn % 2]
+            self.assertTrue(self.game.make_move(*player.move(), player.marker))
+            if self.game.check_winner():
+                break
+        self.game.update_winner_info()
+        self.assertEqual(self.game.winner_marker, "o")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import argparse
+import unittest
+from unittest import mock
+from games.simulate import make_shards, parse_pairing, play_shard, simulate, Shard
+from games.tictactoe import TicTacToe
+
+
+class TestSimulate(unittest.TestCase):
+    def test_shards_split_games_between_first_movers(self):
+        shards = make_shards([(None, True)], 25, 10, seed=3)
+        self.assertEqual([(shard.x_first, shard.games) for shard in shards],
+                         [(True, 10), (True, 3), (False, 10), (False, 2)])
+        self.assertEqual(len({shard.seed for shard in shards}), 4)
+
+    def test_shards_are_reproducible(self):
+        shard = Shard(None, False, True, 50, "7:0")
+        self.assertEqual(play_shard(shard), play_shard(shard))
+        result = play_shard(shard)
+        self.assertEqual(result.x_wins + result.o_wins + result.draws + result.unfinished, 50)
+
+    def test_invalid_moves_do_not_end_games_early(self):
+        finished = []
+        reset_game_state = TicTacToe.reset_game_state
+
+        def record_and_reset(game):
+            finished.append(game.board_is_full() or game.get_winner_info()["marker"] is not None)
+            reset_game_state(game)
+
+        with mock.patch.object(TicTacToe, "reset_game_state", record_and_reset):
+            result = play_shard(Shard(False, False, True, 300, "0:0"))
+        self.assertGreater(result.invalid_moves, 0)
+        self.assertEqual(result.unfinished, 0)
+        self.assertTrue(all(finished))
+
+    def test_games_where_no_one_can_move_are_not_draws(self):
+        with mock.patch.object(TicTacToe.AITestPlayer, "move", return_value=(0, 0)):
+            result = play_shard(Shard(None, None, True, 5, "0:0"))
+        self.assertEqual(result, (0, 0, 0, 10, 5))
+
+    def test_results_do_not_depend_on_the_number_of_workers(self):
+        pairings = [(None, True), (False, False)]
+        serial = simulate(pairings, games=40, workers=1, seed=1, chunk_size=10)
+        parallel = simulate(pairings, games=40, workers=2, seed=1, chunk_size=10)
+        self.assertEqual(serial.counts, parallel.counts)
+        self.assertEqual(serial.games, 80)
+
+    def test_hard_mode_never_loses(self):
+        result = simulate([(None, True), (False, True), (True, True)], games=200, workers=1, seed=2)
+        for (_, _, x_first), counts in result.counts.items():
+            self.assertEqual(counts.x_wins, 0)
+            self.assertEqual(counts.invalid_moves, 0)
+        self.assertEqual(result.counts[(True, True, True)].draws, 100)
+
+    def test_parse_pairing(self):
+        self.assertEqual(parse_pairing("Easy:hard"), (None, True))
+        self.assertEqual(parse_pairing("intermediate:easy"), (False, None))
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_pairing("easy")
+
+
+if __name__ == "__main__":
+    unittest.main()
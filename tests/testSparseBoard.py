@@ -0,0 +1,79 @@
+import pickle
+import unittest
+from core.board import Board, LineChecker
+from core.sparseboard import SparseBoard, SparseLineChecker
+from games.connect4 import ConnectFour
+from tests.helpers import fill_random
+
+
+class TestSparseBoard(unittest.TestCase):
+    def test_getters_match_board_on_random_positions(self):
+        for seed in range(30):
+            board, sparse = Board(6, 7), SparseBoard(6, 7)
+            fill_random([board, sparse], 6, 7, ["r", "y"], seed)
+            self.assertEqual(sparse.view(), board.view())
+            self.assertEqual(sparse.get_columns(), board.get_columns())
+            self.assertEqual(sparse.get_diagonals(4, "left"), board.get_diagonals(4, "left"))
+            self.assertEqual(sparse.codes(), board.codes())
+            self.assertEqual(sparse.get_row_segment(3, 1, 3), board.get_row_segment(3, 1, 3))
+
+    def test_line_checker_matches_connect_four_checker(self):
+        for seed in range(200):
+            board, sparse = Board(6, 7), SparseBoard(6, 7)
+            fill_random([board, sparse], 6, 7, ["r", "y"], seed)
+            expected_checker = ConnectFour.ConnectFourWinChecker(board)
+            sparse_checker = SparseLineChecker(sparse, 4)
+            self.assertEqual(sparse_checker._check_for_winner(), expected_checker._check_for_winner())
+            self.assertEqual(sparse_checker.get_win_info(), expected_checker.get_win_info())
+
+    def test_find_line_matches_winning_lines_order(self):
+        for seed in range(100):
+            board, sparse = Board(8, 8), SparseBoard(8, 8)
+            fill_random([board, sparse], 8, 8, ["x", "o"], seed)
+            for length in (3, 5):
+                expected = LineChecker(board, length)._check_winning_lines(length, "row", "column", "right_diagonal", "left_diagonal")
+                self.assertEqual(sparse.find_line(length), expected)
+
+    def test_large_board_stores_only_stones(self):
+        board = SparseBoard(1000, 1000)
+        checker = LineChecker(board, 5)
+        for n in range(5):
+            board.push(500 + n, 200 - n, "x")
+            board.push(10, n * 2, "o")
+        self.assertEqual(len(board.stones()), 10)
+        self.assertEqual(board.bounding_box(), (10, 0, 504, 200))
+        self.assertEqual(checker.check_from_move(502, 198), {"marker": "x", "type": "left_diagonal", "row": 500, "column": 200})
+        self.assertIsNone(checker.check_from_move(10, 4))
+        self.assertEqual(board.find_line(5), ("x", "left_diagonal", 500, 200))
+        board.pop()
+        board.pop()
+        self.assertEqual(board.bounding_box(), (10, 0, 503, 200))
+        self.assertIsNone(board.find_line(5))
+
+    def test_candidate_moves(self):
+        board = SparseBoard(15, 15)
+        board.add_to_square(0, 0, "x")
+        self.assertEqual(board.candidate_moves(), [(0, 1), (1, 0), (1, 1)])
+        board.add_to_square(1, 1, "o")
+        self.assertEqual(len(board.candidate_moves()), 7) # every square around (1, 1) except the stone at (0, 0)
+        board.update_square(0, 0, 0)
+        self.assertEqual(len(board.candidate_moves()), 8)
+
+    def test_hash_copy_and_pickle(self):
+        first, second = SparseBoard(100, 100), SparseBoard(100, 100)
+        first.add_to_square(5, 5, "x")
+        first.add_to_square(6, 6, "o")
+        second.add_to_square(6, 6, "o")
+        second.add_to_square(5, 5, "x")
+        self.assertEqual(first.hash, second.hash)
+        self.assertNotEqual(first.hash, 0)
+        board_copy = first.copy()
+        board_copy.add_to_square(0, 0, "x")
+        self.assertFalse(first.square_is_occupied(0, 0))
+        restored = pickle.loads(pickle.dumps(first))
+        self.assertEqual(restored.stones(), first.stones())
+        self.assertEqual(restored.hash, first.hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
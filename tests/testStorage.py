@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from importlib.util import find_spec
+from random import Random
+from core.board import Board, batch_win_info, packed_size, palette_indices, unpack_indices
+from core.bitboard import BitBoard
+from core.storage import PositionReader, PositionWriter
+
+
+def random_board(rng, rows=6, columns=7, markers="ry"):
+    board = Board(rows, columns)
+    for _ in range(rng.randint(0, rows * columns)):
+        board.add_to_square(rng.randrange(rows), rng.randrange(columns), rng.choice(markers))
+    return board
+
+
+class TestPackedBoard(unittest.TestCase):
+    def test_round_trip(self):
+        rng = Random(1)
+        for _ in range(100):
+            board = random_board(rng)
+            data = board.to_bytes(("r", "y"))
+            self.assertEqual(len(data), packed_size(6, 7))
+            restored = Board.from_bytes(data, 6, 7, ("r", "y"))
+            self.assertEqual(restored.view(), board.view())
+            self.assertEqual(restored.hash, board.hash)
+            self.assertEqual(BitBoard.from_bytes(data, 6, 7, ("r", "y")).view(), board.view())
+
+    def test_packing_layout(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "x")
+        board.add_to_square(0, 1, "o")
+        board.add_to_square(2, 2, "o")
+        self.assertEqual(board.to_bytes(("x", "o")), bytes([0b1001, 0, 0b10]))
+        self.assertEqual(palette_indices(board.codes(), ("x", "o")), bytes([1, 2, 0, 0, 0, 0, 0, 0, 2]))
+        self.assertEqual(unpack_indices(board.to_bytes(("x", "o")))[:9], palette_indices(board.codes(), ("x", "o")))
+
+    def test_invalid_palette_and_data(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 0, "x")
+        with self.assertRaises(ValueError):
+            board.to_bytes(("r", "y"))
+        with self.assertRaises(ValueError):
+            board.to_bytes(("x", "o", "r", "y"))
+        with self.assertRaises(ValueError):
+            Board.from_bytes(b"\x00\x00", 3, 3, ("x", "o"))
+        with self.assertRaises(ValueError):
+            Board.from_bytes(b"\x03\x00\x00", 3, 3, ("x", "o"))
+
+
+class TestPositionFile(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".pos")
+        os.close(handle)
+        rng = Random(2)
+        self.boards = [random_board(rng) for _ in range(50)]
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_write_and_random_access(self):
+        with PositionWriter(self.path, 6, 7, ("r", "y"), payload_size=1) as writer:
+            for index, board in enumerate(self.boards):
+                self.assertEqual(writer.write(board, bytes([index])), index)
+        with PositionReader(self.path) as reader:
+            self.assertEqual(len(reader), 50)
+            self.assertEqual(reader.record_size, packed_size(6, 7) + 1)
+            for index in (0, 17, 49, -1):
+                self.assertEqual(reader[index].view(), self.boards[index].view())
+                self.assertEqual(reader.payload(index), bytes([index % 50]))
+            with self.assertRaises(IndexError):
+                reader[50]
+            self.assertEqual([board.view() for board in reader], [board.view() for board in self.boards])
+
+    def test_append(self):
+        with PositionWriter(self.path, 6, 7, ("r", "y")) as writer:
+            writer.write_many(self.boards[:20])
+        with PositionWriter(self.path, 6, 7, ("r", "y"), append=True) as writer:
+            self.assertEqual(writer.count, 20)
+            writer.write_many(self.boards[20:])
+        with PositionReader(self.path) as reader:
+            self.assertEqual(len(reader), 50)
+            self.assertEqual(reader[20].view(), self.boards[20].view())
+        with self.assertRaises(ValueError):
+            PositionWriter(self.path, 3, 3, ("x", "o"), append=True)
+
+    def test_wrong_board_size_and_file(self):
+        with PositionWriter(self.path, 6, 7, ("r", "y")) as writer:
+            with self.assertRaises(ValueError):
+                writer.write(Board(3, 3))
+        with open(self.path, "wb") as file:
+            file.write(b"not a position file")
+        with self.assertRaises(ValueError):
+            PositionReader(self.path)
+
+    @unittest.skipUnless(find_spec("numpy"), "NumPy is not installed")
+    def test_as_array_matches_boards(self):
+        with PositionWriter(self.path, 6, 7, ("r", "y")) as writer:
+            writer.write_many(self.boards)
+        with PositionReader(self.path) as reader:
+            codes = reader.as_array()
+            self.assertEqual(codes.shape, (50, 6, 7))
+            self.assertEqual(batch_win_info(codes, 4), batch_win_info(self.boards, 4))
+            self.assertEqual(reader.as_array(10, 12).shape, (2, 6, 7))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import random
+import tempfile
+import unittest
+from importlib.util import find_spec
+from itertools import product
+from unittest import mock
+from core.board import Board
+from games import tablebase, tictactoe_table
+from games.tictactoe import TicTacToe
+from tests.helpers import board_from_cells
+
+
+class TestPositionIndex(unittest.TestCase):
+    def test_perfect_hash_of_legal_positions(self):
+        offsets = tablebase.layer_offsets(9)
+        indices = set()
+        for cells in product(range(3), repeat=9):
+            if cells.count(1) - cells.count(2) in (0, 1):
+                first = sum(1 << square for square, value in enumerate(cells) if value == 1)
+                second = sum(1 << square for square, value in enumerate(cells) if value == 2)
+                indices.add(tablebase.position_index(first, second, 9, offsets))
+        self.assertEqual(indices, set(range(offsets[-1])))
+
+    def test_unreachable_marker_counts(self):
+        offsets = tablebase.layer_offsets(9)
+        with self.assertRaises(ValueError):
+            tablebase.position_index(0, 0b1, 9, offsets)
+        with self.assertRaises(ValueError):
+            tablebase.position_index(0b111, 0, 9, offsets)
+
+
+@unittest.skipUnless(find_spec("numpy"), "NumPy is not installed")
+class TestTablebase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = tablebase.write_tablebase(3, 3, 3, os.path.join(cls.directory.name, "3x3.tb"))
+        cls.positions = tablebase.Tablebase(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.positions.close()
+        cls.directory.cleanup()
+
+    def test_agrees_with_minimax_table(self):
+        for cells, (score, _) in tictactoe_table.load_table().items():
+            board = board_from_cells(cells, 3)
+            _, optimal_moves = tictactoe_table.lookup(board)
+            self.assertEqual(self.positions.best_moves(board), optimal_moves)
+            result, distance = self.positions.probe(board)
+            remaining = cells.count(0) - distance + 1
+            self.assertEqual(score, {"draw": 0, "win": remaining, "loss": -remaining}[result])
+
+    def test_probe(self):
+        board = Board(3, 3)
+        self.assertEqual(self.positions.probe(board), ("draw", 0))
+        for row, column, marker in [(0, 0, "o"), (1, 1, "x"), (0, 1, "o"), (2, 2, "x")]:
+            board.add_to_square(row, column, marker)
+        self.assertEqual(self.positions.probe(board, "o", "x"), ("win", 1))
+        self.assertEqual(self.positions.best_moves(board, "o", "x"), [(0, 2)])
+        board.add_to_square(0, 2, "o")
+        self.assertEqual(self.positions.probe(board, "o", "x"), ("loss", 0))
+        self.assertEqual(self.positions.best_moves(board, "o", "x"), [])
+
+    def test_file_checks(self):
+        self.assertEqual(os.path.getsize(self.path), 8 + 11 * 8 + tablebase.layer_offsets(9)[-1])
+        with self.assertRaises(ValueError):
+            self.positions.probe(Board(4, 4))
+        broken = os.path.join(self.directory.name, "broken.tb")
+        with open(self.path, "rb") as source, open(broken, "wb") as target:
+            target.write(source.read()[:-1])
+        with self.assertRaises(ValueError):
+            tablebase.Tablebase(broken)
+
+    def test_open_tablebase_finds_a_file_generated_later(self):
+        with mock.patch.object(tablebase, "DATA_DIRECTORY", self.directory.name), \
+                mock.patch.dict(tablebase._opened, clear=True):
+            self.assertIsNone(tablebase.open_tablebase(2, 2, 2))
+            tablebase.write_tablebase(2, 2, 2, tablebase.tablebase_path(2, 2, 2))
+            positions = tablebase.open_tablebase(2, 2, 2)
+            self.assertIsNotNone(positions)
+            self.assertIs(tablebase.open_tablebase(2, 2, 2), positions)
+            positions.close()
+
+    def test_hard_mode_plays_from_the_tablebase(self):
+        path = tablebase.write_tablebase(3, 3, 2, os.path.join(self.directory.name, "k2.tb"))
+        with tablebase.Tablebase(path) as positions, \
+                mock.patch.object(tablebase, "open_tablebase", return_value=positions) as opened:
+            random.seed(1)
+            game = TicTacToe(win_value=2)
+            game.create_ai_player(name="CPU", difficulty=True)
+            game.go_first = False
+            for _ in range(3):
+                row, column = game.players[1].move(game.board)
+                self.assertIn((row, column), positions.best_moves(game.board, "o", "x"))
+                game.make_move(row, column, "o")
+                if game.check_winner():
+                    break
+                game.make_move(*next((r, c) for r in range(3) for c in range(3)
+                                     if not game.board.square_is_occupied(r, c)), "x")
+            self.assertEqual(game.get_winner_info()["marker"], "o")
+            opened.assert_called_with(3, 3, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
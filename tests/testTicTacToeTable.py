@@ -0,0 +1,63 @@
+import os
+import random
+import tempfile
+import unittest
+from core.board import Board
+from games import tictactoe_table
+from games.tictactoe import TicTacToe
+
+
+class TestTicTacToeTable(unittest.TestCase):
+    def test_table_covers_every_canonical_position(self):
+        table = tictactoe_table.load_table()
+        self.assertEqual(len(table), 765)
+        self.assertEqual(table[bytes(9)], (0, 0b111111111)) # Every opening move draws with perfect play
+
+    def test_file_matches_solver(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+            self.assertEqual(tictactoe_table.write_table(path), 765)
+            self.assertEqual(tictactoe_table.load_table(path), tictactoe_table.solve())
+        self.assertEqual(tictactoe_table.load_table(), tictactoe_table.solve())
+
+    def test_lookup_maps_moves_back_to_the_board(self):
+        board = Board(3, 3)
+        board.add_to_square(0, 2, "x")
+        self.assertEqual(tictactoe_table.lookup(board), (0, [(1, 1)]))
+        board.add_to_square(1, 1, "o")
+        board.add_to_square(2, 0, "x")
+        score, moves = tictactoe_table.lookup(board)
+        self.assertEqual(score, 0)
+        self.assertEqual(moves, [(0, 1), (1, 0), (1, 2), (2, 1)]) # A corner loses to a fork
+
+    def test_lookup_finds_wins_and_blocks(self):
+        board = Board(3, 3)
+        for row, column, marker in [(0, 0, "o"), (1, 1, "x"), (0, 1, "o"), (2, 2, "x")]:
+            board.add_to_square(row, column, marker)
+        # The second marker moved first here, so the markers are passed in order of play
+        self.assertEqual(tictactoe_table.lookup(board, "o", "x"), (5, [(0, 2)]))
+        board.add_to_square(1, 0, "o")
+        score, moves = tictactoe_table.lookup(board, "o", "x")
+        self.assertLess(score, 0)
+        self.assertIn((0, 2), moves)
+
+    def test_hard_mode_never_loses(self):
+        random.seed(7)
+        for other in (None, False, True):
+            game = TicTacToe()
+            game.add_ai_players_for_testing(True, other)
+            for _ in range(100):
+                for turn in range(game.board_size):
+                    player = game.players[turn % 2] if game.go_first else game.players[turn % 2 - 1]
+                    row, column = player.move(game.board)
+                    game.make_move(row, column, player.marker)
+                    if game.check_winner():
+                        break
+                game.update_winner_info()
+                game.update_players_stats()
+                game.reset_game_state()
+            self.assertEqual(game.players[0].lost_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import random
+import unittest
+from games import tictactoe_table
+from games.tictactoe import TicTacToe
+from games.tracing import DecisionTracer
+
+
+def play_games(game, number_of_games):
+    moves = []
+    for _ in range(number_of_games):
+        for turn in range(game.board_size):
+            player = game.players[turn % 2] if game.go_first else game.players[turn % 2 - 1]
+            row, column = player.move(game.board)
+            moves.append((row, column))
+            game.make_move(row, column, player.marker)
+            if game.check_winner():
+                break
+        game.reset_game_state()
+    return moves
+
+
+class TestDecisionTracer(unittest.TestCase):
+    def setUp(self):
+        self.game = TicTacToe()
+        self.game.add_ai_players_for_testing(False, True)
+
+    def test_records_branch_latency_and_candidates(self):
+        tracer = DecisionTracer()
+        tracer.attach(self.game.players[1])
+        self.game.go_first = False
+        row, column = self.game.players[1].move(self.game.board)
+        decision = tracer.decisions[-1]
+        self.assertEqual((decision.branch, decision.move, decision.round_count), ("table_move", (row, column), 0))
+        self.assertEqual(len(decision.candidates), 9) # Every opening move draws
+        self.assertEqual([name for name, _ in decision.branch_seconds], ["table_move"])
+        self.assertGreaterEqual(decision.seconds, decision.branch_seconds[0][1])
+
+    def test_candidates_are_taken_before_the_move_is_played(self):
+        tracer = DecisionTracer()
+        tracer.attach(self.game.players[1])
+        self.game.make_move(0, 0, "x")
+        self.game.players[1].move(self.game.board)
+        _, optimal_moves = tictactoe_table.lookup(self.game.board)
+        self.assertEqual(tracer.decisions[-1].candidates, tuple(optimal_moves))
+
+    def test_candidates_follow_the_traced_marker(self):
+        tracer = DecisionTracer()
+        tracer.attach(self.game.players[0])
+        for row, column, marker in [(0, 0, "x"), (2, 0, "o"), (0, 1, "x"), (2, 1, "o")]:
+            self.game.make_move(row, column, marker)
+        self.assertEqual(self.game.players[0].move(self.game.board), (0, 2))
+        decision = tracer.decisions[-1]
+        self.assertEqual((decision.marker, decision.branch, decision.candidates), ("x", "win_or_block", ((0, 2),)))
+
+    def test_ring_buffer_callback_and_summary(self):
+        received = []
+        tracer = DecisionTracer(capacity=10, callback=received.append)
+        for player in self.game.players:
+            tracer.attach(player)
+        random.seed(3)
+        moves = play_games(self.game, 10)
+        self.assertEqual(len(received), len(moves))
+        self.assertEqual(list(tracer.decisions), received[-10:])
+        self.assertEqual(sum(tracer.branch_counts().values()), 10)
+        for stats in tracer.summary().values():
+            self.assertGreater(stats.count, 0)
+            self.assertLessEqual(stats.mean_seconds, stats.max_seconds)
+
+    def test_tracing_does_not_change_play(self):
+        random.seed(5)
+        untraced = play_games(self.game, 20)
+        with DecisionTracer() as tracer:
+            for player in self.game.players:
+                tracer.attach(player)
+            random.seed(5)
+            self.game.go_first = True
+            traced = play_games(self.game, 20)
+        self.assertEqual(traced, untraced)
+
+    def test_detach_removes_every_wrapper(self):
+        player = self.game.players[1]
+        tracer = DecisionTracer()
+        tracer.attach(player)
+        with self.assertRaises(ValueError):
+            tracer.attach(player)
+        tracer.detach(player)
+        self.assertFalse(set(vars(player)) & {"move", *TicTacToe.AIPlayer.TRACED_BRANCHES})
+        player.move(self.game.board)
+        self.assertEqual(len(tracer.decisions), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
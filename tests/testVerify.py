@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+from games import tictactoe as tictactoe_module
+from games.tictactoe import TicTacToe
+from games.verify import ScriptedChoices, all_choices, scripted_random, verify_hard_mode
+
+
+class TestVerify(unittest.TestCase):
+    def test_all_choices_covers_every_branch(self):
+        def pick():
+            first = tictactoe_module.choice("ab")
+            if first == "a":
+                return first, tictactoe_module.randint(1, 3)
+            return first, tictactoe_module.choice("xy")
+        self.assertEqual(all_choices(pick), {("a", 1), ("a", 2), ("a", 3), ("b", "x"), ("b", "y")})
+
+    def test_scripted_random_restores_the_module(self):
+        original = tictactoe_module.choice
+        with scripted_random(ScriptedChoices((2,))):
+            self.assertEqual(tictactoe_module.choice([4, 5, 6]), 6)
+        self.assertIs(tictactoe_module.choice, original)
+
+    def test_hard_mode_never_loses(self):
+        result = verify_hard_mode(workers=1)
+        self.assertEqual(result.losing_lines, [])
+        self.assertGreater(result.positions, 0)
+
+    def test_losing_lines_are_reported(self):
+        def first_empty_square(player, board):
+            return next((row, column) for row in range(3) for column in range(3)
+                        if not board.square_is_occupied(row, column))
+        with mock.patch.object(TicTacToe.AIPlayer, "move", first_empty_square):
+            result = verify_hard_mode(workers=1)
+        self.assertTrue(result.losing_lines)
+        for line in result.losing_lines:
+            self.assertEqual(line[-1][2], "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,9 +11,9 @@ from itertools import chain
 from time import sleep
 from utils.clitools.console import clear_screen, delay_effect
 from utils.game_options import GameOptions
-from utils.strings import connect4_strings, other_strings, solitaire_strings, tictactoe_strings
+from utils.strings import connect4_strings, other_strings, qubic_strings, solitaire_strings, tictactoe_strings
 from utils.square import Square
-from typing import Union
+from typing import Optional, Union
 
 # ==== For enhanced effects, like ASCII string centering and box display of game information ===
 def surround_string(strings: list[str], border_symbol: str="|", offset: int = 0) -> list[str]:
@@ -86,15 +86,18 @@ def print_board(game_board: list[list[Union[int, str]]], game_name: str, delay_r
 
     Args:
         game_board: A 2D list representing the current state of the game board.
-        game_name: The name of the game ('TicTacToe' or 'Connect4').
+        game_name: The name of the game ('TicTacToe', 'Connect4' or 'Qubic').
         delay_rate: The delay rate for the print effect. Defaults to 0.000175.
     
     Raises:
-        ValueError: If `game_name` is not 'TicTacToe' or 'Connect4'.
+        ValueError: If `game_name` is not 'TicTacToe', 'Connect4' or 'Qubic'.
     """
-    if game_name not in {'TicTacToe', 'Connect4'}:
-        raise ValueError("Invalid game argument passed. Must be 'TicTacToe' or 'Connect4'.")
-    
+    if game_name not in {'TicTacToe', 'Connect4', 'Qubic'}:
+        raise ValueError("Invalid game argument passed. Must be 'TicTacToe', 'Connect4' or 'Qubic'.")
+    if game_name == 'Qubic': # The four layers of the cube are too wide for the ASCII art squares
+        delay_effect([create_qubic_board(layers=game_board)], delay=delay_rate, word_flush=False)
+        return
+
     translated_board = board_translator(game_board=game_board) # Get 2D `Square` Enum board for typewritter printing
     
     if game_name == 'TicTacToe':
@@ -108,6 +111,32 @@ def print_board(game_board: list[list[Union[int, str]]], game_name: str, delay_r
         print(connect4_strings["boardlabels"])
 
 
+def create_qubic_board(layers: list[list[list[Union[int, str]]]], gap: str = "     ") -> str:
+    """Returns a formatted string of the four layers of a Qubic cube printed side by side, each as a small labelled grid.
+
+    Args:
+        layers: A 3D list of layers, rows and square values of the cube.
+        gap: The space between two layers. Defaults to five spaces.
+
+    Returns:
+        A formatted string of the cube with layer, row and column labels.
+    """
+    marker_mapping = {0: " ", "x": "X", "o": "O"}
+    size = len(layers)
+    separator = "   " + "+".join(["---"] * size)
+    column_labels = "   " + " ".join(f" {column + 1} " for column in range(size))
+    layer_width = len(column_labels)
+    lines = [gap.join(f"Layer {layer + 1}".center(layer_width) for layer in range(size)),
+             gap.join([column_labels] * size)]
+    for row in range(size):
+        if row > 0:
+            lines.append(gap.join([separator.ljust(layer_width)] * size))
+        lines.append(gap.join(f" {row + 1} " + "|".join(f" {marker_mapping[value]} " for value in layer[row])
+                              for layer in layers))
+    terminal_width = shutil.get_terminal_size().columns
+    return "\n" + center_display_string(list_of_strings=lines, terminal_width=terminal_width) + "\n"
+
+
 def create_row(row: list[list[Square]], border_symbol: str, centre: bool = False) -> str:
     """Returns a formatted string of a single game board row.
 
@@ -187,7 +216,7 @@ def print_board_with_spacing(game_board: list[list[Union[int, str]]], top_spacin
 
 # ==== Functions for game messaging ====
 def print_winner_info(name: str, marker: str, win_type: str, win_index: int, border_symbol: str="#", offset: int=9, 
-                      delay: float=0.00075, word_flush=False) -> None:
+                      delay: float=0.00075, word_flush=False, win_location: Optional[str]=None) -> None:
     """Displays the winner's information based on saved attributes from the `Game` object. Displays message for draw game with no winner.
 
     Args:
@@ -199,6 +228,7 @@ def print_winner_info(name: str, marker: str, win_type: str, win_index: int, bor
         offset: The padding for the message box. Defaults to 9.
         delay: The delay rate for the print effect. Defaults to 0.00075.
         word_flush: A boolean to control word flushing for typewriter effecdt.
+        win_location: Optional description of the winning line used instead of the win type, such as for the lines of a Qubic cube.
     """
     if all(info is None for info in (name, marker, win_type)): # Attributes are all None in draw game, since attributes only update when winner is found
         draw_string = "\nCATS GAME.\n There was no winner so there will be no chicken dinner.\n"
@@ -211,7 +241,7 @@ def print_winner_info(name: str, marker: str, win_type: str, win_index: int, bor
             "right_diagonal": "the right diagonal.",
             "left_diagonal": "the left diagonal."
         }
-        winner_string = f"{winner_string} {win_type_dict[win_type]}\n"
+        winner_string = f"{winner_string} {win_location + '.' if win_location else win_type_dict[win_type]}\n"
         delay_effect(surround_string(strings=[winner_string], border_symbol=border_symbol, offset=offset), delay=delay, word_flush=word_flush)
 
 
@@ -244,16 +274,18 @@ def print_player_turn_prompt(name: str, game_name: str, delay_rate: float=0.015)
 
     Args:
         name: The name of the current player.
-        game_name: The name of the game ('TicTacToe' or 'Connect4').
+        game_name: The name of the game ('TicTacToe', 'Connect4' or 'Qubic').
         delay_rate: The speed of the typewriter effect. Defaults to 0.015.
 
     Raises:
-        ValueError: If `game_name` is not 'TicTacToe' or 'Connect4'.
+        ValueError: If `game_name` is not 'TicTacToe', 'Connect4' or 'Qubic'.
     """
-    if game_name not in {'TicTacToe', 'Connect4'}:
-        raise ValueError("Invalid game argument passed. Must be 'TicTacToe' or 'Connect4'.")
+    if game_name not in {'TicTacToe', 'Connect4', 'Qubic'}:
+        raise ValueError("Invalid game argument passed. Must be 'TicTacToe', 'Connect4' or 'Qubic'.")
     if game_name == 'TicTacToe':
         turn_prompt = f"\nIt is {name}'s turn. Select a row and column\n"
+    elif game_name == 'Qubic':
+        turn_prompt = f"\nIt is {name}'s turn. Select a layer, row and column\n"
     elif game_name == 'Connect4':
         turn_prompt = f"\nIt is {name}'s turn. Select the column you want to drop your piece in.\n"
     delay_effect(strings=[turn_prompt], delay=delay_rate)
@@ -277,14 +309,16 @@ def print_square_occupied_prompt(name: str) -> None:
     print("\nThe square is already occupied. Select another square.")
     delay_effect([f"\nIt is {name}'s turn again. Select a free square.\n"])
 
-def print_current_move(name: str, row: int, column: int) -> None:
+def print_current_move(name: str, row: int, column: int, layer: Optional[int] = None) -> None:
     """Prints the last move made by the current player.
 
     Args:
         name: The name of the current player.
+        layer: The layer of the move for Qubic. Defaults to None for the 2D games.
     """
+    in_layer = f" of layer {layer + 1}" if layer is not None else ""
     delay_effect([
-        f"\n{name} played the square in row {row + 1} and column {column + 1}.\n"
+        f"\n{name} played the square in row {row + 1} and column {column + 1}{in_layer}.\n"
     ])
 
 def print_game_over(winner_mark: str) -> None:
@@ -321,7 +355,8 @@ def print_menu_screen(delay: float=0.025) -> None:
     MENU_OPTIONS = {
         GameOptions.TIC_TAC_TOE.value: "Tic Tac Toe", # game_option "1"
         GameOptions.CONNECT_FOUR.value: "Connect 4",  # game_option "2"
-        GameOptions.SOLITAIRE.value: "Solitaire"      # game_option "3"
+        GameOptions.SOLITAIRE.value: "Solitaire",     # game_option "3"
+        GameOptions.QUBIC.value: "Qubic (3D Tic Tac Toe)" # game_option "4"
     }
     # ==== For displaying properly indented game options ====
     menu_text = "Welcome to Simple Games.\n\n"
@@ -339,17 +374,19 @@ def print_start_game_message(game_name: str) -> None:
     """Prints the welcome and introduction message for a specific game.
 
     Args:
-        game_name: The name of the game ('TicTacToe', 'Connect4', or 'Solitaire').
+        game_name: The name of the game ('TicTacToe', 'Connect4', 'Qubic' or 'Solitaire').
     
     Raises:
-        ValueError: If `game_name` is not one of 'TicTacToe', 'Connect4', or 'Solitaire'.
+        ValueError: If `game_name` is not one of 'TicTacToe', 'Connect4', 'Qubic' or 'Solitaire'.
     """
-    if game_name not in {'TicTacToe', 'Connect4', 'Solitaire'}:
-        raise ValueError("Invalid game argument passed. Must be 'TicTacToe' or 'Connect4' or 'Solitaire'.")
+    if game_name not in {'TicTacToe', 'Connect4', 'Qubic', 'Solitaire'}:
+        raise ValueError("Invalid game argument passed. Must be 'TicTacToe' or 'Connect4' or 'Qubic' or 'Solitaire'.")
     if game_name == 'TicTacToe':
         string_dict = tictactoe_strings
     elif game_name == 'Connect4':
         string_dict = connect4_strings
+    elif game_name == 'Qubic':
+        string_dict = qubic_strings
     else:
         string_dict = solitaire_strings
     print(string_dict["welcome"])
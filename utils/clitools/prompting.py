@@ -39,7 +39,7 @@ def menu_select(valid_selections: GameOptions, load_message: bool=True) -> GameO
     while True:
         print(blank_space_prompt + prompt, end="")
         choice = input().strip()
-        if choice in valid_selections: # from game_options ENUM - only allows 1, 2, or 3 - stored as strings, so int type casting not needed.
+        if choice in valid_selections: # from game_options ENUM - only allows 1, 2, 3 or 4 - stored as strings, so int type casting not needed.
             break
         print('\n' + blank_space_prompt, end="") # for cursor location management 
         print()
@@ -103,23 +103,25 @@ def select_difficulty_level(game_name: str) -> Optional[bool]:
     This function offers different difficulty options based on the game and returns a boolean value representing the selected level.
 
     Args:
-        game_name: The name of the game ('TicTacToe' or 'Connect4').
+        game_name: The name of the game ('TicTacToe', 'Connect4' or 'Qubic').
 
     Returns:
         True for 'impossible' mode, False for 'normal' mode, and None for 'blind' mode.
     
     Raises:
-        ValueError: If `game_name` is not 'TicTacToe' or 'Connect4'.
+        ValueError: If `game_name` is not 'TicTacToe', 'Connect4' or 'Qubic'.
     """
-    if game_name not in {'TicTacToe', 'Connect4'}:
-        raise ValueError("Invalid game argument passed. Must be 'TicTacToe' or 'Connect4'.")
-    # Tic Tac Toe has three AI levels and Connect 4 only two (for now)
+    if game_name not in {'TicTacToe', 'Connect4', 'Qubic'}:
+        raise ValueError("Invalid game argument passed. Must be 'TicTacToe', 'Connect4' or 'Qubic'.")
+    # Tic Tac Toe and Qubic have three AI levels and Connect 4 only two (for now)
     if game_name == "TicTacToe":
         difficulty_choices = "\nSelect the level of difficult for the AI: 1) Blind, 2) Normal, 3) Impossible: "
+    elif game_name == "Qubic": # The Qubic search is strong but not perfect, so its top level is not called impossible
+        difficulty_choices = "\nSelect the level of difficult for the AI: 1) Blind, 2) Normal, 3) Hard: "
     else:
         difficulty_choices = "\nSelect the level of difficult for the AI: 1) Blind or 2) Normal: "
     # Allow for user to input number or name of difficulty level
-    valid_input = ['1', 'blind', '2', 'normal', '3', 'impossible'] # Use string slices for the 3 valid selections
+    valid_input = ['1', 'blind', '2', 'normal', '3', 'impossible', 'hard'] # Use string slices for the 3 valid selections
     while True:
         level_of_difficulty = input(difficulty_choices).lower() 
         if level_of_difficulty in valid_input[:2]:
@@ -181,21 +183,28 @@ def get_valid_int(prompt: str, valid_input: set, error_message: str) -> int:
         except ValueError:
             print("\nYou must enter a number. Try again.\n")
 
-def prompt_move(game_name: str, valid_input_range: int) -> Union[tuple[int, int], int]:
+def prompt_move(game_name: str, valid_input_range: int) -> Union[tuple[int, int, int], tuple[int, int], int]:
     """Gets a valid move from the player based on the game.
 
-    This function prompts the user for the necessary inputs, either a row and column for Tic-Tac-Toe, or a single column for Connect 4, 
-    and validates it using the `get_validated_int_input` helper function.
+    This function prompts the user for the necessary inputs, either a layer, row and column for Qubic, a row and column for Tic-Tac-Toe, 
+    or a single column for Connect 4, and validates it using the `get_validated_int_input` helper function.
 
     Args:
-        game_name: The name of the game ('TicTacToe' or 'Connect4').
+        game_name: The name of the game ('TicTacToe', 'Connect4' or 'Qubic').
         valid_input_range: The maximum value for the column number.
 
     Returns:
+        If `game_name` is 'Qubic', returns a tuple containing the 0-based layer, row and column indices.
         If `game_name` is 'TicTacToe', returns a tuple containing the 0-based row and column indices. 
-        If `game_name` is not 'TicTacToe', returns a single integer representing the 0-based column index.
+        Otherwise, returns a single integer representing the 0-based column index.
     """
     valid_input = {i + 1 for i in range(valid_input_range)}
+    if game_name == 'Qubic':
+        error_message = f"You must enter a number from 1 to {valid_input_range} only."
+        layer = get_valid_int(prompt="Enter the layer: ", valid_input=valid_input, error_message=error_message)
+        row = get_valid_int(prompt="Enter the row: ", valid_input=valid_input, error_message=error_message)
+        column = get_valid_int(prompt="Enter the column: ", valid_input=valid_input, error_message=error_message)
+        return layer, row, column
     if game_name == 'TicTacToe':
         error_message = f"You must enter a number from 1 to {valid_input_range} only."
         row = get_valid_int(prompt="Enter the row: ", valid_input=valid_input, error_message=error_message)
@@ -4,6 +4,7 @@ class GameOptions(Enum):
     TIC_TAC_TOE = "1"
     CONNECT_FOUR = "2"
     SOLITAIRE = "3"
+    QUBIC = "4"
 
     @classmethod
     def values(cls):
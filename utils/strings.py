@@ -3,7 +3,7 @@ string.py
 Author: Robert Pal
 Updated: 2025-08-01
 
-This module contains all user-facing string messages for the games Tic Tac Toe, Connect 4 and Solitaire used in the Command Line Application. 
+This module contains all user-facing string messages for the games Tic Tac Toe, Connect 4, Solitaire and Qubic used in the Command Line Application. 
 The strings are stored as constants and used for displaying information or states of game play, including board configurations. All strings are 
 for display directly to the user in game play for each game.
 """
@@ -55,6 +55,28 @@ WELCOME_CONNECT4 = """
    *                                                                         *
    * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
 """
+# A large ASCII art banner displayed at the start of the Qubic game.
+WELCOME_QUBIC = """
+   * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+   *                                                                         *
+   *                                                                         *
+   *     *       *   * * *   *       * * *    *  *      *   *     * * *      *
+   *      *  *  *    * *     *      *        *    *    *  *  *    * *        *
+   *       *   *     * * *   * * *   * * *    *  *    *       *   * * *      *
+   *                                                                         *
+   *                                                                         *
+   *      * * *   *  *                                                       *
+   *        *    *    *                                                      *
+   *        *     *  *                                                       *
+   *                                                                         *
+   *                                                                         *
+   *                  *  *      *    *    * *     *     * * *                *
+   *                *    *     *    *    * * *    *    *                     *
+   *                  *  * *     *  *     * *     *     * * *                *
+   *                                                                         *
+   *                                                                         *
+   * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+"""
 # A large ASCII art banner displayed at the start of the Solitaire game.
 WELCOME_SOLITAIRE = """
    * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
@@ -181,7 +203,7 @@ YELLOWWINS = [
 ]
 # ==== Game Play Message Strings ====
 # Menu start options lising all available games for play
-SIMPLE_GAMES_START = "Welcome to Simple Games.\n\n1. Tic Tac Toe\n2. Connect 4\n3. Solitaire"
+SIMPLE_GAMES_START = "Welcome to Simple Games.\n\n1. Tic Tac Toe\n2. Connect 4\n3. Solitaire\n4. Qubic"
 
 # Introduction and basic game flow for Tic Tac Toe
 INTRO_TICTACTOE = """
@@ -199,6 +221,12 @@ THIS GAME IS STILL IN DEVELOPMENT. YOU MAY ENCOUNTER BUGS OR ERRORS WHILE PLAYIN
 This is an online version of the classic game Klondike Solitaire. Play a single game. 
 You can play single draw or three draw solitaire.
 """
+# Introduction and basic game flow for Qubic
+INTRO_QUBIC = """
+This is an online version of 3D Tic Tac Toe played on four stacked 4x4 layers. Get four
+in a row along a row, column, pillar or any diagonal, including through the layers.
+Play multiple games per session against an opponent or the computer. X starts the game.
+"""
 # Message for simulating computer thinking of move selection
 THINKING = "\nComputer is now thinking."
 
@@ -242,6 +270,11 @@ connect4_strings = {
     "boardline": BOARDLINE_CONNECT4,
     "boardlabels": COL_NAMES_CONNECT4
 }
+# A collection of strings specific to the Qubic game.
+qubic_strings = {
+    "welcome": WELCOME_QUBIC,
+    "intro": INTRO_QUBIC,
+}
 # A collection of strings specific to the Solitaire game.
 solitaire_strings = {
     "welcome": WELCOME_SOLITAIRE,